@@ -0,0 +1,263 @@
+"""
+Latency and throughput benchmark for fraud scoring.
+
+    python -m benchmarks.inference
+    python -m benchmarks.inference --http-url
+    python -m benchmarks.inference --http-url http://fraud-host:3000
+
+Synthetic, schema-valid transactions are scored through FraudService in
+process and, with --http-url, over HTTP against a running `bentoml serve`
+(http://localhost:3000 unless a URL is given). Single-record predict and
+predict_batch are measured at each concurrency level. Results (p50/p95/p99
+latency, requests/sec and records/sec per scenario) are written as YAML
+so two runs can be compared with --compare.
+"""
+
+import argparse
+import asyncio
+import os
+import platform
+import subprocess
+import sys
+import time
+from datetime import datetime
+from typing import Awaitable, Callable, List
+
+import numpy as np
+
+from src.constants.benchmark import (
+    BENCHMARK_RESULTS_DIR,
+    BENCHMARK_SEED,
+    BENCHMARK_PROFILE_PATH,
+    BENCHMARK_CONCURRENCY_LEVELS,
+    BENCHMARK_BATCH_SIZES,
+    BENCHMARK_REQUESTS,
+    BENCHMARK_WARMUP_REQUESTS,
+    BENCHMARK_PERCENTILES,
+    BENCHMARK_HTTP_URL,
+)
+from src.constants.training_pipeline import SCHEMA_FILE_PATH
+from src.utils import read_yaml_file, write_yaml_file
+from benchmarks.synthetic import generate_transactions, load_profile, to_payloads
+
+
+# =========================
+# Targets
+# =========================
+class InProcessTarget:
+    """FraudService instantiated in this process (no HTTP, same code path)."""
+
+    name = "in_process"
+
+    async def __aenter__(self):
+        from service import FraudService
+
+        self.service = FraudService()
+        self.model_info = self.service.bundle.info()
+        return self
+
+    async def __aexit__(self, *exc):
+        self.service.reloader.stop()
+        return False
+
+    async def single(self, record: dict):
+        return await self.service.predict(record)
+
+    async def batch(self, records: List[dict]):
+        return await asyncio.to_thread(self.service.predict_batch, records)
+
+
+class HTTPTarget:
+    """A running BentoML server, called through bentoml.AsyncHTTPClient."""
+
+    name = "http"
+
+    def __init__(self, url: str):
+        self.url = url
+        self.model_info = {"url": url}
+
+    async def __aenter__(self):
+        import bentoml
+
+        self.client = bentoml.AsyncHTTPClient(self.url)
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.client.close()
+        return False
+
+    async def single(self, record: dict):
+        return await self.client.predict(input_data=record)
+
+    async def batch(self, records: List[dict]):
+        return await self.client.predict_batch(input_data=records)
+
+
+# =========================
+# Load generation
+# =========================
+def summarize(latencies: List[float], elapsed: float, records: int, errors: int) -> dict:
+    latencies_ms = np.asarray(latencies) * 1000
+    summary = {
+        f"p{p}_ms": round(float(np.percentile(latencies_ms, p)), 3) if len(latencies_ms) else None
+        for p in BENCHMARK_PERCENTILES
+    }
+    summary.update(
+        mean_ms=round(float(latencies_ms.mean()), 3) if len(latencies_ms) else None,
+        requests=len(latencies),
+        errors=errors,
+        requests_per_sec=round(len(latencies) / elapsed, 1) if elapsed else 0.0,
+        records_per_sec=round(records / elapsed, 1) if elapsed else 0.0,
+    )
+    return summary
+
+
+async def run_load(call: Callable[[object], Awaitable], payloads: list, concurrency: int, size: int = 1) -> dict:
+    """Sends every payload once from `concurrency` workers, timing each call."""
+    latencies, errors = [], 0
+    next_index = iter(range(len(payloads)))
+
+    async def worker():
+        nonlocal errors
+        for i in next_index:
+            start = time.perf_counter()
+            try:
+                await call(payloads[i])
+            except Exception:
+                errors += 1
+                continue
+            latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+
+    return summarize(latencies, elapsed, len(latencies) * size, errors)
+
+
+async def benchmark_target(target, records: List[dict], concurrency_levels: List[int], batch_sizes: List[int]) -> list:
+    results = []
+
+    async with target:
+        for _ in range(BENCHMARK_WARMUP_REQUESTS):
+            await target.single(records[0])
+
+        for batch_size in batch_sizes:
+            if batch_size == 1:
+                mode, call, payloads = "single", target.single, records
+            else:
+                mode, call = "batch", target.batch
+                payloads = [
+                    records[i:i + batch_size]
+                    for i in range(0, len(records) - batch_size + 1, batch_size)
+                ]
+            if not payloads:
+                continue
+
+            for concurrency in concurrency_levels:
+                summary = await run_load(call, payloads, concurrency, size=batch_size)
+                results.append({
+                    "target": target.name,
+                    "mode": mode,
+                    "batch_size": batch_size,
+                    "concurrency": concurrency,
+                    **summary,
+                })
+                print(
+                    f"{target.name:<10} {mode:<6} batch={batch_size:<4} c={concurrency:<3} "
+                    f"p50={summary['p50_ms']}ms p99={summary['p99_ms']}ms "
+                    f"{summary['records_per_sec']} rec/s"
+                )
+
+    return results, target.model_info
+
+
+# =========================
+# Reporting
+# =========================
+def run_info(args) -> dict:
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except Exception:
+        commit = None
+
+    return {
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "git_commit": commit,
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "cpu_count": os.cpu_count(),
+        "seed": args.seed,
+        "requests": args.requests,
+    }
+
+
+def scenario_key(result: dict) -> tuple:
+    return result["target"], result["mode"], result["batch_size"], result["concurrency"]
+
+
+def compare(base: dict, current: dict) -> None:
+    """Prints p99 and throughput change per scenario present in both runs."""
+    base_results = {scenario_key(r): r for r in base["results"]}
+
+    for result in current["results"]:
+        before = base_results.get(scenario_key(result))
+        if before is None or not before["p99_ms"] or not before["records_per_sec"]:
+            continue
+        print(
+            "{:<10} {:<6} batch={:<4} c={:<3} p99 {:+.1%}  throughput {:+.1%}".format(
+                *scenario_key(result),
+                result["p99_ms"] / before["p99_ms"] - 1,
+                result["records_per_sec"] / before["records_per_sec"] - 1,
+            )
+        )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark fraud scoring latency and throughput")
+    parser.add_argument(
+        "--http-url", nargs="?", const=BENCHMARK_HTTP_URL,
+        help=f"Also benchmark a running BentoML server (default URL {BENCHMARK_HTTP_URL})",
+    )
+    parser.add_argument("--no-in-process", action="store_true", help="Only benchmark over HTTP")
+    parser.add_argument("--requests", type=int, default=BENCHMARK_REQUESTS, help="Records per scenario")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=BENCHMARK_CONCURRENCY_LEVELS)
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=BENCHMARK_BATCH_SIZES)
+    parser.add_argument("--seed", type=int, default=BENCHMARK_SEED)
+    parser.add_argument("--output", help="Results YAML (default: benchmarks/results/inference_<time>.yaml)")
+    parser.add_argument("--compare", help="Earlier results YAML to compare against")
+    args = parser.parse_args(argv)
+
+    schema = read_yaml_file(SCHEMA_FILE_PATH)
+    records = to_payloads(
+        generate_transactions(args.requests, schema, args.seed, load_profile(BENCHMARK_PROFILE_PATH))
+    )
+
+    targets = [] if args.no_in_process else [InProcessTarget()]
+    if args.http_url:
+        targets.append(HTTPTarget(args.http_url))
+    if not targets:
+        parser.error("nothing to benchmark: pass --http-url or drop --no-in-process")
+
+    report = {"run": run_info(args), "targets": {}, "results": []}
+    for target in targets:
+        results, model_info = asyncio.run(
+            benchmark_target(target, records, args.concurrency, args.batch_sizes)
+        )
+        report["targets"][target.name] = model_info
+        report["results"].extend(results)
+
+    output = args.output or os.path.join(
+        BENCHMARK_RESULTS_DIR, f"inference_{datetime.now():%Y%m%d_%H%M%S}.yaml"
+    )
+    write_yaml_file(output, report, replace=True)
+    print(f"Results written to {output}")
+
+    if args.compare:
+        compare(read_yaml_file(args.compare), report)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,141 @@
+"""
+Training pipeline scale benchmark.
+
+    python -m benchmarks.pipeline_scale --sizes 10000 100000 1000000 10000000
+
+For each size a synthetic raw CSV matching schema.yaml is generated in
+chunks (and reused by later runs), then the full TrainingPipeline runs on
+it without the stage cache and without promoting to artifacts/latest.
+Each stage's time and peak memory come from the run's
+pipeline_profile.yaml. Between consecutive sizes, a stage's scaling
+exponent is log(time ratio) / log(row ratio): 1.0 is linear, and the
+first stage above the threshold (or the first failure) is reported as
+where scaling breaks down.
+"""
+
+import argparse
+import math
+import os
+import sys
+from datetime import datetime
+
+from src.constants.benchmark import (
+    BENCHMARK_RESULTS_DIR,
+    BENCHMARK_SEED,
+    BENCHMARK_DATA_DIR,
+    BENCHMARK_PIPELINE_SIZES,
+    BENCHMARK_GENERATION_CHUNK_ROWS,
+    BENCHMARK_SUPERLINEAR_EXPONENT,
+)
+from src.constants.training_pipeline import SCHEMA_FILE_PATH, TARGET_COLUMN
+from src.pipeline.training_pipeline import TrainingPipeline
+from src.utils import DataFrameChunkWriter, read_yaml_file, write_yaml_file
+from benchmarks.synthetic import generate_transactions, label_transactions
+
+
+def write_raw_data(file_path: str, n_rows: int, schema_config: dict, seed: int) -> str:
+    if os.path.exists(file_path):
+        return file_path
+
+    tmp_path = f"{file_path}.tmp.csv"
+    with DataFrameChunkWriter(tmp_path) as writer:
+        for i, start in enumerate(range(0, n_rows, BENCHMARK_GENERATION_CHUNK_ROWS)):
+            size = min(BENCHMARK_GENERATION_CHUNK_ROWS, n_rows - start)
+            chunk = generate_transactions(size, schema_config, seed + i, start_id=start)
+            chunk[TARGET_COLUMN] = label_transactions(chunk, seed + i)
+            writer.write(chunk)
+
+    os.replace(tmp_path, file_path)
+    return file_path
+
+
+def scaling_exponents(runs: list) -> list:
+    """Per stage time exponent between each pair of consecutive completed sizes."""
+    steps = []
+    for before, after in zip(runs, runs[1:]):
+        row_ratio = after["rows"] / before["rows"]
+        exponents = {}
+        for stage, result in after["stages"].items():
+            base = before["stages"].get(stage)
+            if not base or result["status"] != "completed" or base["wall_seconds"] <= 0:
+                continue
+            exponents[stage] = round(
+                math.log(max(result["wall_seconds"], 1e-3) / base["wall_seconds"]) / math.log(row_ratio), 2
+            )
+        steps.append({"from_rows": before["rows"], "to_rows": after["rows"], "exponents": exponents})
+    return steps
+
+
+def first_bottleneck(runs: list, steps: list):
+    for run in runs:
+        failed = [stage for stage, result in run["stages"].items() if result["status"] != "completed"]
+        if run["status"] != "completed":
+            return {"rows": run["rows"], "stage": failed[0] if failed else None, "reason": run["status"]}
+
+        step = next((s for s in steps if s["to_rows"] == run["rows"]), None)
+        if step:
+            worst = max(step["exponents"].items(), key=lambda item: item[1], default=None)
+            if worst and worst[1] > BENCHMARK_SUPERLINEAR_EXPONENT:
+                return {"rows": run["rows"], "stage": worst[0], "reason": f"time exponent {worst[1]}"}
+    return None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Profile the training pipeline at increasing data sizes")
+    parser.add_argument("--sizes", type=int, nargs="+", default=BENCHMARK_PIPELINE_SIZES)
+    parser.add_argument("--seed", type=int, default=BENCHMARK_SEED)
+    parser.add_argument("--trace-memory", action="store_true", help="Also record tracemalloc peaks")
+    parser.add_argument("--cprofile", action="store_true", help="cProfile every stage")
+    parser.add_argument("--keep-going", action="store_true", help="Run larger sizes after a failure")
+    parser.add_argument("--output", help="Results YAML (default: benchmarks/results/pipeline_scale_<time>.yaml)")
+    args = parser.parse_args(argv)
+
+    schema = read_yaml_file(SCHEMA_FILE_PATH)
+    stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    runs = []
+
+    for n_rows in sorted(args.sizes):
+        raw_path = write_raw_data(
+            os.path.join(BENCHMARK_DATA_DIR, f"transactions_{n_rows}.csv"), n_rows, schema, args.seed
+        )
+
+        pipeline = TrainingPipeline(
+            raw_data_path=raw_path,
+            timestamp=f"scale_{n_rows}_{stamp}",
+            promote=False,
+            # Measure real work, not cache hits
+            use_cache=False,
+            trace_memory=args.trace_memory,
+            cprofile=args.cprofile,
+        )
+        try:
+            pipeline.run_pipeline()
+            status = "completed"
+        except Exception as e:
+            status = f"failed: {str(e).splitlines()[0] if str(e) else type(e).__name__}"
+
+        report = pipeline.profiler.report()
+        runs.append({"rows": n_rows, "status": status, **report})
+
+        print(f"{n_rows:>10} rows  {status:<12} total {report['total_wall_seconds']}s")
+        for stage, result in report["stages"].items():
+            print(f"{'':>12}{stage:<22} {result['wall_seconds']:>9}s  {result['peak_rss_mb']:>9} MB")
+
+        if status != "completed" and not args.keep_going:
+            break
+
+    steps = scaling_exponents([run for run in runs if run["status"] == "completed"])
+    bottleneck = first_bottleneck(runs, steps)
+
+    output = args.output or os.path.join(BENCHMARK_RESULTS_DIR, f"pipeline_scale_{stamp}.yaml")
+    write_yaml_file(
+        output,
+        {"runs": runs, "scaling": steps, "first_bottleneck": bottleneck},
+        replace=True,
+    )
+    print(f"First stage to stop scaling: {bottleneck}")
+    print(f"Results written to {output}")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
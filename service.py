@@ -1,42 +1,99 @@
-import bentoml
-import pandas as pd
-
-# 1. Load model reference (metadata only)
-model_ref = bentoml.sklearn.get("fraud_detector:latest")
+import asyncio
+import json
 
-THRESHOLD = model_ref.info.metadata.get("threshold", 0.15)
+import bentoml
+from bentoml.exceptions import InvalidArgument
 
-# 🔒 Ensure target is NEVER in features
-FEATURES = [
-    col for col in model_ref.info.metadata["features"]
-    if col != "Is Fraudulent"
-]
+from src.constants.serving import (
+    MODEL_TAG,
+    SERVING_MAX_BATCH_SIZE,
+    SERVING_MAX_LATENCY_MS,
+    SERVING_RELOAD_ENABLED,
+    SERVING_RELOAD_POLL_SECONDS,
+)
+from src.serving.batching import AdaptiveBatcher
+from src.serving.model import ModelBundle, ModelReloader
 
 @bentoml.service(
     name="fraud_detection_service",
     traffic={"timeout": 60}
 )
 class FraudService:
-    bento_model = model_ref
+    # Version packaged with the bento (sklearn or compact format); newer
+    # versions in the model store are picked up by the reloader
+    bento_model = bentoml.models.get(MODEL_TAG)
 
     def __init__(self):
-        self.model = self.bento_model.load_model()
+        # Model, threshold, layout and validator swap together as one bundle
+        self.reloader = ModelReloader(
+            MODEL_TAG,
+            ModelBundle.load(self.bento_model),
+            poll_seconds=SERVING_RELOAD_POLL_SECONDS,
+        )
+        if SERVING_RELOAD_ENABLED:
+            self.reloader.start()
+
+        # Concurrent single predict calls are scored together
+        self.batcher = AdaptiveBatcher(
+            self._score_batch,
+            max_batch_size=SERVING_MAX_BATCH_SIZE,
+            max_latency_ms=SERVING_MAX_LATENCY_MS,
+        )
+
+    @property
+    def bundle(self) -> ModelBundle:
+        return self.reloader.current
+
+    def _score_batch(self, items: list) -> list:
+        # Items are (bundle, record): each request is scored by the model
+        # version it was validated against, even across a swap
+        results = [None] * len(items)
+        groups = {}
+        for i, (bundle, record) in enumerate(items):
+            groups.setdefault(id(bundle), (bundle, []))[1].append(i)
+
+        for bundle, indices in groups.values():
+            scores = bundle.score([items[i][1] for i in indices])
+            for i, score in zip(indices, scores):
+                results[i] = score
+
+        return results
 
     @bentoml.api
-    def predict(self, input_data: dict) -> dict:
-        df = pd.DataFrame([input_data])
+    async def predict(self, input_data: dict) -> dict:
+        bundle = self.bundle
+
+        errors = bundle.request_validator.validate(input_data)
+        if errors:
+            raise InvalidArgument(json.dumps({"errors": errors}))
+
+        return await self.batcher.submit((bundle, input_data))
+
+    @bentoml.api(
+        batchable=True,
+        max_batch_size=SERVING_MAX_BATCH_SIZE,
+        max_latency_ms=SERVING_MAX_LATENCY_MS,
+    )
+    def predict_batch(self, input_data: list[dict]) -> list[dict]:
+        bundle = self.bundle
+        errors = bundle.request_validator.validate_batch(input_data)
 
-        # 🛡️ Defensive: drop target if it ever appears
-        df = df.drop(columns=["Is Fraudulent"], errors="ignore")
+        # Invalid records get their errors in place of a score
+        valid = [record for record, e in zip(input_data, errors) if not e]
+        scores = iter(bundle.score(valid) if valid else [])
 
-        # Align to training feature space
-        df = df.reindex(columns=FEATURES, fill_value=0)
+        return [{"errors": e} if e else next(scores) for e in errors]
 
-        prob = self.model.predict_proba(df)[:, 1][0]
-        prediction = int(prob >= THRESHOLD)
+    @bentoml.api
+    def version(self) -> dict:
+        return self.reloader.status()
+
+    @bentoml.api
+    async def reload(self) -> dict:
+        # Load + warm off the event loop; in-flight requests keep their bundle
+        swapped = await asyncio.to_thread(self.reloader.check)
+        return {"reloaded": swapped, **self.reloader.status()}
 
-        return {
-            "fraud_probability": float(prob),
-            "threshold": THRESHOLD,
-            "is_fraud": prediction
-        }
+    @bentoml.on_shutdown
+    def stop_reloader(self):
+        self.reloader.stop()
@@ -1,45 +1,109 @@
 import os
 import sys
+import numpy as np
 import pandas as pd
 from sklearn.model_selection import train_test_split
 
 from src.logger import logger
 from src.exception import CustomException
 from src.constants import data_ingestion
+from src.constants.training_pipeline import SCHEMA_FILE_PATH
 from src.entity.artifact_entity import DataIngestionArtifact
 from src.entity.config_entity import DataIngestionConfig
+from src.utils import (
+    read_yaml_file,
+    get_raw_dtypes,
+    read_dataframe,
+    write_dataframe,
+    iter_dataframe_chunks,
+    DataFrameChunkWriter,
+)
+
+
+def hash_split_mask(keys: pd.Series, test_ratio: float, seed: int) -> np.ndarray:
+    """
+    Deterministic test-set membership per row.
+
+    The key is hashed and mixed with the seed (splitmix64 finaliser), so a
+    row lands in the same split no matter how the file is chunked.
+    """
+    x = pd.util.hash_pandas_object(keys, index=False).to_numpy(dtype=np.uint64)
+    x = x + np.uint64((seed * 0x9E3779B97F4A7C15) & 0xFFFFFFFFFFFFFFFF)
+    x ^= x >> np.uint64(30)
+    x *= np.uint64(0xBF58476D1CE4E5B9)
+    x ^= x >> np.uint64(27)
+    x *= np.uint64(0x94D049BB133111EB)
+    x ^= x >> np.uint64(31)
+
+    return (x % np.uint64(10_000)) < int(test_ratio * 10_000)
 
 
 class DataIngestion:
     def __init__(self, data_ingestion_config: DataIngestionConfig):
         try:
             self.config = data_ingestion_config
+            # Raw text: typing (and rejecting bad cells) is data validation's job
+            self.raw_dtypes = get_raw_dtypes(read_yaml_file(SCHEMA_FILE_PATH))
         except Exception as e:
             raise CustomException(e, sys)
 
+    def split_in_memory(self):
+        # 1. Read raw data
+        logger.info(f"Reading raw data from: {self.config.raw_data_path}")
+        df = read_dataframe(self.config.raw_data_path, dtypes=self.raw_dtypes)
+
+        # 2. Train-test split
+        logger.info(f"Performing train-test split with test size: {data_ingestion.DATA_INGESTION_TRAIN_TEST_SPLIT_RATIO} and random state: {data_ingestion.DATA_INGESTION_RANDOM_STATE}")
+        train_df, test_df = train_test_split(
+            df,
+            test_size=data_ingestion.DATA_INGESTION_TRAIN_TEST_SPLIT_RATIO,
+            random_state=data_ingestion.DATA_INGESTION_RANDOM_STATE
+        )
+
+        # 3. Save outputs
+        logger.info(f"Saving train and test datasets to artifact directory {self.config.data_ingestion_dir}")
+        write_dataframe(train_df, self.config.train_file_path)
+        write_dataframe(test_df, self.config.test_file_path)
+
+    def split_streaming(self):
+        logger.info(
+            f"Streaming raw data from: {self.config.raw_data_path} "
+            f"in chunks of {data_ingestion.DATA_INGESTION_CHUNK_SIZE} rows, "
+            f"hash split on '{data_ingestion.DATA_INGESTION_SPLIT_KEY}'"
+        )
+
+        chunks = iter_dataframe_chunks(
+            self.config.raw_data_path,
+            chunk_size=data_ingestion.DATA_INGESTION_CHUNK_SIZE,
+            dtypes=self.raw_dtypes,
+        )
+
+        with DataFrameChunkWriter(self.config.train_file_path) as train_writer, \
+                DataFrameChunkWriter(self.config.test_file_path) as test_writer:
+            for chunk in chunks:
+                is_test = hash_split_mask(
+                    chunk[data_ingestion.DATA_INGESTION_SPLIT_KEY],
+                    test_ratio=data_ingestion.DATA_INGESTION_TRAIN_TEST_SPLIT_RATIO,
+                    seed=data_ingestion.DATA_INGESTION_RANDOM_STATE,
+                )
+                train_writer.write(chunk[~is_test])
+                test_writer.write(chunk[is_test])
+
+        logger.info(
+            f"Streamed {train_writer.rows_written} train rows and "
+            f"{test_writer.rows_written} test rows"
+        )
+
     def initiate_data_ingestion(self) -> DataIngestionArtifact:
         logger.info("Starting data ingestion process")
 
         try:
-            # 1. Read raw data
-            logger.info(f"Reading raw data from: {self.config.raw_data_path}")
-            df = pd.read_csv(self.config.raw_data_path)
-
-            # 2. Create artifact directory
             os.makedirs(self.config.data_ingestion_dir, exist_ok=True)
 
-            # 3. Train-test split
-            logger.info(f"Performing train-test split with test size: {data_ingestion.DATA_INGESTION_TRAIN_TEST_SPLIT_RATIO} and random state: {data_ingestion.DATA_INGESTION_RANDOM_STATE}")
-            train_df, test_df = train_test_split(
-                df,
-                test_size=data_ingestion.DATA_INGESTION_TRAIN_TEST_SPLIT_RATIO,
-                random_state=data_ingestion.DATA_INGESTION_RANDOM_STATE
-            )
-
-            # 4. Save outputs
-            logger.info(f"Saving train and test datasets to artifact directory {self.config.data_ingestion_dir}")
-            train_df.to_csv(self.config.train_file_path, index=False)
-            test_df.to_csv(self.config.test_file_path, index=False)
+            if data_ingestion.DATA_INGESTION_STREAMING:
+                self.split_streaming()
+            else:
+                self.split_in_memory()
 
             logger.info("Data ingestion completed successfully")
 
@@ -1,13 +1,16 @@
 import os
 import sys
-import numpy as np
 import pandas as pd
 import pickle
 from src.logger import logger
 from src.exception import CustomException
-from src.constants.training_pipeline import TARGET_COLUMN
+from src.constants.training_pipeline import TARGET_COLUMN, SCHEMA_FILE_PATH
+from src.features.engineering import FeatureEngineer
+from src.features.matrix import FeatureMatrix, downcast_frame
+from src.features.velocity import VelocityEngine, VelocityStore
 from src.entity.artifact_entity import DataValidationArtifact, DataTransformationArtifact
 from src.entity.config_entity import DataTransformationConfig
+from src.utils import read_yaml_file, get_schema_dtypes, read_dataframe
 
 
 class DataTransformation:
@@ -18,79 +21,77 @@ class DataTransformation:
     ):
         self.validation_artifact = data_validation_artifact
         self.config = data_transformation_config
-
-    @staticmethod
-    def log_transform(series: pd.Series) -> pd.Series:
-        return np.log1p(series)
+        self.feature_engineer = FeatureEngineer()
 
     def engineer_features(self, df: pd.DataFrame) -> pd.DataFrame:
         logger.info("Starting feature engineering")
 
-        # -------------------------
-        # DROP COLUMNS (EDA driven)
-        # -------------------------
-        drop_cols = [
-            "Transaction ID",
-            "Customer ID",
-            "Transaction Date",
-            "Customer Location",
-            "IP Address",
-            "Shipping Address",
-            "Billing Address",
-        ]
-        df = df.drop(columns=drop_cols, errors="ignore")
-
-        # -------------------------
-        # FILTER AGE
-        # -------------------------
-        df = df[df["Customer Age"] >= 18]
-
-        # -------------------------
-        # LOG TRANSFORM
-        # -------------------------
-        df["Log_Transaction_Amount"] = self.log_transform(df["Transaction Amount"])
-
-        # -------------------------
-        # FEATURE ENGINEERING
-        # -------------------------
-        df["New_Account"] = (df["Account Age Days"] <= 30).astype(int)
-        df["Early_Txn"] = df["Transaction Hour"].between(0, 5).astype(int)
-
-        df["Age_Amount_Risk"] = (
-            df["Customer Age"] * df["Log_Transaction_Amount"]
-        )
-
-        # -------------------------
-        # ORDINAL ENCODING
-        # -------------------------
-        df["Quantity"] = df["Quantity"].astype(int)
-
-        # -------------------------
-        # ONE HOT ENCODING
-        # -------------------------
-        cat_cols = ["Device Used", "Product Category", "Payment Method"]
-        df = pd.get_dummies(df, columns=cat_cols, drop_first=True)
-
-        # -------------------------
-        # DROP ORIGINAL AMOUNT
-        # -------------------------
-
-        return df
+        # Shared with serving so both paths compute identical features
+        return self.feature_engineer.transform_frame(df)
+
+    def add_velocity_features(self, train_df: pd.DataFrame, test_df: pd.DataFrame):
+        """
+        Backfills customer / IP velocity features over train and test together.
+
+        Both splits are one transaction history, so they are replayed in a
+        single pass sorted by time; each row only sees earlier transactions.
+        The window state at the end of the history is saved as the serving
+        store seed.
+        """
+        logger.info("Backfilling velocity features")
+
+        engine = VelocityEngine()
+        features = engine.backfill(pd.concat([train_df, test_df], ignore_index=True))
+
+        train_df = train_df.copy()
+        test_df = test_df.copy()
+        train_df[engine.feature_names] = features[:len(train_df)]
+        test_df[engine.feature_names] = features[len(train_df):]
+
+        if os.path.exists(self.config.velocity_store_path):
+            os.remove(self.config.velocity_store_path)
+        store = VelocityStore(self.config.velocity_store_path)
+        try:
+            keys = engine.save(store)
+        finally:
+            store.close()
+        logger.info(f"Velocity store seeded with {keys} active keys")
+
+        return train_df, test_df
 
     def initiate_data_transformation(self) -> DataTransformationArtifact:
         try:
             logger.info("Starting data transformation phase")
 
-            train_df = pd.read_csv(self.validation_artifact.valid_train_file_path)
-            test_df = pd.read_csv(self.validation_artifact.valid_test_file_path)
+            schema_dtypes = get_schema_dtypes(read_yaml_file(SCHEMA_FILE_PATH))
+            train_df = read_dataframe(self.validation_artifact.valid_train_file_path, dtypes=schema_dtypes)
+            test_df = read_dataframe(self.validation_artifact.valid_test_file_path, dtypes=schema_dtypes)
 
-            train_df = self.engineer_features(train_df)
-            test_df = self.engineer_features(test_df)
+            # Category vocabularies are learned on train only
+            self.feature_engineer.fit(train_df)
 
             os.makedirs(self.config.data_transformation_dir, exist_ok=True)
 
-            train_df.to_csv(self.config.transformed_train_path, index=False)
-            test_df.to_csv(self.config.transformed_test_path, index=False)
+            train_df, test_df = self.add_velocity_features(train_df, test_df)
+
+            # Smallest dtype per column (uint8 flags, int16 small ints, float32)
+            train_df = downcast_frame(self.engineer_features(train_df))
+            test_df = downcast_frame(self.engineer_features(test_df))
+
+            feature_columns = [col for col in train_df.columns if col != TARGET_COLUMN]
+            matrices = [
+                FeatureMatrix.save(
+                    df, feature_columns, TARGET_COLUMN, matrix_path, target_path
+                )
+                for df, matrix_path, target_path in [
+                    (train_df, self.config.train_matrix_path, self.config.train_target_path),
+                    (test_df, self.config.test_matrix_path, self.config.test_target_path),
+                ]
+            ]
+            logger.info(
+                f"Feature matrices: {[f'{m.nbytes() / 2**20:.1f} MB' for m in matrices]} "
+                f"(train {train_df.shape}, test {test_df.shape})"
+            )
 
             # Save feature engineering metadata (for inference parity)
             with open(self.config.preprocessing_object_path, "wb") as f:
@@ -98,6 +99,8 @@ class DataTransformation:
                     {
                         "columns": train_df.columns.tolist(),
                         "target": TARGET_COLUMN,
+                        "encoder": self.feature_engineer.encoder.to_dict(),
+                        "frequency": self.feature_engineer.frequency.to_dict(),
                     },
                     f,
                 )
@@ -106,9 +109,12 @@ class DataTransformation:
             logger.info(f"Transformed columns: {train_df.columns.tolist()} and target: {TARGET_COLUMN}")
 
             return DataTransformationArtifact(
-                transformed_train_path=self.config.transformed_train_path,
-                transformed_test_path=self.config.transformed_test_path,
                 preprocessing_object_path=self.config.preprocessing_object_path,
+                velocity_store_path=self.config.velocity_store_path,
+                train_matrix_path=self.config.train_matrix_path,
+                train_target_path=self.config.train_target_path,
+                test_matrix_path=self.config.test_matrix_path,
+                test_target_path=self.config.test_target_path,
             )
 
         except Exception as e:
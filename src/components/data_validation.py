@@ -1,17 +1,32 @@
 import os
 import sys
 import pandas as pd
-from scipy.stats import ks_2samp
 
 from src.exception import CustomException
 from src.logger import logging
 from src.constants import training_pipeline
+from src.constants.data_validation import (
+    DRIFT_P_VALUE_THRESHOLD,
+    DATA_VALIDATION_STREAMING,
+    DATA_VALIDATION_CHUNK_SIZE,
+)
 from src.entity.artifact_entity import (
     DataIngestionArtifact,
     DataValidationArtifact,
 )
 from src.entity.config_entity import DataValidationConfig
-from src.utils import read_yaml_file, write_yaml_file
+from src.validation.drift import DriftDetector
+from src.validation.profile import ReferenceProfile
+from src.validation.schema import SchemaValidator
+from src.utils import (
+    read_yaml_file,
+    write_yaml_file,
+    get_schema_dtypes,
+    get_raw_dtypes,
+    read_dataframe,
+    write_dataframe,
+    iter_dataframe_chunks,
+)
 
 
 class DataValidation:
@@ -24,14 +39,17 @@ class DataValidation:
             self.data_ingestion_artifact = data_ingestion_artifact
             self.data_validation_config = data_validation_config
             self.schema_config = read_yaml_file(training_pipeline.SCHEMA_FILE_PATH)
+            self.schema_dtypes = get_schema_dtypes(self.schema_config)
+            # Raw text: SchemaValidator coerces it and types the valid rows
+            self.read_dtypes = get_raw_dtypes(self.schema_config)
+            self.schema_validator = SchemaValidator(self.schema_config)
         except Exception as e:
             logging.error(f"Error in DataValidation init: {e}")
             raise CustomException(e, sys)
 
-    @staticmethod
-    def read_data(file_path: str) -> pd.DataFrame:
+    def read_data(self, file_path: str) -> pd.DataFrame:
         try:
-            return pd.read_csv(file_path)
+            return read_dataframe(file_path, dtypes=self.read_dtypes)
         except Exception as e:
             raise CustomException(e, sys)
 
@@ -45,24 +63,13 @@ class DataValidation:
         return schema_columns == dataframe_columns
 
     def detect_dataset_drift(
-        self, base_df: pd.DataFrame, current_df: pd.DataFrame, threshold=0.03
+        self, base_df: pd.DataFrame, current_df: pd.DataFrame, threshold=DRIFT_P_VALUE_THRESHOLD
     ) -> bool:
-        status = True
-        report = {}
         logging.info("Detecting dataset drift...")
-        for column in base_df.columns:
-            d1 = base_df[column]
-            d2 = current_df[column]
-
-            ks_result = ks_2samp(d1, d2)
-
-            drift_detected = bool(ks_result.pvalue < threshold)
-            if drift_detected:
-                status = False
-            report[column] = {
-                "p_value": float(ks_result.pvalue),
-                "drift_detected": drift_detected
-            }
+
+        # KS on numerical, chi-square/PSI on categorical, identifiers skipped
+        detector = DriftDetector(self.schema_config, threshold=threshold)
+        status, report = detector.detect(base_df, current_df)
 
 
         os.makedirs(os.path.dirname(self.data_validation_config.drift_report_file_path), exist_ok=True)
@@ -73,46 +80,113 @@ class DataValidation:
 
         return status
 
+    def save_reference_profile(self, train_df: pd.DataFrame) -> str:
+        logging.info("Saving reference profile of accepted training data...")
+        profile = ReferenceProfile.from_dataframe(train_df, self.schema_config)
+        profile.save(self.data_validation_config.reference_profile_file_path)
+        return self.data_validation_config.reference_profile_file_path
+
+    def validate_rows(self, file_path: str, valid_file_path: str, invalid_file_path: str) -> dict:
+        """
+        Schema enforcement: splits rows into valid and invalid files and
+        returns per-rule violation counts.
+        """
+        logging.info(f"Enforcing schema on {file_path}")
+
+        if DATA_VALIDATION_STREAMING:
+            chunks = iter_dataframe_chunks(
+                file_path, DATA_VALIDATION_CHUNK_SIZE, dtypes=self.read_dtypes
+            )
+            return self.schema_validator.validate_chunks(
+                chunks, valid_file_path, invalid_file_path
+            )
+
+        df = self.read_data(file_path)
+
+        if not self.validate_schema(df):
+            return {
+                "missing_columns": self.schema_validator.missing_columns(df),
+                "valid_rows": 0,
+                "invalid_rows": 0,
+                "violations": {},
+            }
+
+        valid_df, invalid_df, counts = self.schema_validator.validate(df)
+        write_dataframe(valid_df, valid_file_path)
+        write_dataframe(invalid_df, invalid_file_path)
+
+        return {
+            "missing_columns": [],
+            "valid_rows": len(valid_df),
+            "invalid_rows": len(invalid_df),
+            "violations": counts,
+        }
+
     def initiate_data_validation(self) -> DataValidationArtifact:
         try:
-            train_path = self.data_ingestion_artifact.train_file_path
-            test_path = self.data_ingestion_artifact.test_file_path
-
-            train_df = self.read_data(train_path)
-            test_df = self.read_data(test_path)
+            config = self.data_validation_config
+
+            # 1. Row-level schema enforcement
+            schema_report = {
+                "train": self.validate_rows(
+                    self.data_ingestion_artifact.train_file_path,
+                    config.valid_train_file_path,
+                    config.invalid_train_file_path,
+                ),
+                "test": self.validate_rows(
+                    self.data_ingestion_artifact.test_file_path,
+                    config.valid_test_file_path,
+                    config.invalid_test_file_path,
+                ),
+            }
+            write_yaml_file(config.schema_report_file_path, schema_report)
 
-            schema_valid = self.validate_schema(train_df) and self.validate_schema(test_df)
+            for split, result in schema_report.items():
+                logging.info(
+                    f"{split}: {result['valid_rows']} valid rows, "
+                    f"{result['invalid_rows']} invalid rows, "
+                    f"missing columns: {result['missing_columns']}"
+                )
 
-            drift_status = self.detect_dataset_drift(train_df, test_df)
+            schema_valid = not any(
+                result["missing_columns"] for result in schema_report.values()
+            )
 
-            validation_status = schema_valid and drift_status
+            # 2. Drift on the valid rows
+            validation_status = schema_valid
+            reference_profile = None
 
-            if validation_status:
-                os.makedirs(os.path.dirname(self.data_validation_config.valid_train_file_path), exist_ok=True)
-                train_df.to_csv(self.data_validation_config.valid_train_file_path, index=False)
-                test_df.to_csv(self.data_validation_config.valid_test_file_path, index=False)
+            if schema_valid:
+                # Only the columns drift and the profile look at
+                drift_columns = (
+                    self.schema_config["numerical_columns"]
+                    + self.schema_config["categorical_columns"]
+                )
+                train_df = read_dataframe(
+                    config.valid_train_file_path, dtypes=self.schema_dtypes, columns=drift_columns
+                )
+                test_df = read_dataframe(
+                    config.valid_test_file_path, dtypes=self.schema_dtypes, columns=drift_columns
+                )
 
-                invalid_train = None
-                invalid_test = None
-            else:
-                os.makedirs(os.path.dirname(self.data_validation_config.invalid_train_file_path), exist_ok=True)
-                train_df.to_csv(self.data_validation_config.invalid_train_file_path, index=False)
-                test_df.to_csv(self.data_validation_config.invalid_test_file_path, index=False)
+                validation_status = self.detect_dataset_drift(train_df, test_df)
 
-                invalid_train = self.data_validation_config.invalid_train_file_path
-                invalid_test = self.data_validation_config.invalid_test_file_path
+                if validation_status:
+                    reference_profile = self.save_reference_profile(train_df)
 
             return DataValidationArtifact(
                 validation_status=validation_status,
-                valid_train_file_path=self.data_validation_config.valid_train_file_path
+                valid_train_file_path=config.valid_train_file_path
                 if validation_status
                 else None,
-                valid_test_file_path=self.data_validation_config.valid_test_file_path
+                valid_test_file_path=config.valid_test_file_path
                 if validation_status
                 else None,
-                invalid_train_file_path=invalid_train,
-                invalid_test_file_path=invalid_test,
-                drift_report_file_path=self.data_validation_config.drift_report_file_path,
+                invalid_train_file_path=config.invalid_train_file_path,
+                invalid_test_file_path=config.invalid_test_file_path,
+                drift_report_file_path=config.drift_report_file_path,
+                reference_profile_file_path=reference_profile,
+                schema_report_file_path=config.schema_report_file_path,
             )
 
         except Exception as e:
@@ -2,7 +2,7 @@ import os
 import sys
 import yaml
 import pickle
-import pandas as pd
+import numpy as np
 
 from sklearn.metrics import (
     fbeta_score,
@@ -15,8 +15,11 @@ from src.exception import CustomException
 from src.constants.model_evaluation import (
     MIN_F2_SCORE,
     MIN_RECALL,
-    MIN_PRECISION
+    MIN_PRECISION,
+    THRESHOLD_SWEEP_BETA,
+    THRESHOLD_CURVE_MAX_POINTS,
 )
+from src.constants.serving import DEFAULT_THRESHOLD
 from src.constants.training_pipeline import TARGET_COLUMN
 from src.entity.artifact_entity import (
     ModelTrainerArtifact,
@@ -24,6 +27,54 @@ from src.entity.artifact_entity import (
     ModelEvaluationArtifact
 )
 from src.entity.config_entity import ModelEvaluationConfig
+from src.features.matrix import FeatureMatrix
+
+
+def threshold_curve(y_true, probs, beta: float = THRESHOLD_SWEEP_BETA) -> dict:
+    """
+    Precision, recall and F-beta at every distinct probability threshold.
+
+    Probabilities are sorted once; cumulative true/false positive counts
+    then give the confusion matrix of every threshold in one vectorized
+    pass (prediction rule: prob >= threshold).
+    """
+    y_true = np.asarray(y_true)
+    probs = np.asarray(probs)
+
+    if probs.size == 0:
+        empty = np.empty(0, dtype=float)
+        return {"threshold": empty, "precision": empty, "recall": empty, "f_beta": empty}
+
+    order = np.argsort(-probs, kind="mergesort")
+    probs_sorted = probs[order]
+    y_sorted = y_true[order]
+
+    tp = np.cumsum(y_sorted)
+    fp = np.cumsum(1 - y_sorted)
+
+    # Last position of each run of equal probabilities
+    last = np.r_[np.flatnonzero(np.diff(probs_sorted)), len(probs_sorted) - 1]
+    tp, fp = tp[last], fp[last]
+
+    positives = max(int(y_true.sum()), 1)
+    precision = tp / (tp + fp)
+    recall = tp / positives
+
+    b2 = beta ** 2
+    denominator = b2 * precision + recall
+    f_beta = np.divide(
+        (1 + b2) * precision * recall,
+        denominator,
+        out=np.zeros_like(denominator, dtype=float),
+        where=denominator > 0,
+    )
+
+    return {
+        "threshold": probs_sorted[last],
+        "precision": precision,
+        "recall": recall,
+        "f_beta": f_beta,
+    }
 
 
 class ModelEvaluation:
@@ -37,6 +88,12 @@ class ModelEvaluation:
         self.data_transformation_artifact = data_transformation_artifact
         self.config = model_evaluation_config
 
+    @staticmethod
+    def downsample_curve(curve: dict, max_points: int = THRESHOLD_CURVE_MAX_POINTS) -> dict:
+        n_points = len(curve["threshold"])
+        keep = np.unique(np.linspace(0, n_points - 1, min(n_points, max_points)).astype(int))
+        return {name: values[keep].astype(float).tolist() for name, values in curve.items()}
+
     def initiate_model_evaluation(self) -> ModelEvaluationArtifact:
         try:
             logger.info("Starting model evaluation phase")
@@ -45,14 +102,30 @@ class ModelEvaluation:
             with open(self.model_trainer_artifact.trained_model_path, "rb") as f:
                 model = pickle.load(f)
 
-            # Load test data
-            test_df = pd.read_csv(self.data_transformation_artifact.transformed_test_path)
-            X_test = test_df.drop(columns=[TARGET_COLUMN])
-            y_test = test_df[TARGET_COLUMN]
-
-            # Predict using probability + tuned threshold
-            probs = model.predict_proba(X_test)[:, 1]
-            threshold = 0.15  # later load from artifact
+            # Load test data (memory-mapped float32 matrix, training column order)
+            with open(self.data_transformation_artifact.preprocessing_object_path, "rb") as f:
+                columns = [col for col in pickle.load(f)["columns"] if col != TARGET_COLUMN]
+
+            X_test, y_test = FeatureMatrix(
+                self.data_transformation_artifact.test_matrix_path,
+                self.data_transformation_artifact.test_target_path,
+                tuple(columns),
+            ).load()
+
+            # Threshold tuned on out-of-fold train probabilities, so the
+            # guardrail metrics below come from a test split nothing was fitted on
+            y_train = np.load(self.data_transformation_artifact.train_target_path)
+            oof_probs = np.load(self.model_trainer_artifact.oof_probabilities_path)
+
+            curve = threshold_curve(y_train, oof_probs)
+            if len(curve["threshold"]) and y_train.sum() > 0:
+                best = int(np.argmax(curve["f_beta"]))
+                threshold = float(curve["threshold"][best])
+            else:
+                threshold = DEFAULT_THRESHOLD
+            logger.info(f"Best out-of-fold F{THRESHOLD_SWEEP_BETA} threshold: {threshold}")
+
+            probs = model.predict_proba(X_test.to_numpy())[:, 1]
             preds = (probs >= threshold).astype(int)
 
             # Metrics
@@ -76,6 +149,9 @@ class ModelEvaluation:
                 "recall": float(recall),
                 "precision": float(precision),
                 "accepted": is_accepted,
+                "best_threshold": threshold,
+                # Out-of-fold train curve the threshold was picked on
+                "threshold_curve": self.downsample_curve(curve),
             }
 
             with open(self.config.evaluation_report_path, "w") as f:
@@ -88,6 +164,7 @@ class ModelEvaluation:
                 is_model_accepted=is_accepted,
                 evaluated_metric=f2,
                 evaluation_report_path=self.config.evaluation_report_path,
+                best_threshold=threshold,
             )
 
         except Exception as e:
@@ -2,21 +2,25 @@ import os
 import sys
 import yaml
 import pickle
-import mlflow
-import pandas as pd
+import numpy as np
 
-from sklearn.linear_model import LogisticRegression
-from sklearn.ensemble import RandomForestClassifier
-from sklearn.preprocessing import StandardScaler
-from sklearn.pipeline import Pipeline
-from sklearn.metrics import f1_score, classification_report
-from imblearn.over_sampling import SMOTE
+from concurrent.futures import ProcessPoolExecutor
 
 from src.logger import logger
 from src.exception import CustomException
 from src.constants.training_pipeline import TARGET_COLUMN
+from src.constants.model_trainer import (
+    MODEL_TRAINER_N_JOBS,
+    MODEL_CACHE_DIR,
+    THRESHOLD_CV_FOLDS,
+    SEARCH_SCORING_BETA,
+)
 from src.entity.artifact_entity import DataTransformationArtifact, ModelTrainerArtifact
 from src.entity.config_entity import ModelTrainerConfig
+from src.features.matrix import FeatureMatrix
+from src.models.candidates import MODEL_CANDIDATES, fit_candidate, out_of_fold_probabilities
+from src.utils.cache import PickleCache, hash_file, hash_object
+from src.utils.tracking import get_tracker
 
 
 class ModelTrainer:
@@ -28,108 +32,163 @@ class ModelTrainer:
         self.transformation_artifact = data_transformation_artifact
         self.config = model_trainer_config
 
-    def load_data(self):
-        train_df = pd.read_csv(self.transformation_artifact.transformed_train_path)
-        test_df = pd.read_csv(self.transformation_artifact.transformed_test_path)
-
-        X_train = train_df.drop(columns=[TARGET_COLUMN])
-        y_train = train_df[TARGET_COLUMN]
-
-        X_test = test_df.drop(columns=[TARGET_COLUMN])
-        y_test = test_df[TARGET_COLUMN]
-
-        return X_train, X_test, y_train, y_test
-
-    def train_tree_model(self, X_train, X_test, y_train, y_test):
-        logger.info("Training RandomForest (tree model)")
-
-        model = RandomForestClassifier(
-            n_estimators=200,
-            max_depth=None,
-            random_state=42,
-            n_jobs=-1
-        )
-
-        model.fit(X_train, y_train)
-        preds = model.predict(X_test)
-        score = f1_score(y_test, preds)
-
-        return model, score
-
-    def train_linear_model(self, X_train, X_test, y_train, y_test):
-        logger.info("Training Logistic Regression (linear model)")
-
-        scaler = StandardScaler()
-        X_train_scaled = scaler.fit_transform(X_train)
-        X_test_scaled = scaler.transform(X_test)
-
-        smote = SMOTE(random_state=42)
-        X_train_bal, y_train_bal = smote.fit_resample(X_train_scaled, y_train)
-
-        model = LogisticRegression(max_iter=1000)
-        model.fit(X_train_bal, y_train_bal)
+    def load_feature_columns(self) -> list:
+        # Fixed encoder layout from the transformation stage (= serving order)
+        with open(self.transformation_artifact.preprocessing_object_path, "rb") as f:
+            preprocess_meta = pickle.load(f)
 
-        preds = model.predict(X_test_scaled)
-        score = f1_score(y_test, preds)
+        return [col for col in preprocess_meta["columns"] if col != TARGET_COLUMN]
 
-        return Pipeline([("scaler", scaler), ("model", model)]), score
+    def load_data(self):
+        """Handles on the float32 train/test matrices; workers memory-map them."""
+        feature_columns = self.load_feature_columns()
+        artifact = self.transformation_artifact
+
+        train = FeatureMatrix(artifact.train_matrix_path, artifact.train_target_path, tuple(feature_columns))
+        test = FeatureMatrix(artifact.test_matrix_path, artifact.test_target_path, tuple(feature_columns))
+
+        return train, test
+
+    def data_version(self) -> str:
+        # Content of the exact files the candidates are fitted/scored on
+        artifact = self.transformation_artifact
+        return hash_object([
+            hash_file(artifact.train_matrix_path),
+            hash_file(artifact.train_target_path),
+            hash_file(artifact.test_matrix_path),
+            hash_file(artifact.test_target_path),
+            self.load_feature_columns(),
+        ])
+
+    def train_candidates(self, train: FeatureMatrix, test: FeatureMatrix, data_version: str) -> dict:
+        """Fits every registered candidate, reusing cached fits when unchanged."""
+        cache = PickleCache(MODEL_CACHE_DIR)
+        results = {}
+        pending = {}
+
+        for name, candidate in MODEL_CANDIDATES.items():
+            key = candidate.cache_key(data_version)
+            cached = cache.get(key)
+            if cached is not None:
+                logger.info(f"{name}: cache hit ({key[:12]}), skipping fit")
+                results[name] = {**cached, "cache_hit": True}
+            else:
+                pending[name] = key
+
+        if pending:
+            workers = max(1, min(MODEL_TRAINER_N_JOBS, len(pending)))
+            logger.info(f"Training {list(pending)} in {workers} processes")
+
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                futures = {
+                    name: executor.submit(fit_candidate, name, train, test)
+                    for name in pending
+                }
+                for name, future in futures.items():
+                    result = future.result()
+                    cache.put(pending[name], result)
+                    results[name] = {**result, "cache_hit": False}
+                    logger.info(
+                        f"{name}: F1 {result['f1_score']:.4f}, F2 {result['f2_score']:.4f} in {result['fit_seconds']:.1f}s, "
+                        f"peak RSS {result['peak_rss_mb']} MB"
+                    )
+
+        return results
+
+    def out_of_fold_probabilities(self, name: str, train: FeatureMatrix, best_params: dict, data_version: str):
+        """Out-of-fold train probabilities of the selected candidate (cached like its fit)."""
+        cache = PickleCache(MODEL_CACHE_DIR)
+        key = hash_object([MODEL_CANDIDATES[name].cache_key(data_version), "oof", THRESHOLD_CV_FOLDS])
+
+        probabilities = cache.get(key)
+        if probabilities is None:
+            logger.info(f"{name}: {THRESHOLD_CV_FOLDS}-fold out-of-fold probabilities for threshold tuning")
+            probabilities = out_of_fold_probabilities(name, train, best_params)
+            cache.put(key, probabilities)
+        return probabilities
 
     def initiate_model_training(self) -> ModelTrainerArtifact:
         try:
             logger.info("Starting model training phase")
 
-            X_train, X_test, y_train, y_test = self.load_data()
-
-            mlflow.set_experiment(experiment_id="0")
-
-            results = {}
-
-            with mlflow.start_run(run_name="tree_model"):
-                tree_model, tree_score = self.train_tree_model(
-                    X_train, X_test, y_train, y_test
-                )
-                mlflow.log_metric("f1_score", tree_score)
-                results["RandomForest"] = (tree_model, tree_score)
-                mlflow.log_param("model_type", "RandomForest")
-                mlflow.log_param("data_version", self.transformation_artifact.transformed_train_path)
-
-
-            with mlflow.start_run(run_name="linear_model"):
-                linear_model, linear_score = self.train_linear_model(
-                    X_train, X_test, y_train, y_test
-                )
-                mlflow.log_metric("f1_score", linear_score)
-                results["LogisticRegression"] = (linear_model, linear_score)
-                mlflow.log_param("model_type", "LogisticRegression")
-                mlflow.log_param("data_version", self.transformation_artifact.transformed_train_path)
-
-
-            best_model_name, (best_model, best_score) = max(
-                results.items(), key=lambda x: x[1][1]
+            train, test = self.load_data()
+            data_version = self.data_version()
+
+            results = self.train_candidates(train, test, data_version)
+
+            # Queued; written in batches off the training thread
+            tracker = get_tracker()
+
+            for name, result in results.items():
+                with tracker.start_run(name) as run:
+                    run.log_params({
+                        "model_type": name,
+                        "data_version": data_version,
+                        "data_path": self.transformation_artifact.train_matrix_path,
+                        "cache_hit": result["cache_hit"],
+                        **MODEL_CANDIDATES[name].tags,
+                        **{f"best_{k}": v for k, v in result["best_params"].items()},
+                    })
+                    run.log_metrics({
+                        "f1_score": result["f1_score"],
+                        "f2_score": result["f2_score"],
+                        "fit_time_seconds": result["fit_seconds"],
+                        "model_size_bytes": result["model_size_bytes"],
+                        "predict_latency_ms": result["predict_latency_ms"],
+                        "peak_rss_mb": result["peak_rss_mb"],
+                    })
+
+            # Scores alongside cost, so a cheaper model can be picked deliberately
+            candidate_metrics = {
+                name: {
+                    "f1_score": result["f1_score"],
+                    "f2_score": result["f2_score"],
+                    "train_time_seconds": round(result["fit_seconds"], 3),
+                    "model_size_bytes": result["model_size_bytes"],
+                    "predict_latency_ms": round(result["predict_latency_ms"], 4),
+                    "peak_rss_mb": result["peak_rss_mb"],
+                    "cache_hit": result["cache_hit"],
+                }
+                for name, result in results.items()
+            }
+
+            best_model_name, best_result = max(
+                results.items(), key=lambda x: x[1]["score"]
             )
+            best_model, best_score = best_result["model"], best_result["score"]
 
             os.makedirs(self.config.model_trainer_dir, exist_ok=True)
 
             with open(self.config.trained_model_path, "wb") as f:
                 pickle.dump(best_model, f)
 
+            np.save(
+                self.config.oof_probabilities_path,
+                self.out_of_fold_probabilities(
+                    best_model_name, train, best_result["best_params"], data_version
+                ),
+            )
+
             with open(self.config.metrics_file_path, "w") as f:
                 yaml.dump(
                     {
                         "best_model": best_model_name,
-                        "best_f1_score": best_score,
+                        "best_score": best_score,
+                        "selection_metric": f"f{SEARCH_SCORING_BETA}",
+                        "candidates": candidate_metrics,
                     },
                     f,
                 )
 
             logger.info(
-                f"Best model: {best_model_name} | F1 Score: {best_score}"
+                f"Best model: {best_model_name} | F{SEARCH_SCORING_BETA} Score: {best_score}"
             )
 
             return ModelTrainerArtifact(
                 trained_model_path=self.config.trained_model_path,
                 best_model_name=best_model_name,
                 best_model_score=best_score,
+                oof_probabilities_path=self.config.oof_probabilities_path,
             )
 
         except Exception as e:
@@ -0,0 +1,14 @@
+"""
+Offline bulk scoring related constants
+"""
+
+import os
+
+BATCH_SCORING_CHUNK_SIZE: int = 50_000
+BATCH_SCORING_N_WORKERS: int = os.cpu_count() or 1
+
+# Chunks in flight per worker; bounds memory while keeping workers busy
+BATCH_SCORING_MAX_PENDING_PER_WORKER: int = 2
+
+# Columns copied from the input next to the scores
+BATCH_SCORING_ID_COLUMNS = ["Transaction ID"]
@@ -0,0 +1,35 @@
+"""
+Benchmark related constants
+"""
+
+import os
+
+from src.constants.data_validation import (
+    DATA_VALIDATION_DIR_NAME,
+    DATA_VALIDATION_REFERENCE_PROFILE_FILE_NAME,
+)
+from src.constants.training_pipeline import ARTIFACT_LATEST_DIR
+
+BENCHMARK_RESULTS_DIR: str = os.path.join("benchmarks", "results")
+BENCHMARK_SEED: int = 42
+
+# Synthetic transactions follow the latest accepted training profile when present
+BENCHMARK_PROFILE_PATH: str = os.path.join(
+    ARTIFACT_LATEST_DIR, DATA_VALIDATION_DIR_NAME, DATA_VALIDATION_REFERENCE_PROFILE_FILE_NAME
+)
+
+# Load shape
+BENCHMARK_CONCURRENCY_LEVELS: list = [1, 8, 32]
+BENCHMARK_BATCH_SIZES: list = [1, 64, 512]
+BENCHMARK_REQUESTS: int = 2_000
+BENCHMARK_WARMUP_REQUESTS: int = 50
+BENCHMARK_PERCENTILES: list = [50, 95, 99]
+
+BENCHMARK_HTTP_URL: str = "http://localhost:3000"
+
+# Training pipeline scale benchmark
+BENCHMARK_DATA_DIR: str = os.path.join("benchmarks", "data")
+BENCHMARK_PIPELINE_SIZES: list = [10_000, 100_000, 1_000_000, 10_000_000]
+BENCHMARK_GENERATION_CHUNK_ROWS: int = 500_000
+# Time exponent vs rows above which a stage counts as no longer scaling
+BENCHMARK_SUPERLINEAR_EXPONENT: float = 1.2
@@ -18,10 +18,17 @@ DATA_INGESTION_DIR_NAME: str = "data_ingestion"
 DATA_INGESTION_FEATURE_STORE_DIR: str = "feature_store"
 DATA_INGESTION_INGESTED_DIR: str = "ingested"
 
-# Output file names
-DATA_INGESTION_TRAIN_FILE_NAME: str = "train.csv"
-DATA_INGESTION_TEST_FILE_NAME: str = "test.csv"
+# Output file names (extension follows ARTIFACT_FILE_FORMAT)
+DATA_INGESTION_TRAIN_FILE_NAME: str = "train"
+DATA_INGESTION_TEST_FILE_NAME: str = "test"
 
 # Split configuration
 DATA_INGESTION_TRAIN_TEST_SPLIT_RATIO: float = 0.2
 DATA_INGESTION_RANDOM_STATE: int = 42
+
+# Streaming (out-of-core) ingestion
+# Rows are assigned to train/test by a seeded hash of the split key, so the
+# split is reproducible without holding the whole file in memory.
+DATA_INGESTION_STREAMING: bool = False
+DATA_INGESTION_CHUNK_SIZE: int = 100_000
+DATA_INGESTION_SPLIT_KEY: str = "Transaction ID"
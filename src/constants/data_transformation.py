@@ -1,6 +1,52 @@
 DATA_TRANSFORMATION_DIR_NAME = "data_transformation"
 
-TRANSFORMED_TRAIN_FILE_NAME = "train_features.csv"
-TRANSFORMED_TEST_FILE_NAME = "test_features.csv"
-
 PREPROCESSING_OBJECT_FILE_NAME = "feature_engineering.pkl"
+
+# Model inputs: contiguous float32 matrices (memory-mapped by training and
+# evaluation) and uint8 targets
+TRAIN_MATRIX_FILE_NAME = "train_matrix.npy"
+TRAIN_TARGET_FILE_NAME = "train_target.npy"
+TEST_MATRIX_FILE_NAME = "test_matrix.npy"
+TEST_TARGET_FILE_NAME = "test_target.npy"
+FEATURE_MATRIX_BLOCK_ROWS = 100_000
+
+# Columns dropped before modelling (EDA driven)
+DROP_COLUMNS = [
+    "Transaction ID",
+    "Customer ID",
+    "Transaction Date",
+    "Customer Location",
+    "IP Address",
+    "Shipping Address",
+    "Billing Address",
+]
+
+ONE_HOT_COLUMNS = ["Device Used", "Product Category", "Payment Method"]
+
+# Training rows below this age are filtered out
+MIN_CUSTOMER_AGE = 18
+
+NEW_ACCOUNT_MAX_DAYS = 30
+EARLY_TXN_HOURS = (0, 5)
+
+# Sliding-window velocity features (src/features/velocity.py)
+# feature prefix -> entity column the windows are keyed by
+VELOCITY_KEYS = {"Customer": "Customer ID", "IP": "IP Address"}
+# window label -> length in seconds
+VELOCITY_WINDOWS = {"1h": 3600, "24h": 86400}
+VELOCITY_TIMESTAMP_COLUMN = "Transaction Date"
+VELOCITY_AMOUNT_COLUMN = "Transaction Amount"
+VELOCITY_DEVICE_COLUMN = "Device Used"
+# Serving records a transaction once per ID (client retries)
+VELOCITY_ID_COLUMN = "Transaction ID"
+
+# Window state at the end of the training history, seeds the serving store
+VELOCITY_STORE_FILE_NAME = "velocity_store.sqlite"
+
+# Fixed-width features from the high-cardinality columns above (dropped
+# afterwards): frequency encodings keep keys seen at least MIN_COUNT times,
+# capped at MAX_CATEGORIES per feature; the rest encode as 0
+FREQUENCY_MIN_COUNT = 2
+FREQUENCY_MAX_CATEGORIES = 10_000
+# IP prefix = first N octets (3 -> the /24 network)
+IP_PREFIX_OCTETS = 3
@@ -9,3 +9,26 @@ DATA_VALIDATION_INVALID_DIR: str = "invalid"
 
 DATA_VALIDATION_DRIFT_REPORT_DIR: str = "drift_report"
 DATA_VALIDATION_DRIFT_REPORT_FILE_NAME: str = "report.yaml"
+DATA_VALIDATION_SCHEMA_REPORT_FILE_NAME: str = "schema_report.yaml"
+
+# Schema enforcement reads the split files chunk by chunk when enabled
+DATA_VALIDATION_STREAMING: bool = False
+DATA_VALIDATION_CHUNK_SIZE: int = 100_000
+
+# Drift detection
+DRIFT_P_VALUE_THRESHOLD: float = 0.03
+
+# Categorical frequencies are binned into the top-k categories + "other"
+DRIFT_MAX_CATEGORIES: int = 20
+
+# KS tests run in a process pool once the data is large enough to pay off
+DRIFT_N_JOBS: int = -1
+DRIFT_PARALLEL_MIN_ROWS: int = 100_000
+
+# Reference profile of the accepted training data
+DATA_VALIDATION_REFERENCE_PROFILE_FILE_NAME: str = "reference_profile.yaml"
+PROFILE_NUM_BINS: int = 20
+PROFILE_TOP_K: int = 20
+# Quantile edges are taken from at most this many rows
+PROFILE_SAMPLE_ROWS: int = 1_000_000
+PROFILE_CHUNK_SIZE: int = 100_000
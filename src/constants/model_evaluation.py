@@ -4,3 +4,8 @@ EVALUATION_REPORT_FILE_NAME = "evaluation.yaml"
 MIN_F2_SCORE = 0.30
 MIN_RECALL = 0.40
 MIN_PRECISION = 0.05
+
+# Threshold sweep
+THRESHOLD_SWEEP_BETA = 2
+# Points of the threshold curve written to evaluation.yaml
+THRESHOLD_CURVE_MAX_POINTS = 200
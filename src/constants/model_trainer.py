@@ -1,3 +1,44 @@
+import os
+
+from src.constants.training_pipeline import ARTIFACT_CACHE_DIR
+
 MODEL_TRAINER_DIR_NAME = "model_trainer"
 MODEL_FILE_NAME = "model.pkl"
 METRICS_FILE_NAME = "metrics.yaml"
+# Out-of-fold probabilities of the selected model on train; evaluation
+# tunes the decision threshold on them, the test split is only measured
+OOF_PROBABILITIES_FILE_NAME = "oof_probabilities.npy"
+THRESHOLD_CV_FOLDS = 5
+
+RANDOM_STATE = 42
+
+# Candidates are fitted concurrently, one process each
+MODEL_TRAINER_N_JOBS = os.cpu_count() or 1
+
+# Successive-halving hyperparameter search per candidate
+MODEL_TRAINER_ENABLE_SEARCH = True
+SEARCH_CV_FOLDS = 3
+SEARCH_HALVING_FACTOR = 3
+SEARCH_N_CANDIDATES = 8
+# Search and candidate selection score F-beta (2: recall-weighted, as in
+# evaluation): a missed fraud costs more than a false alarm
+SEARCH_SCORING_BETA = 2
+
+# HistGradientBoosting candidate (early stopping on a held-out split)
+HGB_MAX_ITER = 500
+HGB_VALIDATION_FRACTION = 0.1
+HGB_N_ITER_NO_CHANGE = 20
+
+# Class-imbalance handling for the linear candidates: one
+# LogisticRegression_<strategy> candidate per entry (see
+# src/models/imbalance.py; "smote" oversamples the full training set)
+IMBALANCE_STRATEGIES = ["class_weight", "undersample_ensemble", "chunked_smote"]
+IMBALANCE_ENSEMBLE_SIZE = 10
+IMBALANCE_SMOTE_CHUNK_ROWS = 20_000
+IMBALANCE_SMOTE_K_NEIGHBORS = 5
+
+# Single-row predict_proba calls timed per candidate for metrics.yaml
+PREDICT_LATENCY_REPEATS = 100
+
+# Fitted candidates, keyed by data version + candidate params
+MODEL_CACHE_DIR = os.path.join(ARTIFACT_CACHE_DIR, "models")
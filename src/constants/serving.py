@@ -0,0 +1,35 @@
+"""
+Serving (FraudService) related constants
+"""
+
+import os
+
+MODEL_NAME: str = "fraud_detector"
+MODEL_TAG: str = f"{MODEL_NAME}:latest"
+
+DEFAULT_THRESHOLD: float = 0.15
+
+# Adaptive batching of concurrent single predict calls
+SERVING_MAX_BATCH_SIZE: int = 64
+SERVING_MAX_LATENCY_MS: int = 5
+
+# Compact (array-backed, memory-mapped) model export
+MODEL_FORMAT_COMPACT: str = "compact"
+COMPACT_MANIFEST_FILE_NAME: str = "manifest.yaml"
+COMPACT_ROW_BLOCK: int = 4096
+COMPACT_VERIFY_ROWS: int = 5000
+COMPACT_TOLERANCE: float = 1e-6
+
+# Hot reload: each worker polls the model store for a new MODEL_TAG version
+SERVING_RELOAD_ENABLED: bool = True
+SERVING_RELOAD_POLL_SECONDS: float = 30.0
+# Rows scored on a freshly loaded model before it takes traffic
+SERVING_WARMUP_ROWS: int = 8
+
+# Live velocity feature store shared by the serving workers (seeded by
+# save_model from the training run's store)
+VELOCITY_STORE_PATH: str = os.environ.get(
+    "VELOCITY_STORE_PATH", os.path.join("feature_store", "velocity.sqlite")
+)
+# Scored requests are recorded as new events in the velocity windows
+VELOCITY_RECORD_REQUESTS: bool = True
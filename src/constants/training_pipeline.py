@@ -6,13 +6,45 @@ TARGET_COLUMN = "Is Fraudulent"
 
 PIPELINE_NAME: str = "ecommerce_fraud_detection_pipeline"
 ARTIFACT_DIR: str = "artifacts"
+# Symlink to the last accepted run, swapped atomically on promotion
+ARTIFACT_LATEST_DIR: str = os.path.join(ARTIFACT_DIR, "latest")
+ARTIFACT_CACHE_DIR: str = os.path.join(ARTIFACT_DIR, "cache")
+# Promoted runs kept after a promotion (the promoted run is always kept);
+# runs that were never promoted are not counted nor removed
+ARTIFACT_RETENTION_RUNS: int = 5
+# Promoted run directory names, oldest first
+ARTIFACT_PROMOTED_RUNS_FILE: str = os.path.join(ARTIFACT_DIR, "promoted_runs.txt")
 
 FILE_NAME: str = "transactions.csv"
 
-TRAIN_FILE_NAME: str = "train.csv"
-TEST_FILE_NAME: str = "test.csv"
+# Format of the data artifacts passed between stages ("parquet" or "csv")
+ARTIFACT_FILE_FORMAT: str = "parquet"
+
+TRAIN_FILE_NAME: str = "train"
+TEST_FILE_NAME: str = "test"
 
 SCHEMA_FILE_PATH = os.path.join("data_schema", "schema.yaml")
 
 SAVED_MODEL_DIR = "saved_models"
 MODEL_FILE_NAME = "model.pkl"
+
+# Per-stage timing / memory report written into each run's artifact dir
+PIPELINE_PROFILE_FILE_NAME: str = "pipeline_profile.yaml"
+PIPELINE_PROFILE_DIR: str = "profiles"
+# tracemalloc peak of Python/NumPy allocations (slows stages noticeably)
+PIPELINE_PROFILE_TRACE_MEMORY: bool = False
+# cProfile every stage, dumping .prof files into PIPELINE_PROFILE_DIR
+PIPELINE_PROFILE_CPROFILE: bool = False
+
+# Content-addressed cache of finished stages (keyed by inputs, constants, code)
+PIPELINE_STAGE_CACHE_ENABLED: bool = True
+PIPELINE_STAGE_CACHE_DIR: str = os.path.join(ARTIFACT_CACHE_DIR, "stages")
+
+# MLflow tracking: runs are buffered and written from a background thread
+MLFLOW_EXPERIMENT_ID: str = "0"
+MLFLOW_FLUSH_SECONDS: float = 2.0
+# Attempts per batch before it is spooled (e.g. the sqlite store is locked)
+MLFLOW_MAX_RETRIES: int = 3
+MLFLOW_RETRY_BACKOFF_SECONDS: float = 0.5
+# Unsent operations (JSONL) and copies of their artifacts, replayed on the next run
+MLFLOW_SPOOL_DIR: str = "mlflow_spool"
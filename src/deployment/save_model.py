@@ -1,10 +1,41 @@
+import os
 import bentoml
 import pickle
 import yaml
 
-MODEL_PATH = "artifacts/latest/model_trainer/model.pkl"
-EVAL_PATH = "artifacts/latest/model_evaluation/evaluation.yaml"
-PREPROCESS_PATH = "artifacts/latest/data_transformation/feature_engineering.pkl"
+from src.constants.data_transformation import (
+    TEST_MATRIX_FILE_NAME,
+    TEST_TARGET_FILE_NAME,
+    VELOCITY_STORE_FILE_NAME,
+)
+from src.constants.serving import (
+    MODEL_NAME,
+    DEFAULT_THRESHOLD,
+    MODEL_FORMAT_COMPACT,
+    COMPACT_VERIFY_ROWS,
+    COMPACT_TOLERANCE,
+    VELOCITY_STORE_PATH,
+)
+from src.constants.training_pipeline import (
+    ARTIFACT_LATEST_DIR,
+    SCHEMA_FILE_PATH,
+    TARGET_COLUMN,
+)
+from src.features.matrix import FeatureMatrix
+from src.features.velocity import VelocityStore
+from src.models.compact import CompactModel, max_proba_difference
+from src.utils import read_yaml_file
+
+# Resolved once: every file below comes from the same run even if a new
+# run is promoted meanwhile
+LATEST_DIR = os.path.realpath(ARTIFACT_LATEST_DIR)
+
+MODEL_PATH = os.path.join(LATEST_DIR, "model_trainer", "model.pkl")
+EVAL_PATH = os.path.join(LATEST_DIR, "model_evaluation", "evaluation.yaml")
+PREPROCESS_PATH = os.path.join(LATEST_DIR, "data_transformation", "feature_engineering.pkl")
+TEST_MATRIX_PATH = os.path.join(LATEST_DIR, "data_transformation", TEST_MATRIX_FILE_NAME)
+TEST_TARGET_PATH = os.path.join(LATEST_DIR, "data_transformation", TEST_TARGET_FILE_NAME)
+VELOCITY_SEED_PATH = os.path.join(LATEST_DIR, "data_transformation", VELOCITY_STORE_FILE_NAME)
 
 with open(MODEL_PATH, "rb") as f:
     model = pickle.load(f)
@@ -15,11 +46,47 @@ with open(PREPROCESS_PATH, "rb") as f:
 with open(EVAL_PATH) as f:
     eval_report = yaml.safe_load(f)
 
-bentoml.sklearn.save_model(
-    "fraud_detector",
-    model,
-    metadata={
-        "threshold": eval_report.get("best_threshold", 0.15),
-        "features": preprocess_meta["columns"],
-    },
-)
+metadata = {
+    "threshold": eval_report.get("best_threshold", DEFAULT_THRESHOLD),
+    "features": preprocess_meta["columns"],
+    "encoder": preprocess_meta.get("encoder"),
+    "frequency": preprocess_meta.get("frequency"),
+    "schema": read_yaml_file(SCHEMA_FILE_PATH),
+}
+
+# Array-backed export when the model supports it, checked against the original
+compact = CompactModel.from_model(model)
+
+if compact is not None:
+    features = [col for col in preprocess_meta["columns"] if col != TARGET_COLUMN]
+    X_test, _ = FeatureMatrix(TEST_MATRIX_PATH, TEST_TARGET_PATH, tuple(features)).load()
+    X_check = X_test.head(COMPACT_VERIFY_ROWS).to_numpy(dtype=float)
+
+    difference = max_proba_difference(model, compact, X_check)
+    if difference > COMPACT_TOLERANCE:
+        raise ValueError(
+            f"Compact export differs from the trained model by {difference:.2e} "
+            f"(tolerance {COMPACT_TOLERANCE:.0e})"
+        )
+
+    with bentoml.models.create(
+        MODEL_NAME,
+        module=CompactModel.__module__,
+        metadata={**metadata, "format": MODEL_FORMAT_COMPACT, "compact_kind": compact.kind},
+    ) as bento_model:
+        compact.save(bento_model.path)
+
+    print(f"Saved compact {compact.kind} model: {bento_model.tag} (max diff {difference:.2e})")
+else:
+    bento_model = bentoml.sklearn.save_model(MODEL_NAME, model, metadata=metadata)
+    print(f"Saved sklearn model: {bento_model.tag}")
+
+# Velocity windows at the end of the training history; keys the live store
+# already tracks keep their (newer) serving state
+if os.path.exists(VELOCITY_SEED_PATH):
+    store = VelocityStore(VELOCITY_STORE_PATH)
+    try:
+        added = store.merge_from(VELOCITY_SEED_PATH)
+    finally:
+        store.close()
+    print(f"Seeded velocity store {VELOCITY_STORE_PATH} with {added} keys")
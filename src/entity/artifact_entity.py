@@ -17,21 +17,28 @@ class DataValidationArtifact:
     invalid_train_file_path: str
     invalid_test_file_path: str
     drift_report_file_path: str
+    reference_profile_file_path: str
+    schema_report_file_path: str
 
 @dataclass
 class DataTransformationArtifact:
-    transformed_train_path: str
-    transformed_test_path: str
     preprocessing_object_path: str
+    velocity_store_path: str
+    train_matrix_path: str
+    train_target_path: str
+    test_matrix_path: str
+    test_target_path: str
 
 @dataclass
 class ModelTrainerArtifact:
     trained_model_path: str
     best_model_name: str
     best_model_score: float
+    oof_probabilities_path: str
 
 @dataclass
 class ModelEvaluationArtifact:
     is_model_accepted: bool
     evaluated_metric: float
-    evaluation_report_path: str
\ No newline at end of file
+    evaluation_report_path: str
+    best_threshold: float
\ No newline at end of file
@@ -3,15 +3,34 @@ import os
 from src.constants import training_pipeline
 
 class TrainingPipelineConfig:
-    def __init__(self, timestamp: str = None):
+    def __init__(
+        self,
+        timestamp: str = None,
+        artifact_file_format: str = None,
+        raw_data_path: str = None,
+    ):
         if timestamp is None:
             timestamp = datetime.now().strftime("%m_%d_%Y_%H_%M_%S")
 
+        if artifact_file_format is None:
+            artifact_file_format = training_pipeline.ARTIFACT_FILE_FORMAT
+
         self.pipeline_name = training_pipeline.PIPELINE_NAME
         self.artifact_root = training_pipeline.ARTIFACT_DIR
         self.artifact_dir = os.path.join(self.artifact_root, timestamp)
         self.model_dir = os.path.join(self.artifact_dir, training_pipeline.SAVED_MODEL_DIR)
         self.timestamp = timestamp
+        self.artifact_file_format = artifact_file_format
+        # Overrides data/raw/<FILE_NAME> for ingestion (e.g. benchmarks)
+        self.raw_data_path = raw_data_path
+
+        self.pipeline_profile_file_path = os.path.join(
+            self.artifact_dir, training_pipeline.PIPELINE_PROFILE_FILE_NAME
+        )
+        self.profile_dir = os.path.join(self.artifact_dir, training_pipeline.PIPELINE_PROFILE_DIR)
+
+    def data_file_name(self, name: str) -> str:
+        return f"{name}.{self.artifact_file_format}"
 
 
 
@@ -25,19 +44,23 @@ class DataIngestionConfig:
             data_ingestion.DATA_INGESTION_DIR_NAME
         )
 
-        self.raw_data_path = os.path.join(
+        self.raw_data_path = training_pipeline_config.raw_data_path or os.path.join(
             data_ingestion.DATA_INGESTION_RAW_DIR,
             data_ingestion.DATA_INGESTION_RAW_FILE_NAME
         )
 
         self.train_file_path = os.path.join(
             self.data_ingestion_dir,
-            data_ingestion.DATA_INGESTION_TRAIN_FILE_NAME
+            training_pipeline_config.data_file_name(
+                data_ingestion.DATA_INGESTION_TRAIN_FILE_NAME
+            )
         )
 
         self.test_file_path = os.path.join(
             self.data_ingestion_dir,
-            data_ingestion.DATA_INGESTION_TEST_FILE_NAME
+            training_pipeline_config.data_file_name(
+                data_ingestion.DATA_INGESTION_TEST_FILE_NAME
+            )
         )
 
 from src.constants import data_validation
@@ -61,22 +84,22 @@ class DataValidationConfig:
 
         self.valid_train_file_path = os.path.join(
             self.valid_data_dir,
-            training_pipeline.TRAIN_FILE_NAME
+            training_pipeline_config.data_file_name(training_pipeline.TRAIN_FILE_NAME)
         )
 
         self.valid_test_file_path = os.path.join(
             self.valid_data_dir,
-            training_pipeline.TEST_FILE_NAME
+            training_pipeline_config.data_file_name(training_pipeline.TEST_FILE_NAME)
         )
 
         self.invalid_train_file_path = os.path.join(
             self.invalid_data_dir,
-            training_pipeline.TRAIN_FILE_NAME
+            training_pipeline_config.data_file_name(training_pipeline.TRAIN_FILE_NAME)
         )
 
         self.invalid_test_file_path = os.path.join(
             self.invalid_data_dir,
-            training_pipeline.TEST_FILE_NAME
+            training_pipeline_config.data_file_name(training_pipeline.TEST_FILE_NAME)
         )
 
         self.drift_report_file_path = os.path.join(
@@ -85,6 +108,17 @@ class DataValidationConfig:
             data_validation.DATA_VALIDATION_DRIFT_REPORT_FILE_NAME
         )
 
+        self.schema_report_file_path = os.path.join(
+            self.data_validation_dir,
+            data_validation.DATA_VALIDATION_DRIFT_REPORT_DIR,
+            data_validation.DATA_VALIDATION_SCHEMA_REPORT_FILE_NAME
+        )
+
+        self.reference_profile_file_path = os.path.join(
+            self.data_validation_dir,
+            data_validation.DATA_VALIDATION_REFERENCE_PROFILE_FILE_NAME
+        )
+
 from src.constants import data_transformation
 
 class DataTransformationConfig:
@@ -94,19 +128,34 @@ class DataTransformationConfig:
             data_transformation.DATA_TRANSFORMATION_DIR_NAME
         )
 
-        self.transformed_train_path = os.path.join(
+        self.preprocessing_object_path = os.path.join(
             self.data_transformation_dir,
-            data_transformation.TRANSFORMED_TRAIN_FILE_NAME
+            data_transformation.PREPROCESSING_OBJECT_FILE_NAME
         )
 
-        self.transformed_test_path = os.path.join(
+        self.velocity_store_path = os.path.join(
             self.data_transformation_dir,
-            data_transformation.TRANSFORMED_TEST_FILE_NAME
+            data_transformation.VELOCITY_STORE_FILE_NAME
         )
 
-        self.preprocessing_object_path = os.path.join(
+        self.train_matrix_path = os.path.join(
             self.data_transformation_dir,
-            data_transformation.PREPROCESSING_OBJECT_FILE_NAME
+            data_transformation.TRAIN_MATRIX_FILE_NAME
+        )
+
+        self.train_target_path = os.path.join(
+            self.data_transformation_dir,
+            data_transformation.TRAIN_TARGET_FILE_NAME
+        )
+
+        self.test_matrix_path = os.path.join(
+            self.data_transformation_dir,
+            data_transformation.TEST_MATRIX_FILE_NAME
+        )
+
+        self.test_target_path = os.path.join(
+            self.data_transformation_dir,
+            data_transformation.TEST_TARGET_FILE_NAME
         )
 from src.constants import model_trainer
 
@@ -126,6 +175,11 @@ class ModelTrainerConfig:
             self.model_trainer_dir,
             model_trainer.METRICS_FILE_NAME
         )
+
+        self.oof_probabilities_path = os.path.join(
+            self.model_trainer_dir,
+            model_trainer.OOF_PROBABILITIES_FILE_NAME
+        )
 from src.constants import model_evaluation
 
 class ModelEvaluationConfig:
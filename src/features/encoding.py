@@ -0,0 +1,174 @@
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+from scipy import sparse as sp
+
+
+class CategoryEncoder:
+    """
+    One-hot encoder with category vocabularies learned once at fit time.
+
+    Output columns are named "<column>_<category>" like pd.get_dummies, so
+    models trained before the encoder existed keep the same feature space.
+    The output width is fixed by the fitted vocabularies. Unseen categories
+    either encode as all zeros (handle_unknown="ignore") or raise
+    (handle_unknown="error").
+    """
+
+    def __init__(
+        self,
+        columns: List[str],
+        drop_first: bool = True,
+        handle_unknown: str = "ignore",
+        categories: Optional[Dict[str, List[str]]] = None,
+    ):
+        if handle_unknown not in ("ignore", "error"):
+            raise ValueError(f"handle_unknown must be 'ignore' or 'error', got {handle_unknown!r}")
+
+        self.columns = list(columns)
+        self.drop_first = drop_first
+        self.handle_unknown = handle_unknown
+        self.categories = None
+
+        if categories is not None:
+            self._set_categories(categories)
+
+    def _set_categories(self, categories: Dict[str, List[str]]):
+        self.categories = {col: list(categories[col]) for col in self.columns}
+
+        skip = 1 if self.drop_first else 0
+        self.feature_names = []
+        self._offsets = {}
+        for col in self.columns:
+            self._offsets[col] = len(self.feature_names) - skip
+            self.feature_names.extend(
+                f"{col}_{cat}" for cat in self.categories[col][skip:]
+            )
+        self.width = len(self.feature_names)
+
+    def fit(self, df: pd.DataFrame) -> "CategoryEncoder":
+        self._set_categories(
+            {
+                col: sorted(str(cat) for cat in df[col].dropna().unique())
+                for col in self.columns
+            }
+        )
+        return self
+
+    def transform(self, df: pd.DataFrame, sparse: bool = False):
+        if self.categories is None:
+            raise ValueError("CategoryEncoder must be fitted before transform")
+
+        n_rows = len(df)
+        skip = 1 if self.drop_first else 0
+        rows, cols = [], []
+
+        for col in self.columns:
+            # -1 for unseen (and missing) values
+            codes = pd.Index(self.categories[col]).get_indexer(df[col].astype(str))
+
+            unknown = (codes < 0) & df[col].notna().to_numpy()
+            if self.handle_unknown == "error" and unknown.any():
+                unseen = sorted(set(df.loc[unknown, col].astype(str)))
+                raise ValueError(f"Unseen categories in '{col}': {unseen[:10]}")
+
+            hit = np.flatnonzero(codes >= skip)
+            rows.append(hit)
+            cols.append(codes[hit] + self._offsets[col])
+
+        rows = np.concatenate(rows)
+        cols = np.concatenate(cols).astype(np.int64)
+
+        if sparse:
+            data = np.ones(len(rows), dtype=np.uint8)
+            return sp.csr_matrix((data, (rows, cols)), shape=(n_rows, self.width))
+
+        encoded = np.zeros((n_rows, self.width), dtype=np.uint8)
+        encoded[rows, cols] = 1
+        return encoded
+
+    def transform_frame(self, df: pd.DataFrame) -> pd.DataFrame:
+        # Replaces the raw categorical columns with their encoded columns
+        encoded = pd.DataFrame(
+            self.transform(df), columns=self.feature_names, index=df.index
+        )
+        return pd.concat([df.drop(columns=self.columns), encoded], axis=1)
+
+    def to_dict(self) -> dict:
+        return {
+            "columns": self.columns,
+            "categories": self.categories,
+            "drop_first": self.drop_first,
+            "handle_unknown": self.handle_unknown,
+        }
+
+    @classmethod
+    def from_dict(cls, state: dict) -> "CategoryEncoder":
+        return cls(
+            columns=state["columns"],
+            drop_first=state.get("drop_first", True),
+            handle_unknown=state.get("handle_unknown", "ignore"),
+            categories=state["categories"],
+        )
+
+
+class FrequencyEncoder:
+    """
+    Frequency encoding for high-cardinality string keys.
+
+    Each feature maps a key (e.g. a location or an IP prefix) to its share
+    of the training rows, so the output is one float column per feature
+    however many distinct keys there are. Only keys seen at least min_count
+    times, and at most max_categories per feature, are kept; rarer and
+    unseen keys encode as 0. The tables are plain dicts, so a serving
+    lookup is a single dict get.
+    """
+
+    def __init__(
+        self,
+        min_count: int = 1,
+        max_categories: Optional[int] = None,
+        tables: Optional[Dict[str, Dict[str, float]]] = None,
+    ):
+        self.min_count = min_count
+        self.max_categories = max_categories
+        self.tables = tables
+
+    def fit(self, keys: Dict[str, pd.Series]) -> "FrequencyEncoder":
+        """keys: feature name -> key of every training row."""
+        self.tables = {}
+        for name, values in keys.items():
+            counts = values.dropna().astype(str).value_counts()
+            counts = counts[counts >= self.min_count]
+            if self.max_categories is not None:
+                counts = counts.head(self.max_categories)
+            total = max(len(values), 1)
+            self.tables[name] = {key: count / total for key, count in counts.items()}
+        return self
+
+    def transform(self, name: str, values: pd.Series) -> np.ndarray:
+        if self.tables is None:
+            raise ValueError("FrequencyEncoder must be fitted before transform")
+        return (
+            values.astype(str).map(self.tables[name])
+            .astype(np.float64).fillna(0.0).to_numpy()
+        )
+
+    def lookup(self, name: str, key) -> float:
+        return self.tables[name].get(key, 0.0)
+
+    def to_dict(self) -> dict:
+        return {
+            "min_count": self.min_count,
+            "max_categories": self.max_categories,
+            "tables": self.tables,
+        }
+
+    @classmethod
+    def from_dict(cls, state: dict) -> "FrequencyEncoder":
+        return cls(
+            min_count=state.get("min_count", 1),
+            max_categories=state.get("max_categories"),
+            tables=state["tables"],
+        )
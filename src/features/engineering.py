@@ -0,0 +1,294 @@
+from typing import List, Optional
+
+import numpy as np
+import pandas as pd
+
+from src.constants.data_transformation import (
+    DROP_COLUMNS,
+    ONE_HOT_COLUMNS,
+    MIN_CUSTOMER_AGE,
+    NEW_ACCOUNT_MAX_DAYS,
+    EARLY_TXN_HOURS,
+    FREQUENCY_MIN_COUNT,
+    FREQUENCY_MAX_CATEGORIES,
+    IP_PREFIX_OCTETS,
+)
+from src.features.encoding import CategoryEncoder, FrequencyEncoder
+from src.features.layout import FeatureLayout
+from src.features.velocity import VELOCITY_INPUT_COLUMNS, velocity_feature_names
+
+
+# -------------------------
+# FEATURE FORMULAS
+# -------------------------
+# Written with plain operators so the same function works on a Series
+# (training), a NumPy column (micro-batch) and a scalar (single record).
+
+def log_transaction_amount(amount):
+    return np.log1p(amount)
+
+
+def new_account(account_age_days):
+    return (account_age_days <= NEW_ACCOUNT_MAX_DAYS) * 1
+
+
+def early_txn(hour):
+    low, high = EARLY_TXN_HOURS
+    return ((hour >= low) & (hour <= high)) * 1
+
+
+def age_amount_risk(age, amount):
+    return age * log_transaction_amount(amount)
+
+
+# (output column, formula, raw input columns)
+DERIVED_FEATURES = [
+    ("Log_Transaction_Amount", log_transaction_amount, ["Transaction Amount"]),
+    ("New_Account", new_account, ["Account Age Days"]),
+    ("Early_Txn", early_txn, ["Transaction Hour"]),
+    ("Age_Amount_Risk", age_amount_risk, ["Customer Age", "Transaction Amount"]),
+]
+
+
+# String fields: vectorized on a Series in training, evaluated per record
+# (scalars) at serving. Missing values arrive as "" on both paths.
+
+def _text(value):
+    # Record-path twin of fillna(""): None / NaN -> ""
+    return "" if value is None or value != value else value
+
+
+def address_mismatch(shipping, billing):
+    # Boolean; cast by the caller (arrow-backed bools do not multiply)
+    return shipping != billing
+
+
+def location_key(location):
+    return location
+
+
+def ip_prefix(ip):
+    # 91.203.155.251 -> 91.203.155 with 3 octets (the /24 network)
+    if isinstance(ip, str):
+        return ip.rsplit(".", 4 - IP_PREFIX_OCTETS)[0]
+    return ip.astype(str).str.rsplit(".", n=4 - IP_PREFIX_OCTETS).str[0]
+
+
+# (output column, formula, raw input columns)
+STRING_FEATURES = [
+    ("Address_Mismatch", address_mismatch, ["Shipping Address", "Billing Address"]),
+]
+
+# (output column, key function, raw input column), frequency encoded
+FREQUENCY_FEATURES = [
+    ("Customer_Location_Freq", location_key, "Customer Location"),
+    ("IP_Prefix_Freq", ip_prefix, "IP Address"),
+]
+
+
+class FeatureEngineer:
+    """
+    Single feature-engineering engine shared by training and serving.
+
+    fit learns the category vocabularies on the training frame and
+    transform_frame runs on a whole DataFrame. Once the model input
+    columns are known, transform_record and transform_records compute the
+    same features for one record or a micro-batch of dicts straight into
+    NumPy, without pandas. High-cardinality string columns only reach the
+    model through fixed-width features (mismatch flags, frequency
+    encodings) and are dropped afterwards. Velocity features are stateful
+    and come from VelocityEngine; they are expected on the frame / records
+    already.
+    """
+
+    def __init__(
+        self,
+        columns: Optional[List[str]] = None,
+        encoder: Optional[CategoryEncoder] = None,
+        frequency: Optional[FrequencyEncoder] = None,
+    ):
+        self.columns = None
+        self.encoder = encoder
+        self.frequency = frequency
+        if columns is not None:
+            self.compile(columns)
+
+    # -------------------------
+    # TRAINING (DataFrame)
+    # -------------------------
+    def fit(self, df: pd.DataFrame) -> "FeatureEngineer":
+        df = df[df["Customer Age"] >= MIN_CUSTOMER_AGE]
+        self.encoder = CategoryEncoder(ONE_HOT_COLUMNS).fit(df)
+        self.frequency = FrequencyEncoder(FREQUENCY_MIN_COUNT, FREQUENCY_MAX_CATEGORIES).fit(
+            {name: key(df[column]) for name, key, column in FREQUENCY_FEATURES}
+        )
+        return self
+
+    def transform_frame(self, df: pd.DataFrame, filter_rows: bool = True) -> pd.DataFrame:
+        if self.encoder is None:
+            raise ValueError("FeatureEngineer must be fitted before transform_frame")
+
+        raw = df[df["Customer Age"] >= MIN_CUSTOMER_AGE] if filter_rows else df
+        df = raw.drop(columns=DROP_COLUMNS, errors="ignore")
+
+        for name, formula, inputs in DERIVED_FEATURES:
+            df[name] = formula(*(df[col] for col in inputs))
+
+        # Fixed-width features from the dropped high-cardinality columns
+        for name, formula, inputs in STRING_FEATURES:
+            df[name] = formula(*(raw[col].fillna("") for col in inputs)).astype(int)
+
+        if self.frequency is not None:
+            for name, key, column in FREQUENCY_FEATURES:
+                df[name] = self.frequency.transform(name, key(raw[column]))
+
+        df["Quantity"] = df["Quantity"].astype(int)
+
+        # Fixed-width encoding with the fitted vocabularies
+        df = self.encoder.transform_frame(df)
+
+        return df
+
+    @classmethod
+    def from_metadata(cls, metadata: dict, columns: Optional[List[str]] = None) -> "FeatureEngineer":
+        encoder = None
+        if metadata.get("encoder"):
+            encoder = CategoryEncoder.from_dict(metadata["encoder"])
+
+        frequency = None
+        if metadata.get("frequency"):
+            frequency = FrequencyEncoder.from_dict(metadata["frequency"])
+
+        return cls(columns=columns or metadata["columns"], encoder=encoder, frequency=frequency)
+
+    # -------------------------
+    # SERVING (compiled)
+    # -------------------------
+    def compile(self, columns: List[str]) -> "FeatureEngineer":
+        self.columns = list(columns)
+        self.layout = FeatureLayout(self.columns)
+
+        index = self.layout.index
+
+        self._derived = [
+            (index[name], formula, inputs)
+            for name, formula, inputs in DERIVED_FEATURES
+            if name in index
+        ]
+
+        # {raw column: {category: output index}}
+        self._one_hot = {}
+        for col in ONE_HOT_COLUMNS:
+            if self.encoder is not None:
+                names = {
+                    cat: f"{col}_{cat}" for cat in self.encoder.categories[col]
+                }
+            else:
+                # Models saved before the encoder was persisted
+                prefix = f"{col}_"
+                names = {
+                    name[len(prefix):]: name
+                    for name in index
+                    if name.startswith(prefix)
+                }
+            self._one_hot[col] = {
+                cat: index[name] for cat, name in names.items() if name in index
+            }
+
+        self._string = [
+            (index[name], formula, inputs)
+            for name, formula, inputs in STRING_FEATURES
+            if name in index
+        ]
+        # (output index, frequency table, key function, raw column)
+        self._frequency = [
+            (index[name], self.frequency.tables[name], key, column)
+            for name, key, column in FREQUENCY_FEATURES
+            if name in index and self.frequency is not None
+        ]
+
+        # Filled per request from the velocity store, not sent by the caller
+        self.velocity_features = [name for name in velocity_feature_names() if name in index]
+
+        # Raw request fields the compiled layout reads
+        computed = {i for i, _, _ in self._derived}
+        computed.update(i for mapping in self._one_hot.values() for i in mapping.values())
+        computed.update(i for i, _, _ in self._string)
+        computed.update(i for i, _, _, _ in self._frequency)
+        computed.update(index[name] for name in self.velocity_features)
+        self.input_columns = [col for col, i in index.items() if i not in computed]
+        self.input_columns += [
+            col for col, mapping in self._one_hot.items() if mapping
+        ]
+        for _, _, inputs in self._derived + self._string:
+            self.input_columns += [col for col in inputs if col not in self.input_columns]
+        self.input_columns += [
+            column for _, _, _, column in self._frequency if column not in self.input_columns
+        ]
+        if self.velocity_features:
+            self.input_columns += [col for col in VELOCITY_INPUT_COLUMNS if col not in self.input_columns]
+
+        return self
+
+    def transform_record(self, record: dict, out: Optional[np.ndarray] = None) -> np.ndarray:
+        if out is None:
+            out = self.layout.row_buffer()[0]
+
+        # Raw numeric fields (and any precomputed model columns)
+        self.layout.fill(record, out)
+
+        for col, mapping in self._one_hot.items():
+            i = mapping.get(record.get(col))
+            if i is not None:
+                out[i] = 1
+
+        for i, formula, inputs in self._derived:
+            values = [record.get(col) for col in inputs]
+            if any(value is None for value in values):
+                continue
+            out[i] = formula(*values)
+
+        self._fill_string_features(record, out)
+
+        return out
+
+    def _fill_string_features(self, record: dict, out: np.ndarray) -> None:
+        for i, formula, inputs in self._string:
+            out[i] = formula(*(_text(record.get(col)) for col in inputs))
+
+        # Constant-time lookups in the fitted frequency tables
+        for i, table, key, column in self._frequency:
+            value = record.get(column)
+            if value is not None:
+                out[i] = table.get(key(str(value)), 0.0)
+
+    def transform_records(self, records: List[dict]) -> np.ndarray:
+        if len(records) == 1:
+            return self.transform_record(records[0]).reshape(1, -1)
+
+        X = self.layout.to_matrix(records)
+
+        for col, mapping in self._one_hot.items():
+            for row, record in enumerate(records):
+                i = mapping.get(record.get(col))
+                if i is not None:
+                    X[row, i] = 1
+
+        if self._string or self._frequency:
+            for record, out in zip(records, X):
+                self._fill_string_features(record, out)
+
+        raw = {}
+        for i, formula, inputs in self._derived:
+            for col in inputs:
+                if col not in raw:
+                    raw[col] = np.array(
+                        [record.get(col, np.nan) for record in records],
+                        dtype=np.float64,
+                    )
+
+            columns = [raw[col] for col in inputs]
+            present = ~np.any(np.isnan(columns), axis=0)
+            X[present, i] = formula(*columns)[present]
+
+        return X
@@ -0,0 +1,49 @@
+import threading
+from typing import Iterable, List
+
+import numpy as np
+
+
+class FeatureLayout:
+    """
+    Fixed column layout of the model input, compiled once.
+
+    Maps incoming records straight into NumPy rows so the serving hot
+    path never builds a DataFrame. Missing fields are filled with 0,
+    matching the previous reindex(..., fill_value=0) behaviour.
+    """
+
+    def __init__(self, columns: Iterable[str], dtype=np.float64):
+        self.columns: List[str] = list(columns)
+        self.index = {col: i for i, col in enumerate(self.columns)}
+        self.width = len(self.columns)
+        self.dtype = dtype
+        self._local = threading.local()
+
+    def row_buffer(self) -> np.ndarray:
+        # One preallocated (1, width) row per thread
+        buffer = getattr(self._local, "row", None)
+        if buffer is None:
+            buffer = np.zeros((1, self.width), dtype=self.dtype)
+            self._local.row = buffer
+        return buffer
+
+    def fill(self, record: dict, out: np.ndarray) -> np.ndarray:
+        out.fill(0)
+        index = self.index
+        for key, value in record.items():
+            i = index.get(key)
+            if i is not None:
+                out[i] = value
+        return out
+
+    def to_row(self, record: dict) -> np.ndarray:
+        row = self.row_buffer()
+        self.fill(record, row[0])
+        return row
+
+    def to_matrix(self, records: List[dict]) -> np.ndarray:
+        matrix = np.zeros((len(records), self.width), dtype=self.dtype)
+        for record, out in zip(records, matrix):
+            self.fill(record, out)
+        return matrix
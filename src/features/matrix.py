@@ -0,0 +1,86 @@
+import os
+from dataclasses import dataclass
+from typing import List, Tuple
+
+import numpy as np
+import pandas as pd
+
+from src.constants.data_transformation import FEATURE_MATRIX_BLOCK_ROWS
+
+_INT_DTYPES = [np.uint8, np.int16, np.int32]
+
+
+def downcast_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Smallest dtype per column: uint8 for flags / one-hot / small counts,
+    int16 or int32 for other integers, float32 for floats.
+    """
+    casts = {}
+    for col in df.columns:
+        series = df[col]
+        kind = series.dtype.kind
+        if kind == "b":
+            casts[col] = np.uint8
+        elif kind in "iu" and len(series) and not series.hasnans:
+            low, high = series.min(), series.max()
+            for dtype in _INT_DTYPES:
+                info = np.iinfo(dtype)
+                if info.min <= low and high <= info.max:
+                    casts[col] = dtype
+                    break
+        elif kind == "f":
+            casts[col] = np.float32
+
+    casts = {col: dtype for col, dtype in casts.items() if df[col].dtype != dtype}
+    return df.astype(casts) if casts else df
+
+
+@dataclass(frozen=True)
+class FeatureMatrix:
+    """
+    One split as a contiguous float32 feature matrix plus a uint8 target,
+    both .npy files.
+
+    load memory-maps the matrix, so processes fitting on the same split
+    share its pages instead of each holding (or unpickling) a copy. The
+    handle itself is just paths, cheap to send to worker processes.
+    """
+
+    matrix_path: str
+    target_path: str
+    columns: Tuple[str, ...]
+
+    @classmethod
+    def save(
+        cls,
+        df: pd.DataFrame,
+        columns: List[str],
+        target: str,
+        matrix_path: str,
+        target_path: str,
+    ) -> "FeatureMatrix":
+        os.makedirs(os.path.dirname(matrix_path) or ".", exist_ok=True)
+
+        # Written in row blocks straight into the file: no full-size
+        # float32 copy of the frame in memory
+        matrix = np.lib.format.open_memmap(
+            matrix_path, mode="w+", dtype=np.float32, shape=(len(df), len(columns))
+        )
+        features = df[columns]
+        for start in range(0, len(df), FEATURE_MATRIX_BLOCK_ROWS):
+            stop = start + FEATURE_MATRIX_BLOCK_ROWS
+            matrix[start:stop] = features.iloc[start:stop].to_numpy(dtype=np.float32)
+        matrix.flush()
+        del matrix
+
+        np.save(target_path, df[target].to_numpy(dtype=np.uint8))
+        return cls(matrix_path, target_path, tuple(columns))
+
+    def load(self, mmap_mode: str = "r") -> Tuple[pd.DataFrame, np.ndarray]:
+        """(X, y); X wraps the memory-mapped matrix without copying it."""
+        X = np.load(self.matrix_path, mmap_mode=mmap_mode)
+        y = np.load(self.target_path)
+        return pd.DataFrame(X, columns=list(self.columns), copy=False), y
+
+    def nbytes(self) -> int:
+        return os.path.getsize(self.matrix_path) + os.path.getsize(self.target_path)
@@ -0,0 +1,378 @@
+import calendar
+import json
+import os
+import sqlite3
+import threading
+from bisect import bisect_left, bisect_right, insort
+from collections import deque
+from contextlib import contextmanager
+from datetime import datetime
+from operator import itemgetter
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from src.constants.data_transformation import (
+    VELOCITY_KEYS,
+    VELOCITY_WINDOWS,
+    VELOCITY_TIMESTAMP_COLUMN,
+    VELOCITY_AMOUNT_COLUMN,
+    VELOCITY_DEVICE_COLUMN,
+    VELOCITY_ID_COLUMN,
+)
+
+# Per (key, window): transactions, amount sum, distinct devices
+VELOCITY_AGGREGATES = ("Txn_Count", "Amount_Sum", "Distinct_Devices")
+
+
+def velocity_feature_names(keys: Dict[str, str] = VELOCITY_KEYS, windows: Dict[str, int] = VELOCITY_WINDOWS) -> List[str]:
+    return [
+        f"{prefix}_{aggregate}_{label}"
+        for prefix in keys
+        for label in windows
+        for aggregate in VELOCITY_AGGREGATES
+    ]
+
+
+# Raw request fields the velocity features are computed from
+VELOCITY_INPUT_COLUMNS = list(VELOCITY_KEYS.values()) + [
+    VELOCITY_TIMESTAMP_COLUMN,
+    VELOCITY_AMOUNT_COLUMN,
+    VELOCITY_DEVICE_COLUMN,
+]
+
+
+def epoch_seconds(value) -> int:
+    # Naive timestamps are taken as UTC, matching pandas datetime64 -> int64
+    if not isinstance(value, datetime):
+        value = datetime.fromisoformat(str(value))
+    return calendar.timegm(value.utctimetuple())
+
+
+def _normalize(value):
+    # JSON numbers may arrive as 123.0 for an int column
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    return value
+
+
+def _key(prefix: str, value) -> str:
+    return f"{prefix}:{_normalize(value)}"
+
+
+# Events are (epoch seconds, amount, device[, transaction ID]), ordered by time only
+_TIME = itemgetter(0)
+
+
+class _Window:
+    """
+    Running count / amount / device counts over events in (now - seconds, now].
+
+    Events must be added in time order (the sorted backfill replay).
+    """
+
+    __slots__ = ("seconds", "events", "amount", "devices")
+
+    def __init__(self, seconds: int):
+        self.seconds = seconds
+        self.events = deque()
+        self.amount = 0.0
+        self.devices = {}
+
+    def expire(self, now: int) -> None:
+        cutoff = now - self.seconds
+        events, devices = self.events, self.devices
+        while events and events[0][0] <= cutoff:
+            _, amount, device = events.popleft()
+            self.amount -= amount
+            remaining = devices[device] - 1
+            if remaining:
+                devices[device] = remaining
+            else:
+                del devices[device]
+        if not events:
+            # Drop accumulated float error once the window is empty
+            self.amount = 0.0
+
+    def before(self, now: int) -> tuple:
+        """(count, amount sum, distinct devices) of the events strictly before now."""
+        events, devices = self.events, self.devices
+        amount, ties = self.amount, {}
+        i = len(events) - 1
+        while i >= 0 and events[i][0] >= now:
+            _, tie_amount, device = events[i]
+            amount -= tie_amount
+            ties[device] = ties.get(device, 0) + 1
+            i -= 1
+        only_ties = sum(1 for device, count in ties.items() if devices[device] == count)
+        return i + 1, amount if i >= 0 else 0.0, len(devices) - only_ties
+
+    def add(self, event: tuple) -> None:
+        self.events.append(event)
+        self.amount += event[1]
+        self.devices[event[2]] = self.devices.get(event[2], 0) + 1
+
+
+class VelocityStore:
+    """
+    Embedded sqlite store of per-key sliding-window state.
+
+    One row per key (e.g. "Customer:123") holding the events still inside
+    the longest window, so a lookup is a single primary-key read. WAL mode
+    lets several serving workers share the file; read-modify-write runs in
+    an IMMEDIATE transaction so concurrent updates are not lost.
+    """
+
+    def __init__(self, path: str, readonly: bool = False):
+        self.path = path
+        self.readonly = readonly
+        # Re-entrant: get runs on its own and inside transaction
+        self._lock = threading.RLock()
+
+        if readonly:
+            self.conn = sqlite3.connect(
+                f"file:{path}?mode=ro", uri=True, isolation_level=None, check_same_thread=False
+            )
+        else:
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            self.conn = sqlite3.connect(path, isolation_level=None, check_same_thread=False)
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute("PRAGMA synchronous=NORMAL")
+            self.conn.execute(
+                "CREATE TABLE IF NOT EXISTS velocity_state "
+                "(key TEXT PRIMARY KEY, events TEXT NOT NULL) WITHOUT ROWID"
+            )
+
+    @contextmanager
+    def transaction(self, write: bool = True):
+        # IMMEDIATE takes the write lock up front: no other writer can change
+        # the state between this transaction's reads and its writes
+        with self._lock:
+            self.conn.execute("BEGIN IMMEDIATE" if write and not self.readonly else "BEGIN")
+            try:
+                yield self
+                self.conn.execute("COMMIT")
+            except BaseException:
+                self.conn.execute("ROLLBACK")
+                raise
+
+    def get(self, keys: List[str]) -> Dict[str, list]:
+        if not keys:
+            return {}
+        with self._lock:
+            rows = self.conn.execute(
+                f"SELECT key, events FROM velocity_state WHERE key IN ({','.join('?' * len(keys))})",
+                keys,
+            ).fetchall()
+        return {key: json.loads(events) for key, events in rows}
+
+    def put(self, states: Dict[str, list]) -> None:
+        self.conn.executemany(
+            "INSERT INTO velocity_state (key, events) VALUES (?, ?) "
+            "ON CONFLICT(key) DO UPDATE SET events = excluded.events",
+            ((key, json.dumps(events)) for key, events in states.items()),
+        )
+
+    def merge_from(self, path: str) -> int:
+        """Copies keys from another store file that this store does not have yet."""
+        with self._lock:
+            self.conn.execute("ATTACH DATABASE ? AS seed", (path,))
+            try:
+                cursor = self.conn.execute(
+                    "INSERT OR IGNORE INTO velocity_state SELECT key, events FROM seed.velocity_state"
+                )
+                return cursor.rowcount
+            finally:
+                self.conn.execute("DETACH DATABASE seed")
+
+    def __len__(self) -> int:
+        return self.conn.execute("SELECT COUNT(*) FROM velocity_state").fetchone()[0]
+
+    def close(self) -> None:
+        self.conn.close()
+
+
+class VelocityEngine:
+    """
+    Sliding-window velocity aggregates keyed by customer and IP.
+
+    For every transaction and every (key, window) it yields the number of
+    earlier transactions, their amount sum and their distinct devices in
+    the window. Each key keeps one _Window per window length, updated
+    incrementally, so an event costs O(1) amortized.
+
+    backfill computes point-in-time features for a whole history in one
+    pass sorted by transaction time (training, offline scoring). With a
+    store, recording computes the features of a request from the stored
+    state and adds the request to it once it has been scored (serving).
+    """
+
+    def __init__(
+        self,
+        store: Optional[VelocityStore] = None,
+        keys: Dict[str, str] = VELOCITY_KEYS,
+        windows: Dict[str, int] = VELOCITY_WINDOWS,
+    ):
+        self.store = store
+        self.keys = dict(keys)
+        self.windows = dict(windows)
+        self.feature_names = velocity_feature_names(self.keys, self.windows)
+        # State persisted per key: the events of the longest window
+        self._longest = list(self.windows.values()).index(max(self.windows.values()))
+
+        self._stride = len(self.windows) * len(VELOCITY_AGGREGATES)
+        self._states = {}
+        self._last_ts = None
+
+    def _new_state(self) -> list:
+        return [_Window(seconds) for seconds in self.windows.values()]
+
+    @staticmethod
+    def _observe(state: list, event: tuple, out: list) -> None:
+        # Features describe the history before this event, then it joins the windows
+        now = event[0]
+        for window in state:
+            window.expire(now)
+            if window.events and window.events[-1][0] == now:
+                # Same-second transactions earlier in the replay are not history yet
+                out += window.before(now)
+            else:
+                out += (len(window.events), window.amount, len(window.devices))
+        for window in state:
+            window.add(event)
+
+    @staticmethod
+    def _window_features(events: list, now: int, seconds: int) -> tuple:
+        # events sorted by time; the window is (now - seconds, now)
+        start = bisect_right(events, now - seconds, key=_TIME)
+        stop = bisect_left(events, now, lo=start, key=_TIME)
+        window = events[start:stop]
+        return len(window), sum(event[1] for event in window), len({event[2] for event in window})
+
+    # -------------------------
+    # HISTORY (one sorted pass)
+    # -------------------------
+    def backfill(self, df: pd.DataFrame) -> np.ndarray:
+        """Point-in-time features for every row of df, in df's row order."""
+        timestamps = pd.to_datetime(df[VELOCITY_TIMESTAMP_COLUMN]).to_numpy("datetime64[s]").astype(np.int64)
+        order = np.argsort(timestamps, kind="stable")
+
+        features = np.zeros((len(df), len(self.feature_names)), dtype=np.float64)
+        if not len(df):
+            return features
+
+        ts = timestamps[order].tolist()
+        amounts = df[VELOCITY_AMOUNT_COLUMN].to_numpy(dtype=np.float64)[order].tolist()
+        devices = df[VELOCITY_DEVICE_COLUMN].astype(str).to_numpy()[order].tolist()
+        events = list(zip(ts, amounts, devices))
+
+        new_state, observe = self._new_state, self._observe
+        for k, (prefix, column) in enumerate(self.keys.items()):
+            # Raw key values within one column; prefixed only when persisted
+            states = self._states.setdefault(prefix, {})
+            out = []
+            for event, value in zip(events, df[column].to_numpy()[order].tolist()):
+                state = states.get(value)
+                if state is None:
+                    state = states[value] = new_state()
+                observe(state, event, out)
+
+            columns = slice(k * self._stride, (k + 1) * self._stride)
+            features[order, columns] = np.asarray(out, dtype=np.float64).reshape(len(events), self._stride)
+
+        self._last_ts = ts[-1] if self._last_ts is None else max(self._last_ts, ts[-1])
+        return features
+
+    def save(self, store: VelocityStore) -> int:
+        """Writes the in-memory state to store, dropping keys idle for a full window."""
+        states = {}
+        for prefix, prefix_states in self._states.items():
+            for value, state in prefix_states.items():
+                longest = state[self._longest]
+                longest.expire(self._last_ts)
+                if longest.events:
+                    states[_key(prefix, value)] = list(longest.events)
+
+        with store.transaction():
+            store.put(states)
+        return len(states)
+
+    # -------------------------
+    # SERVING (store-backed)
+    # -------------------------
+    def _request_events(self, records: List[dict]):
+        # (event, store keys) per record; serving events carry the transaction ID
+        for record in records:
+            event = (
+                epoch_seconds(record[VELOCITY_TIMESTAMP_COLUMN]),
+                float(record[VELOCITY_AMOUNT_COLUMN]),
+                str(record[VELOCITY_DEVICE_COLUMN]),
+                _normalize(record.get(VELOCITY_ID_COLUMN)),
+            )
+            yield event, [_key(prefix, record[column]) for prefix, column in self.keys.items()]
+
+    def _load_states(self, requests: list) -> Dict[str, list]:
+        wanted = sorted({key for _, row_keys in requests for key in row_keys})
+        stored = self.store.get(wanted)
+        return {key: sorted(map(tuple, stored.get(key, [])), key=_TIME) for key in wanted}
+
+    def _features(self, requests: list, states: Dict[str, list]) -> List[dict]:
+        # Works on copies: the batch's own events only count for its later records
+        states = {key: list(state) for key, state in states.items()}
+        windows = list(self.windows.values())
+
+        features = [[] for _ in requests]
+        for (event, row_keys), out in zip(requests, features):
+            for key in row_keys:
+                state = states[key]
+                for seconds in windows:
+                    out += self._window_features(state, event[0], seconds)
+                insort(state, event, key=_TIME)
+
+        names = self.feature_names
+        return [dict(zip(names, map(float, row))) for row in features]
+
+    def _record(self, requests: list, states: Dict[str, list]) -> None:
+        # A Transaction ID already stored for a key (a retried request) is skipped
+        longest = max(self.windows.values())
+        for event, row_keys in requests:
+            txn_id = event[3]
+            for key in row_keys:
+                state = states[key]
+                if txn_id is not None and any(len(e) > 3 and e[3] == txn_id for e in state):
+                    continue
+                insort(state, event, key=_TIME)
+
+        # Only what the longest window of the newest event still covers
+        self.store.put({
+            key: [event for event in state if event[0] > state[-1][0] - longest]
+            for key, state in states.items()
+        })
+
+    @contextmanager
+    def recording(self, records: List[dict], persist: bool = True):
+        """
+        Yields the velocity features of each record (in order) and records
+        the records into the store when the block exits without an error.
+
+        Lookup, the caller's scoring and the write are one IMMEDIATE
+        transaction, so concurrent workers scoring the same key see each
+        other's events and a failed request records nothing. Requests can
+        arrive out of time order: each key's events are kept sorted and a
+        record only counts events strictly before its own timestamp.
+        Earlier records of the same call count for later ones.
+        """
+        requests = list(self._request_events(records))
+        persist = persist and not self.store.readonly
+
+        with self.store.transaction(write=persist):
+            states = self._load_states(requests)
+            yield self._features(requests, states)
+            if persist:
+                self._record(requests, states)
+
+    def lookup(self, records: List[dict]) -> List[dict]:
+        """Velocity features for each record (in order); the store is not changed."""
+        with self.recording(records, persist=False) as features:
+            return features
@@ -0,0 +1,266 @@
+import pickle
+import time
+from dataclasses import dataclass, field
+from functools import partial
+from typing import Any, Callable, Dict, Optional
+
+import numpy as np
+
+from sklearn.experimental import enable_halving_search_cv  # noqa: F401
+from sklearn.model_selection import HalvingRandomSearchCV, StratifiedKFold
+from sklearn.ensemble import RandomForestClassifier, HistGradientBoostingClassifier
+from sklearn.preprocessing import StandardScaler
+from sklearn.pipeline import Pipeline
+from sklearn.metrics import f1_score, fbeta_score, make_scorer
+from imblearn.pipeline import Pipeline as ImbPipeline
+
+from src.constants.data_transformation import ONE_HOT_COLUMNS
+from src.constants.model_trainer import (
+    RANDOM_STATE,
+    HGB_MAX_ITER,
+    HGB_N_ITER_NO_CHANGE,
+    HGB_VALIDATION_FRACTION,
+    PREDICT_LATENCY_REPEATS,
+    MODEL_TRAINER_ENABLE_SEARCH,
+    SEARCH_CV_FOLDS,
+    SEARCH_HALVING_FACTOR,
+    SEARCH_N_CANDIDATES,
+    SEARCH_SCORING_BETA,
+    IMBALANCE_STRATEGIES,
+    THRESHOLD_CV_FOLDS,
+)
+from src.models import categorical, imbalance
+from src.models.categorical import OneHotCollapser
+from src.features.matrix import FeatureMatrix
+from src.utils.cache import hash_file, hash_object
+from src.utils.profiling import peak_rss_mb, reset_peak_rss
+
+# Fit/finalize code is part of every cache key: editing it refits
+CODE_VERSION = hash_object([
+    hash_file(__file__), hash_file(categorical.__file__), hash_file(imbalance.__file__)
+])
+
+
+@dataclass
+class ModelCandidate:
+    """
+    A model the trainer can fit.
+
+    build returns a fresh unfitted estimator; search_space (estimator param
+    name -> values) enables successive-halving search; finalize turns the
+    fitted estimator into the model that is pickled and served; tags are
+    logged as MLflow params next to the candidate's metrics.
+    """
+
+    name: str
+    build: Callable[[], Any]
+    search_space: Dict[str, list] = field(default_factory=dict)
+    finalize: Optional[Callable[[Any], Any]] = None
+    tags: Dict[str, str] = field(default_factory=dict)
+
+    def cache_key(self, data_version: str) -> str:
+        return hash_object({
+            "name": self.name,
+            "params": self.build().get_params(deep=True),
+            "search_space": self.search_space if MODEL_TRAINER_ENABLE_SEARCH else {},
+            "search": [SEARCH_CV_FOLDS, SEARCH_HALVING_FACTOR, SEARCH_N_CANDIDATES, SEARCH_SCORING_BETA],
+            "data_version": data_version,
+            "code_version": CODE_VERSION,
+        })
+
+
+MODEL_CANDIDATES: Dict[str, ModelCandidate] = {}
+
+
+def register_candidate(candidate: ModelCandidate) -> ModelCandidate:
+    MODEL_CANDIDATES[candidate.name] = candidate
+    return candidate
+
+
+# =========================
+# Built-in candidates
+# =========================
+def build_random_forest():
+    # Single-threaded: candidates already run in parallel processes
+    return RandomForestClassifier(
+        n_estimators=200,
+        max_depth=None,
+        random_state=RANDOM_STATE,
+        n_jobs=1,
+    )
+
+
+def build_linear_model(strategy: str):
+    # Resampling inside the pipeline only touches the training folds.
+    # Scales in place: the fold copies CV makes are not copied again
+    resampler, model = imbalance.STRATEGY_BUILDERS[strategy]()
+    steps = [("scaler", StandardScaler(copy=False))]
+    if resampler is not None:
+        steps.append(("resample", resampler))
+    steps.append(("model", model))
+    return ImbPipeline(steps)
+
+
+def build_hist_gradient_boosting():
+    # Collapser puts one code column per categorical first, in ONE_HOT_COLUMNS order
+    return Pipeline([
+        ("collapse", OneHotCollapser(ONE_HOT_COLUMNS)),
+        ("model", HistGradientBoostingClassifier(
+            categorical_features=list(range(len(ONE_HOT_COLUMNS))),
+            max_iter=HGB_MAX_ITER,
+            early_stopping=True,
+            validation_fraction=HGB_VALIDATION_FRACTION,
+            n_iter_no_change=HGB_N_ITER_NO_CHANGE,
+            random_state=RANDOM_STATE,
+        )),
+    ])
+
+
+def finalize_linear_model(pipeline):
+    # Resampling is fit-time only; serve a plain sklearn scaler +
+    # LogisticRegression Pipeline that leaves the caller's rows untouched
+    steps = []
+    for name, step in pipeline.steps:
+        if name == "resample":
+            continue
+        if hasattr(step, "to_logistic"):
+            step = step.to_logistic()
+        steps.append((name, step))
+    return Pipeline(steps).set_params(scaler__copy=True)
+
+
+register_candidate(ModelCandidate(
+    name="RandomForest",
+    build=build_random_forest,
+    search_space={
+        "max_depth": [None, 12, 24],
+        "min_samples_leaf": [1, 3, 10],
+        "max_features": ["sqrt", 0.5],
+    },
+))
+
+for strategy in IMBALANCE_STRATEGIES:
+    register_candidate(ModelCandidate(
+        name=f"LogisticRegression_{strategy}",
+        build=partial(build_linear_model, strategy),
+        search_space={"model__C": [0.01, 0.1, 1.0, 10.0]},
+        finalize=finalize_linear_model,
+        tags={"imbalance_strategy": strategy},
+    ))
+
+register_candidate(ModelCandidate(
+    name="HistGradientBoosting",
+    build=build_hist_gradient_boosting,
+    search_space={
+        "model__learning_rate": [0.05, 0.1, 0.2],
+        "model__max_leaf_nodes": [15, 31, 63],
+        "model__l2_regularization": [0.0, 1.0],
+    },
+))
+
+
+def strip_feature_names(model):
+    """
+    Drops the column names recorded at fit time.
+
+    Served models are always fed NumPy rows in feature order (serving,
+    batch scoring, evaluation); without fit-time names sklearn has no
+    reason to warn about them.
+    """
+    steps = [step for _, step in model.steps] if hasattr(model, "steps") else [model]
+    for step in steps:
+        if hasattr(step, "feature_names_in_"):
+            del step.feature_names_in_
+    return model
+
+
+# =========================
+# Fitting (runs in worker processes)
+# =========================
+def predict_latency_ms(model, X, repeats: int = PREDICT_LATENCY_REPEATS) -> float:
+    """Median single-row predict_proba latency, fed a NumPy row as in serving."""
+    row = np.asarray(X[:1], dtype=np.float64)
+    model.predict_proba(row)
+
+    timings = np.empty(repeats)
+    for i in range(repeats):
+        start = time.perf_counter()
+        model.predict_proba(row)
+        timings[i] = time.perf_counter() - start
+
+    return float(np.median(timings) * 1000)
+
+
+def fit_candidate(name: str, train: FeatureMatrix, test: FeatureMatrix) -> dict:
+    # Memory-mapped: every worker shares the page cache copy of the data
+    reset_peak_rss()
+    X_train, y_train = train.load()
+    X_test, y_test = test.load()
+
+    candidate = MODEL_CANDIDATES[name]
+    estimator = candidate.build()
+    best_params = {}
+
+    start = time.perf_counter()
+
+    if MODEL_TRAINER_ENABLE_SEARCH and candidate.search_space:
+        # Successive halving: many configs on few rows, survivors on more.
+        # "exhaust" sizes the first round so the last one uses every row
+        # (the default starts from a handful, too few fraud cases to score)
+        search = HalvingRandomSearchCV(
+            estimator,
+            candidate.search_space,
+            n_candidates=SEARCH_N_CANDIDATES,
+            factor=SEARCH_HALVING_FACTOR,
+            min_resources="exhaust",
+            cv=SEARCH_CV_FOLDS,
+            scoring=make_scorer(fbeta_score, beta=SEARCH_SCORING_BETA),
+            random_state=RANDOM_STATE,
+        )
+        search.fit(X_train, y_train)
+        estimator = search.best_estimator_
+        best_params = search.best_params_
+    else:
+        estimator.fit(X_train, y_train)
+
+    fit_seconds = time.perf_counter() - start
+
+    model = strip_feature_names(candidate.finalize(estimator) if candidate.finalize else estimator)
+    X_test = X_test.to_numpy()
+    predictions = model.predict(X_test)
+
+    return {
+        "model": model,
+        # Selection score (at the default 0.5 threshold)
+        "score": float(fbeta_score(y_test, predictions, beta=SEARCH_SCORING_BETA)),
+        "f1_score": float(f1_score(y_test, predictions)),
+        "f2_score": float(fbeta_score(y_test, predictions, beta=2)),
+        "fit_seconds": fit_seconds,
+        "best_params": best_params,
+        "model_size_bytes": len(pickle.dumps(model)),
+        "predict_latency_ms": predict_latency_ms(model, X_test),
+        # This worker's peak during the fit (lifetime peak where it cannot be reset)
+        "peak_rss_mb": round(peak_rss_mb(), 1),
+    }
+
+
+def out_of_fold_probabilities(name: str, train: FeatureMatrix, best_params: dict) -> np.ndarray:
+    """
+    Fraud probability of every training row from a model that did not see it.
+
+    The candidate is rebuilt with its selected params, fitted and finalized
+    per fold exactly like the served model, so evaluation can tune the
+    decision threshold without touching the test split.
+    """
+    X_train, y_train = train.load()
+    candidate = MODEL_CANDIDATES[name]
+    folds = StratifiedKFold(THRESHOLD_CV_FOLDS, shuffle=True, random_state=RANDOM_STATE)
+
+    probabilities = np.empty(len(y_train), dtype=np.float64)
+    for fit_rows, predict_rows in folds.split(X_train, y_train):
+        estimator = candidate.build().set_params(**best_params)
+        estimator.fit(X_train.iloc[fit_rows], y_train[fit_rows])
+        model = strip_feature_names(candidate.finalize(estimator) if candidate.finalize else estimator)
+        probabilities[predict_rows] = model.predict_proba(X_train.iloc[predict_rows].to_numpy())[:, 1]
+
+    return probabilities
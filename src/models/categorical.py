@@ -0,0 +1,54 @@
+from typing import List
+
+import numpy as np
+from sklearn.base import BaseEstimator, TransformerMixin
+
+
+class OneHotCollapser(BaseEstimator, TransformerMixin):
+    """
+    Folds the one-hot blocks of the transformed tables back into one
+    integer code per categorical column.
+
+    Codes come first in the output (one per column in `columns`, 0 for the
+    dropped/unknown category, 1..k for the dummies), followed by the
+    remaining features in their original order. Models with native
+    categorical support can then treat the first len(columns) features as
+    categorical instead of splitting on dozens of sparse dummies.
+
+    Block positions are learned from the column names at fit time and
+    applied by position afterwards, so plain NumPy rows work at serving.
+    """
+
+    def __init__(self, columns: List[str]):
+        self.columns = columns
+
+    def fit(self, X, y=None):
+        if not hasattr(X, "columns"):
+            raise ValueError("OneHotCollapser must be fitted on a DataFrame with feature names")
+        names = list(X.columns)
+
+        self.blocks_ = [
+            [i for i, name in enumerate(names) if name.startswith(f"{col}_")]
+            for col in self.columns
+        ]
+        in_blocks = {i for block in self.blocks_ for i in block}
+        self.passthrough_ = [i for i in range(len(names)) if i not in in_blocks]
+        self.n_features_in_ = len(names)
+        return self
+
+    def transform(self, X):
+        # Any input dtype (float32 training matrices included) is read
+        # column by column into one float64 output, without a converted copy
+        X = np.asarray(X)
+        n_codes = len(self.blocks_)
+
+        out = np.zeros((X.shape[0], n_codes + len(self.passthrough_)), dtype=np.float64)
+        for j, block in enumerate(self.blocks_):
+            if block:
+                # Exclusive dummies: weighted sum is the 1-based category
+                out[:, j] = X[:, block] @ np.arange(1, len(block) + 1)
+
+        for j, i in enumerate(self.passthrough_, start=n_codes):
+            out[:, j] = X[:, i]
+
+        return out
@@ -0,0 +1,188 @@
+import os
+from typing import Dict, Optional
+
+import numpy as np
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.linear_model import LogisticRegression
+from sklearn.pipeline import Pipeline
+from sklearn.preprocessing import StandardScaler
+
+from src.constants.serving import COMPACT_MANIFEST_FILE_NAME, COMPACT_ROW_BLOCK
+from src.utils import read_yaml_file, write_yaml_file
+
+
+class CompactModel:
+    """
+    Array-only inference form of a trained binary classifier.
+
+    kind="forest": every tree of a RandomForest flattened into shared node
+    tables (feature, threshold, left, right, missing_left, value) with
+    global child indices; rows walk all trees at once, one depth level per
+    step. kind="linear": StandardScaler folded into LogisticRegression
+    weights.
+
+    Saved as one .npy file per array plus a small manifest, so load() can
+    memory-map them and every worker process shares the same pages.
+    """
+
+    def __init__(self, kind: str, arrays: Dict[str, np.ndarray], n_features: int, max_depth: int = 0):
+        self.kind = kind
+        self.arrays = arrays
+        self.n_features = n_features
+        self.max_depth = max_depth
+        for name, array in arrays.items():
+            setattr(self, name, array)
+
+    # =========================
+    # Conversion
+    # =========================
+    @classmethod
+    def from_model(cls, model) -> Optional["CompactModel"]:
+        """Compact form of a supported model, None otherwise."""
+        if isinstance(model, RandomForestClassifier) and len(model.classes_) == 2:
+            return cls._from_forest(model)
+
+        if (
+            isinstance(model, Pipeline)
+            and [type(step) for _, step in model.steps] == [StandardScaler, LogisticRegression]
+            and len(model[-1].classes_) == 2
+        ):
+            return cls._from_linear(model[0], model[-1])
+
+        return None
+
+    @classmethod
+    def _from_forest(cls, forest: RandomForestClassifier) -> "CompactModel":
+        parts = {name: [] for name in ("feature", "threshold", "left", "right", "missing_left", "value")}
+        roots = []
+        offset = 0
+
+        for estimator in forest.estimators_:
+            tree = estimator.tree_
+            is_leaf = tree.children_left < 0
+
+            roots.append(offset)
+            parts["feature"].append(np.where(is_leaf, -1, tree.feature))
+            parts["threshold"].append(tree.threshold)
+            parts["left"].append(np.where(is_leaf, -1, tree.children_left + offset))
+            parts["right"].append(np.where(is_leaf, -1, tree.children_right + offset))
+            parts["missing_left"].append(
+                getattr(tree, "missing_go_to_left", np.zeros(tree.node_count)).astype(bool)
+            )
+
+            # Leaf class-1 probability, as each tree's predict_proba
+            counts = tree.value[:, 0, :]
+            parts["value"].append(counts[:, 1] / np.maximum(counts.sum(axis=1), 1e-12))
+
+            offset += tree.node_count
+
+        arrays = {
+            "feature": np.concatenate(parts["feature"]).astype(np.int32),
+            "threshold": np.concatenate(parts["threshold"]).astype(np.float64),
+            "left": np.concatenate(parts["left"]).astype(np.int32),
+            "right": np.concatenate(parts["right"]).astype(np.int32),
+            "missing_left": np.concatenate(parts["missing_left"]),
+            "value": np.concatenate(parts["value"]).astype(np.float64),
+            "roots": np.asarray(roots, dtype=np.int32),
+        }
+        max_depth = max(estimator.tree_.max_depth for estimator in forest.estimators_)
+        return cls("forest", arrays, forest.n_features_in_, max_depth)
+
+    @classmethod
+    def _from_linear(cls, scaler: StandardScaler, model: LogisticRegression) -> "CompactModel":
+        mean = scaler.mean_ if scaler.with_mean else 0.0
+        scale = scaler.scale_ if scaler.with_std else 1.0
+
+        coef = model.coef_[0] / scale
+        intercept = model.intercept_[0] - np.sum(coef * mean)
+
+        arrays = {
+            "coef": np.ascontiguousarray(coef, dtype=np.float64),
+            "intercept": np.asarray([intercept], dtype=np.float64),
+        }
+        return cls("linear", arrays, model.n_features_in_)
+
+    # =========================
+    # Persistence
+    # =========================
+    def save(self, directory: str) -> None:
+        os.makedirs(directory, exist_ok=True)
+        for name, array in self.arrays.items():
+            np.save(os.path.join(directory, f"{name}.npy"), np.ascontiguousarray(array))
+
+        write_yaml_file(
+            os.path.join(directory, COMPACT_MANIFEST_FILE_NAME),
+            {
+                "kind": self.kind,
+                "n_features": int(self.n_features),
+                "max_depth": int(self.max_depth),
+                "arrays": list(self.arrays),
+            },
+            replace=True,
+        )
+
+    @classmethod
+    def load(cls, directory: str, mmap_mode: Optional[str] = "r") -> "CompactModel":
+        manifest = read_yaml_file(os.path.join(directory, COMPACT_MANIFEST_FILE_NAME))
+        arrays = {
+            name: np.load(os.path.join(directory, f"{name}.npy"), mmap_mode=mmap_mode)
+            for name in manifest["arrays"]
+        }
+        return cls(manifest["kind"], arrays, manifest["n_features"], manifest["max_depth"])
+
+    # =========================
+    # Inference
+    # =========================
+    def _forest_proba(self, X: np.ndarray) -> np.ndarray:
+        # Trees split on float32 features, as sklearn does
+        X = X.astype(np.float32, copy=False)
+        rows = np.arange(len(X))[:, None]
+        nodes = np.broadcast_to(self.roots, (len(X), len(self.roots))).copy()
+
+        for _ in range(self.max_depth):
+            feature = self.feature[nodes]
+            leaf = feature < 0
+            if leaf.all():
+                break
+
+            values = X[rows, np.where(leaf, 0, feature)]
+            go_left = np.where(
+                np.isnan(values), self.missing_left[nodes], values <= self.threshold[nodes]
+            )
+            nodes = np.where(
+                leaf, nodes, np.where(go_left, self.left[nodes], self.right[nodes])
+            )
+
+        return self.value[nodes].mean(axis=1)
+
+    def _linear_proba(self, X: np.ndarray) -> np.ndarray:
+        return 1.0 / (1.0 + np.exp(-(X @ self.coef + self.intercept[0])))
+
+    def predict_proba(self, X) -> np.ndarray:
+        X = np.asarray(X, dtype=np.float64)
+        if X.ndim == 1:
+            X = X[None, :]
+
+        if self.kind == "linear":
+            probs = self._linear_proba(X)
+        else:
+            # Bounded (rows x trees) node matrix per block
+            probs = np.concatenate([
+                self._forest_proba(X[start:start + COMPACT_ROW_BLOCK])
+                for start in range(0, len(X), COMPACT_ROW_BLOCK)
+            ]) if len(X) else np.empty(0)
+
+        return np.column_stack([1.0 - probs, probs])
+
+    def predict(self, X) -> np.ndarray:
+        # As sklearn's argmax: a 0.5 tie is class 0
+        return (self.predict_proba(X)[:, 1] > 0.5).astype(int)
+
+
+def max_proba_difference(model, compact: CompactModel, X) -> float:
+    """Largest |p(fraud)| gap between the original and the compact model."""
+    X = np.asarray(X, dtype=np.float64)
+    return float(np.max(
+        np.abs(model.predict_proba(X)[:, 1] - compact.predict_proba(X)[:, 1]),
+        initial=0.0,
+    ))
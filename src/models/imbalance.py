@@ -0,0 +1,185 @@
+import math
+from typing import Callable, Dict, Optional, Tuple
+
+import numpy as np
+from imblearn.over_sampling import SMOTE
+from imblearn.over_sampling.base import BaseOverSampler
+from scipy.special import expit
+from sklearn.base import BaseEstimator, ClassifierMixin
+from sklearn.linear_model import LogisticRegression
+from sklearn.neighbors import NearestNeighbors
+from sklearn.utils import check_random_state
+from sklearn.utils.validation import check_array, check_is_fitted, check_X_y
+
+from src.constants.model_trainer import (
+    RANDOM_STATE,
+    IMBALANCE_ENSEMBLE_SIZE,
+    IMBALANCE_SMOTE_CHUNK_ROWS,
+    IMBALANCE_SMOTE_K_NEIGHBORS,
+)
+
+
+class ChunkedSMOTE(BaseOverSampler):
+    """
+    SMOTE with neighbours searched inside random chunks of the class.
+
+    Each class to oversample is shuffled and split into chunks of at most
+    chunk_size rows; synthetic rows interpolate between a row and one of
+    its k nearest neighbours within the same chunk. The k-NN index never
+    holds more than chunk_size rows, so time and memory grow linearly with
+    the class size, at the cost of approximate neighbours. Synthetic rows
+    keep the input dtype (float32 stays float32).
+    """
+
+    def __init__(
+        self,
+        sampling_strategy="auto",
+        k_neighbors: int = 5,
+        chunk_size: int = 20_000,
+        random_state=None,
+    ):
+        super().__init__(sampling_strategy=sampling_strategy)
+        self.k_neighbors = k_neighbors
+        self.chunk_size = chunk_size
+        self.random_state = random_state
+
+    def _fit_resample(self, X, y):
+        rng = check_random_state(self.random_state)
+        X_parts, y_parts = [X], [y]
+
+        for label, n_samples in self.sampling_strategy_.items():
+            rows = np.flatnonzero(y == label)
+            if n_samples == 0 or len(rows) < 2:
+                continue
+
+            rows = rows[rng.permutation(len(rows))]
+            chunks = np.array_split(rows, math.ceil(len(rows) / self.chunk_size))
+            # Synthetic rows per chunk, proportional to its size
+            bounds = np.round(np.linspace(0, n_samples, len(chunks) + 1)).astype(int)
+
+            for chunk, n_new in zip(chunks, np.diff(bounds)):
+                if n_new == 0:
+                    continue
+                X_chunk = X[chunk]
+                k = min(self.k_neighbors, len(chunk) - 1)
+                neighbors = NearestNeighbors(n_neighbors=k + 1).fit(X_chunk).kneighbors(
+                    X_chunk, return_distance=False
+                )[:, 1:]
+
+                base = rng.randint(len(chunk), size=n_new)
+                other = neighbors[base, rng.randint(k, size=n_new)]
+                step = rng.uniform(size=(n_new, 1)).astype(X.dtype, copy=False)
+
+                X_parts.append(X_chunk[base] + step * (X_chunk[other] - X_chunk[base]))
+                y_parts.append(np.full(n_new, label, dtype=y.dtype))
+
+        return np.vstack(X_parts), np.concatenate(y_parts)
+
+
+class BalancedLogisticEnsemble(ClassifierMixin, BaseEstimator):
+    """
+    Logistic regressions on balanced undersamples, averaged in log-odds.
+
+    Each member sees every minority row and an equal-size random draw of
+    the majority class, so a fit touches 2x the minority rows rather than
+    the whole (or an oversampled) training set. Members are combined by
+    averaging coefficients, i.e. their decision functions: the ensemble is
+    itself one linear model and to_logistic exports it as a plain
+    LogisticRegression for serving.
+    """
+
+    def __init__(
+        self,
+        C: float = 1.0,
+        n_estimators: int = 10,
+        max_iter: int = 1000,
+        random_state=None,
+    ):
+        self.C = C
+        self.n_estimators = n_estimators
+        self.max_iter = max_iter
+        self.random_state = random_state
+
+    def fit(self, X, y):
+        X, y = check_X_y(X, y, dtype=[np.float64, np.float32])
+        self.n_features_in_ = X.shape[1]
+        self.classes_, counts = np.unique(y, return_counts=True)
+        if len(self.classes_) != 2:
+            raise ValueError("BalancedLogisticEnsemble supports binary targets only")
+
+        rng = check_random_state(self.random_state)
+        minority = np.flatnonzero(y == self.classes_[np.argmin(counts)])
+        majority = np.flatnonzero(y == self.classes_[np.argmax(counts)])
+
+        coefs, intercepts = [], []
+        for _ in range(self.n_estimators):
+            rows = np.concatenate([
+                minority,
+                rng.choice(majority, size=min(len(minority), len(majority)), replace=False),
+            ])
+            member = LogisticRegression(C=self.C, max_iter=self.max_iter).fit(X[rows], y[rows])
+            coefs.append(member.coef_)
+            intercepts.append(member.intercept_)
+
+        self.coef_ = np.mean(coefs, axis=0)
+        self.intercept_ = np.mean(intercepts, axis=0)
+        return self
+
+    def decision_function(self, X) -> np.ndarray:
+        check_is_fitted(self, "coef_")
+        X = check_array(X, dtype=[np.float64, np.float32])
+        return X @ self.coef_[0] + self.intercept_[0]
+
+    def predict_proba(self, X) -> np.ndarray:
+        positive = expit(self.decision_function(X))
+        return np.column_stack([1 - positive, positive])
+
+    def predict(self, X) -> np.ndarray:
+        return self.classes_[(self.decision_function(X) > 0).astype(int)]
+
+    def to_logistic(self) -> LogisticRegression:
+        model = LogisticRegression(C=self.C, max_iter=self.max_iter)
+        for attr in ("coef_", "intercept_", "classes_", "n_features_in_", "feature_names_in_"):
+            if hasattr(self, attr):
+                setattr(model, attr, getattr(self, attr))
+        model.n_iter_ = np.zeros(1, dtype=np.int32)
+        return model
+
+
+# =========================
+# Strategies
+# =========================
+# name -> () -> (resampler or None, classifier) for the linear candidates
+
+def smote_strategy():
+    return SMOTE(random_state=RANDOM_STATE), LogisticRegression(max_iter=1000)
+
+
+def class_weight_strategy():
+    # No resampling: errors on fraud rows weigh n_legit / n_fraud more
+    return None, LogisticRegression(max_iter=1000, class_weight="balanced")
+
+
+def undersample_ensemble_strategy():
+    return None, BalancedLogisticEnsemble(
+        n_estimators=IMBALANCE_ENSEMBLE_SIZE, random_state=RANDOM_STATE
+    )
+
+
+def chunked_smote_strategy():
+    return (
+        ChunkedSMOTE(
+            k_neighbors=IMBALANCE_SMOTE_K_NEIGHBORS,
+            chunk_size=IMBALANCE_SMOTE_CHUNK_ROWS,
+            random_state=RANDOM_STATE,
+        ),
+        LogisticRegression(max_iter=1000),
+    )
+
+
+STRATEGY_BUILDERS: Dict[str, Callable[[], Tuple[Optional[object], object]]] = {
+    "smote": smote_strategy,
+    "class_weight": class_weight_strategy,
+    "undersample_ensemble": undersample_ensemble_strategy,
+    "chunked_smote": chunked_smote_strategy,
+}
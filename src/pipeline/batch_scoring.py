@@ -0,0 +1,213 @@
+"""
+Offline bulk scoring with the registered fraud_detector model.
+
+    python -m src.pipeline.batch_scoring --input data.parquet --output scores.parquet
+
+Input may be CSV, Parquet or JSONL. It is streamed in chunks and every
+chunk is validated against the model's schema, as serving requests are.
+Valid rows are scored in a process pool with one vectorized predict_proba
+call per chunk; invalid rows are written with their violated rules
+instead of a score. Output rows keep the input order.
+
+Velocity features are computed in the main process over the input itself,
+as one history carried across chunks (exact when the input is in time
+order); the live serving store is not read or written.
+"""
+
+import argparse
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import bentoml
+import numpy as np
+import pandas as pd
+
+from src.logger import logger
+from src.exception import CustomException
+from src.constants.batch_scoring import (
+    BATCH_SCORING_CHUNK_SIZE,
+    BATCH_SCORING_N_WORKERS,
+    BATCH_SCORING_MAX_PENDING_PER_WORKER,
+    BATCH_SCORING_ID_COLUMNS,
+)
+from src.constants.serving import MODEL_TAG, DEFAULT_THRESHOLD
+from src.constants.training_pipeline import SCHEMA_FILE_PATH, TARGET_COLUMN
+from src.features.engineering import FeatureEngineer
+from src.features.velocity import VelocityEngine
+from src.serving.model import load_served_model
+from src.utils import iter_dataframe_chunks, read_yaml_file, DataFrameChunkWriter
+from src.validation.request import request_schema
+from src.validation.schema import SchemaValidator, VIOLATIONS_COLUMN
+
+# Per-process model state, filled once by load_scoring_model
+_state = {}
+
+
+def load_scoring_model(model_tag: str = MODEL_TAG) -> None:
+    if _state.get("tag") == model_tag:
+        return
+
+    model_ref = bentoml.models.get(model_tag)
+    metadata = model_ref.info.metadata
+    features = [col for col in metadata["features"] if col != TARGET_COLUMN]
+
+    feature_engineer = FeatureEngineer.from_metadata(metadata, columns=features)
+    # Schema the model was trained against (older models: repo schema)
+    schema = metadata.get("schema") or read_yaml_file(SCHEMA_FILE_PATH)
+
+    _state.update(
+        tag=model_tag,
+        model=load_served_model(model_ref),
+        features=features,
+        threshold=metadata.get("threshold", DEFAULT_THRESHOLD),
+        feature_engineer=feature_engineer,
+        # File semantics (numbers may be text); fields the model reads are required
+        validator=SchemaValidator(request_schema(schema, feature_engineer.input_columns)),
+    )
+
+
+def validate_chunk(chunk: pd.DataFrame):
+    """(valid rows typed like the training data, output frame of the chunk)."""
+    validator = _state["validator"]
+
+    # Absent fields are null, so a missing required field is a row error
+    chunk = chunk.reset_index(drop=True)
+    chunk = chunk.reindex(columns=chunk.columns.union(list(validator.columns), sort=False))
+    valid, invalid, _ = validator.validate(chunk)
+
+    output = chunk[[c for c in BATCH_SCORING_ID_COLUMNS if c in chunk.columns]].copy()
+    output[VIOLATIONS_COLUMN] = invalid[VIOLATIONS_COLUMN].reindex(output.index).astype("string")
+    return valid, output
+
+
+def score_chunk(valid: pd.DataFrame, output: pd.DataFrame) -> pd.DataFrame:
+    """Fills the scores of the valid rows into output; invalid rows stay empty."""
+    feature_engineer = _state["feature_engineer"]
+    probs = np.full(len(output), np.nan)
+
+    if len(valid):
+        if feature_engineer.encoder is not None:
+            features = feature_engineer.transform_frame(valid, filter_rows=False)
+            missing = [col for col in _state["features"] if col not in features.columns]
+            if missing:
+                raise ValueError(f"Feature engineering did not produce model columns {missing}")
+            X = features[_state["features"]].to_numpy(dtype=float)
+        else:
+            X = feature_engineer.transform_records(valid.to_dict("records"))
+
+        probs[valid.index] = _state["model"].predict_proba(X)[:, 1]
+
+    # Scores first, the violated rules (empty for scored rows) last
+    violations = output.pop(VIOLATIONS_COLUMN)
+    output["fraud_probability"] = probs
+    output["threshold"] = _state["threshold"]
+    output["is_fraud"] = pd.Series(probs >= _state["threshold"], dtype="Int64").mask(np.isnan(probs))
+    output[VIOLATIONS_COLUMN] = violations
+    return output
+
+
+class BatchScoringPipeline:
+    def __init__(
+        self,
+        input_path: str,
+        output_path: str,
+        model_tag: str = MODEL_TAG,
+        chunk_size: int = BATCH_SCORING_CHUNK_SIZE,
+        n_workers: int = BATCH_SCORING_N_WORKERS,
+    ):
+        self.input_path = input_path
+        self.output_path = output_path
+        self.model_tag = model_tag
+        self.chunk_size = chunk_size
+        self.n_workers = n_workers
+
+    def run_pipeline(self) -> dict:
+        try:
+            logger.info(
+                f"Batch scoring {self.input_path} -> {self.output_path} "
+                f"with {self.model_tag}, {self.n_workers} workers"
+            )
+
+            # Loaded once here; forked workers inherit it
+            load_scoring_model(self.model_tag)
+
+            start = time.perf_counter()
+            rows = invalid_rows = 0
+
+            chunks = iter_dataframe_chunks(self.input_path, self.chunk_size)
+            velocity = VelocityEngine() if _state["feature_engineer"].velocity_features else None
+            max_pending = self.n_workers * BATCH_SCORING_MAX_PENDING_PER_WORKER
+
+            with DataFrameChunkWriter(self.output_path) as writer, ProcessPoolExecutor(
+                max_workers=self.n_workers,
+                initializer=load_scoring_model,
+                initargs=(self.model_tag,),
+            ) as executor:
+                pending = deque()
+
+                for chunk in chunks:
+                    valid, output = validate_chunk(chunk)
+                    invalid_rows += len(output) - len(valid)
+
+                    if velocity is not None and len(valid):
+                        # Stateful, so sequential: workers get the finished columns.
+                        # Invalid rows never enter the windows, as in serving
+                        valid[velocity.feature_names] = velocity.backfill(valid)
+                    pending.append(executor.submit(score_chunk, valid, output))
+
+                    # Bounded window, written back in submission order
+                    if len(pending) >= max_pending:
+                        rows += self._write(writer, pending.popleft().result(), rows, start)
+
+                while pending:
+                    rows += self._write(writer, pending.popleft().result(), rows, start)
+
+            elapsed = time.perf_counter() - start
+            summary = {
+                "rows": rows,
+                "invalid_rows": invalid_rows,
+                "seconds": round(elapsed, 3),
+                "rows_per_sec": round(rows / elapsed, 1) if elapsed else 0.0,
+            }
+            logger.info(f"Batch scoring completed: {summary}")
+            return summary
+
+        except Exception as e:
+            logger.error("Batch scoring failed")
+            raise CustomException(e, sys)
+
+    @staticmethod
+    def _write(writer: DataFrameChunkWriter, scores: pd.DataFrame, rows: int, start: float) -> int:
+        writer.write(scores)
+        done = rows + len(scores)
+        logger.info(f"Scored {done} rows ({done / (time.perf_counter() - start):.0f} rows/sec)")
+        return len(scores)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Bulk-score transactions offline")
+    parser.add_argument("--input", required=True, help="CSV, Parquet or JSONL file")
+    parser.add_argument("--output", required=True, help="CSV, Parquet or JSONL file")
+    parser.add_argument("--model-tag", default=MODEL_TAG)
+    parser.add_argument("--chunk-size", type=int, default=BATCH_SCORING_CHUNK_SIZE)
+    parser.add_argument("--workers", type=int, default=BATCH_SCORING_N_WORKERS)
+    args = parser.parse_args(argv)
+
+    summary = BatchScoringPipeline(
+        input_path=args.input,
+        output_path=args.output,
+        model_tag=args.model_tag,
+        chunk_size=args.chunk_size,
+        n_workers=args.workers,
+    ).run_pipeline()
+
+    print(
+        f"Scored {summary['rows']} rows ({summary['invalid_rows']} invalid) in {summary['seconds']}s "
+        f"({summary['rows_per_sec']} rows/sec)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+Drift check of a new batch against the accepted training data.
+
+    python -m src.pipeline.drift_check --input new_batch.parquet
+    python -m src.pipeline.drift_check --input new_batch.csv --report drift.yaml
+
+The batch is streamed in chunks against the reference profile saved by
+data validation (by default the one of artifacts/latest), so neither the
+batch nor the training data has to fit in memory. Exits with status 1
+when any column drifts.
+"""
+
+import argparse
+import os
+import sys
+
+from src.logger import logger
+from src.exception import CustomException
+from src.constants.data_validation import (
+    DATA_VALIDATION_DIR_NAME,
+    DATA_VALIDATION_REFERENCE_PROFILE_FILE_NAME,
+    DRIFT_P_VALUE_THRESHOLD,
+    PROFILE_CHUNK_SIZE,
+)
+from src.constants.training_pipeline import ARTIFACT_LATEST_DIR, SCHEMA_FILE_PATH
+from src.utils import get_schema_dtypes, iter_dataframe_chunks, read_yaml_file, write_yaml_file
+from src.validation.profile import ProfileDriftMonitor, ReferenceProfile
+
+DEFAULT_PROFILE_PATH = os.path.join(
+    ARTIFACT_LATEST_DIR, DATA_VALIDATION_DIR_NAME, DATA_VALIDATION_REFERENCE_PROFILE_FILE_NAME
+)
+
+
+def detect_drift_against_profile(
+    file_path: str,
+    profile_path: str = DEFAULT_PROFILE_PATH,
+    threshold: float = DRIFT_P_VALUE_THRESHOLD,
+    chunk_size: int = PROFILE_CHUNK_SIZE,
+):
+    """(no drift, per-column report) of file_path against a saved profile."""
+    try:
+        profile = ReferenceProfile.load(profile_path)
+        # Nullable ints: missing values are skipped by the sketches, not fatal
+        dtypes = get_schema_dtypes(read_yaml_file(SCHEMA_FILE_PATH), nullable=True)
+
+        monitor = ProfileDriftMonitor(profile, threshold=threshold)
+        monitor.update_all(iter_dataframe_chunks(file_path, chunk_size, dtypes=dtypes))
+        logger.info(f"Drift check of {monitor.n_rows} rows from {file_path} against {profile_path}")
+        return monitor.report()
+    except Exception as e:
+        raise CustomException(e, sys)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Check a batch for drift against the reference profile")
+    parser.add_argument("--input", required=True, help="CSV, Parquet or JSONL file")
+    parser.add_argument("--profile", default=DEFAULT_PROFILE_PATH, help="Reference profile YAML")
+    parser.add_argument("--threshold", type=float, default=DRIFT_P_VALUE_THRESHOLD)
+    parser.add_argument("--chunk-size", type=int, default=PROFILE_CHUNK_SIZE)
+    parser.add_argument("--report", help="Write the per-column report to this YAML file")
+    args = parser.parse_args(argv)
+
+    status, report = detect_drift_against_profile(
+        args.input, args.profile, threshold=args.threshold, chunk_size=args.chunk_size
+    )
+
+    if args.report:
+        write_yaml_file(os.path.abspath(args.report), report, replace=True)
+        print(f"Report written to {args.report}")
+
+    drifted = [col for col, result in report.items() if result["drift_detected"]]
+    print(f"Drifted columns: {drifted}" if drifted else "No drift detected")
+    return 0 if status else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
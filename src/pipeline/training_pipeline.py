@@ -1,4 +1,38 @@
+import os
+import sys
+
+import src.features
+import src.features.matrix
+import src.models
+import src.utils
+import src.utils.profiling
+import src.validation
 from src.logger import logger
+from src.constants import (
+    data_ingestion as data_ingestion_constants,
+    data_validation as data_validation_constants,
+    data_transformation as data_transformation_constants,
+    model_trainer as model_trainer_constants,
+    model_evaluation as model_evaluation_constants,
+)
+from src.constants.training_pipeline import (
+    SCHEMA_FILE_PATH,
+    TARGET_COLUMN,
+    PIPELINE_PROFILE_TRACE_MEMORY,
+    PIPELINE_PROFILE_CPROFILE,
+    PIPELINE_STAGE_CACHE_ENABLED,
+    PIPELINE_STAGE_CACHE_DIR,
+    ARTIFACT_LATEST_DIR,
+    ARTIFACT_RETENTION_RUNS,
+    ARTIFACT_PROMOTED_RUNS_FILE,
+)
+from src.entity.artifact_entity import (
+    DataIngestionArtifact,
+    DataValidationArtifact,
+    DataTransformationArtifact,
+    ModelTrainerArtifact,
+    ModelEvaluationArtifact,
+)
 from src.entity.config_entity import TrainingPipelineConfig
 from src.entity.config_entity import DataIngestionConfig
 from src.components.data_ingestion import DataIngestion
@@ -10,23 +44,281 @@ from src.entity.config_entity import ModelTrainerConfig
 from src.components.model_trainer import ModelTrainer
 from src.entity.config_entity import ModelEvaluationConfig
 from src.components.model_evaluation import ModelEvaluation
-from src.utils import update_latest_artifacts
+from src.utils import (
+    mark_run_finished,
+    mark_run_started,
+    prune_artifact_runs,
+    update_latest_artifacts,
+    write_yaml_file,
+)
+from src.utils.cache import StageCache, hash_file, hash_object, hash_paths, module_constants
+from src.utils.profiling import StageProfiler
+from src.utils.tracking import get_tracker
+
+
+def _source_dir(package) -> str:
+    return os.path.dirname(package.__file__)
+
+
+def _source_file(cls) -> str:
+    return sys.modules[cls.__module__].__file__
+
+
+_UTILS_SOURCE = src.utils.__file__
+_MATRIX_SOURCE = src.features.matrix.__file__
+_PROFILING_SOURCE = src.utils.profiling.__file__
+
+# stage -> (constants module, names of the constants that change the
+# stage's output, source files/packages it depends on). Parallelism,
+# chunking and raw input location are left out on purpose (the raw file is
+# keyed by content): another core count must not invalidate the cache
+STAGE_DEPENDENCIES = {
+    "data_ingestion": (
+        data_ingestion_constants,
+        [
+            "DATA_INGESTION_DIR_NAME",
+            "DATA_INGESTION_FEATURE_STORE_DIR",
+            "DATA_INGESTION_INGESTED_DIR",
+            "DATA_INGESTION_TRAIN_FILE_NAME",
+            "DATA_INGESTION_TEST_FILE_NAME",
+            "DATA_INGESTION_TRAIN_TEST_SPLIT_RATIO",
+            "DATA_INGESTION_RANDOM_STATE",
+            "DATA_INGESTION_STREAMING",
+            "DATA_INGESTION_SPLIT_KEY",
+        ],
+        [_source_file(DataIngestion), _UTILS_SOURCE],
+    ),
+    "data_validation": (
+        data_validation_constants,
+        [
+            "DATA_VALIDATION_DIR_NAME",
+            "DATA_VALIDATION_VALID_DIR",
+            "DATA_VALIDATION_INVALID_DIR",
+            "DATA_VALIDATION_DRIFT_REPORT_DIR",
+            "DATA_VALIDATION_DRIFT_REPORT_FILE_NAME",
+            "DATA_VALIDATION_SCHEMA_REPORT_FILE_NAME",
+            "DATA_VALIDATION_STREAMING",
+            "DRIFT_P_VALUE_THRESHOLD",
+            "DRIFT_MAX_CATEGORIES",
+            "DATA_VALIDATION_REFERENCE_PROFILE_FILE_NAME",
+            "PROFILE_NUM_BINS",
+            "PROFILE_TOP_K",
+            "PROFILE_SAMPLE_ROWS",
+        ],
+        [_source_file(DataValidation), _source_dir(src.validation), _UTILS_SOURCE],
+    ),
+    "data_transformation": (
+        data_transformation_constants,
+        [
+            "DATA_TRANSFORMATION_DIR_NAME",
+            "PREPROCESSING_OBJECT_FILE_NAME",
+            "TRAIN_MATRIX_FILE_NAME",
+            "TRAIN_TARGET_FILE_NAME",
+            "TEST_MATRIX_FILE_NAME",
+            "TEST_TARGET_FILE_NAME",
+            "DROP_COLUMNS",
+            "ONE_HOT_COLUMNS",
+            "MIN_CUSTOMER_AGE",
+            "NEW_ACCOUNT_MAX_DAYS",
+            "EARLY_TXN_HOURS",
+            "VELOCITY_KEYS",
+            "VELOCITY_WINDOWS",
+            "VELOCITY_TIMESTAMP_COLUMN",
+            "VELOCITY_AMOUNT_COLUMN",
+            "VELOCITY_DEVICE_COLUMN",
+            "VELOCITY_STORE_FILE_NAME",
+            "FREQUENCY_MIN_COUNT",
+            "FREQUENCY_MAX_CATEGORIES",
+            "IP_PREFIX_OCTETS",
+        ],
+        [_source_file(DataTransformation), _source_dir(src.features), _UTILS_SOURCE],
+    ),
+    "model_trainer": (
+        model_trainer_constants,
+        [
+            "MODEL_TRAINER_DIR_NAME",
+            "MODEL_FILE_NAME",
+            "METRICS_FILE_NAME",
+            "OOF_PROBABILITIES_FILE_NAME",
+            "THRESHOLD_CV_FOLDS",
+            "RANDOM_STATE",
+            "MODEL_TRAINER_ENABLE_SEARCH",
+            "SEARCH_CV_FOLDS",
+            "SEARCH_HALVING_FACTOR",
+            "SEARCH_N_CANDIDATES",
+            "SEARCH_SCORING_BETA",
+            "HGB_MAX_ITER",
+            "HGB_VALIDATION_FRACTION",
+            "HGB_N_ITER_NO_CHANGE",
+            "IMBALANCE_STRATEGIES",
+            "IMBALANCE_ENSEMBLE_SIZE",
+            "IMBALANCE_SMOTE_CHUNK_ROWS",
+            "IMBALANCE_SMOTE_K_NEIGHBORS",
+        ],
+        [
+            _source_file(ModelTrainer),
+            _source_dir(src.models),
+            _MATRIX_SOURCE,
+            _UTILS_SOURCE,
+            _PROFILING_SOURCE,
+        ],
+    ),
+    "model_evaluation": (
+        model_evaluation_constants,
+        [
+            "MODEL_EVALUATION_DIR_NAME",
+            "EVALUATION_REPORT_FILE_NAME",
+            "MIN_F2_SCORE",
+            "MIN_RECALL",
+            "MIN_PRECISION",
+            "THRESHOLD_SWEEP_BETA",
+            "THRESHOLD_CURVE_MAX_POINTS",
+        ],
+        [_source_file(ModelEvaluation), _MATRIX_SOURCE, _UTILS_SOURCE],
+    ),
+}
+
+# The other upper-case names of each stage's constants module. Every name
+# is either keyed above or listed here (tests/test_stage_cache.py checks),
+# so a new constant has to be classified before the cache can go stale
+STAGE_UNKEYED_CONSTANTS = {
+    "data_ingestion": {
+        "DATA_DIR",
+        "DATA_INGESTION_RAW_DIR",
+        "DATA_INGESTION_RAW_FILE_NAME",
+        "DATA_INGESTION_CHUNK_SIZE",
+    },
+    "data_validation": {
+        "DATA_VALIDATION_CHUNK_SIZE",
+        "PROFILE_CHUNK_SIZE",
+        "DRIFT_N_JOBS",
+        "DRIFT_PARALLEL_MIN_ROWS",
+    },
+    "data_transformation": {
+        "FEATURE_MATRIX_BLOCK_ROWS",
+        "VELOCITY_ID_COLUMN",
+    },
+    "model_trainer": {
+        "ARTIFACT_CACHE_DIR",
+        "MODEL_CACHE_DIR",
+        "MODEL_TRAINER_N_JOBS",
+        "PREDICT_LATENCY_REPEATS",
+    },
+    "model_evaluation": set(),
+}
 
 
 class TrainingPipeline:
-    def __init__(self):
-        self.training_pipeline_config = TrainingPipelineConfig()
+    def __init__(
+        self,
+        raw_data_path: str = None,
+        timestamp: str = None,
+        promote: bool = True,
+        use_cache: bool = PIPELINE_STAGE_CACHE_ENABLED,
+        trace_memory: bool = PIPELINE_PROFILE_TRACE_MEMORY,
+        cprofile: bool = PIPELINE_PROFILE_CPROFILE,
+    ):
+        self.training_pipeline_config = TrainingPipelineConfig(
+            timestamp=timestamp, raw_data_path=raw_data_path
+        )
+        # Benchmark runs are not published to artifacts/latest
+        self.promote = promote
+        self.profiler = StageProfiler(
+            trace_memory=trace_memory,
+            cprofile=cprofile,
+            profile_dir=self.training_pipeline_config.profile_dir,
+        )
+        self.stage_cache = StageCache(PIPELINE_STAGE_CACHE_DIR) if use_cache else None
+
+    def stage_key(self, stage: str, inputs: dict) -> str:
+        """Chained key: upstream keys / input hashes + stage constants + stage code."""
+        constants, names, sources = STAGE_DEPENDENCIES[stage]
+        return hash_object({
+            "stage": stage,
+            "inputs": inputs,
+            "constants": module_constants(constants, names),
+            "code": hash_paths(sources),
+            "target": TARGET_COLUMN,
+            "file_format": self.training_pipeline_config.artifact_file_format,
+        })
+
+    def run_stage(self, stage: str, stage_dir: str, key: str, artifact_cls, run):
+        """Runs a stage, or links its cached output into this run when the key matches."""
+        artifact_dir = self.training_pipeline_config.artifact_dir
+
+        with self.profiler.stage(stage) as info:
+            info["cache_key"] = key
+
+            if self.stage_cache is None:
+                info["cache_hit"] = False
+                return run()
+
+            artifact = self.stage_cache.load(stage, key, artifact_cls, artifact_dir)
+            info["cache_hit"] = artifact is not None
+
+            if artifact is not None:
+                self.stage_cache.link(stage, key, stage_dir)
+                logger.info(f"Stage {stage}: cache hit ({key[:12]}), reusing outputs")
+            else:
+                logger.info(f"Stage {stage}: cache miss ({key[:12]})")
+                StageCache.clear(stage_dir)
+                artifact = run()
+                self.stage_cache.store(stage, key, stage_dir, artifact, artifact_dir)
+
+        return artifact
+
+    def save_profile(self) -> dict:
+        report = self.profiler.report()
+        profile_path = self.training_pipeline_config.pipeline_profile_file_path
+
+        write_yaml_file(profile_path, report, replace=True)
+        logger.info(f"Pipeline profile written to {profile_path}")
+
+        tracker = get_tracker()
+        try:
+            with tracker.start_run("pipeline_profile") as run:
+                run.log_param("artifact_dir", self.training_pipeline_config.artifact_dir)
+                run.log_metrics(self.profiler.metrics())
+                run.log_artifact(profile_path)
+            # Everything this run logged is in the store (or spooled) on return
+            tracker.flush()
+        except Exception as e:
+            # The profile on disk is the record; tracking is best effort
+            logger.warning(f"Could not log pipeline profile to MLflow: {e}")
+
+        return report
 
     def run_pipeline(self):
         logger.info("Training pipeline started")
+        artifact_dir = self.training_pipeline_config.artifact_dir
+        # Pruning by a concurrent run keeps the cache entries this run may use
+        mark_run_started(artifact_dir)
+        try:
+            self._run_stages()
+        finally:
+            mark_run_finished(artifact_dir)
+            self.save_profile()
 
-        # Data Ingestion
-        data_ingestion_config = DataIngestionConfig(
-            training_pipeline_config=self.training_pipeline_config
-        )
+    def _run_stages(self):
+        config = self.training_pipeline_config
+        schema_hash = hash_file(SCHEMA_FILE_PATH)
 
-        data_ingestion = DataIngestion(data_ingestion_config)
-        data_ingestion_artifact = data_ingestion.initiate_data_ingestion()
+        # =========================
+        # DATA INGESTION
+        # =========================
+        data_ingestion_config = DataIngestionConfig(training_pipeline_config=config)
+
+        ingestion_key = self.stage_key("data_ingestion", {
+            "raw_data": hash_file(data_ingestion_config.raw_data_path),
+            "schema": schema_hash,
+        })
+        data_ingestion_artifact = self.run_stage(
+            "data_ingestion",
+            data_ingestion_config.data_ingestion_dir,
+            ingestion_key,
+            DataIngestionArtifact,
+            lambda: DataIngestion(data_ingestion_config).initiate_data_ingestion(),
+        )
 
         logger.info(
             f"Data ingestion completed. "
@@ -34,24 +326,28 @@ class TrainingPipeline:
             f"Test file: {data_ingestion_artifact.test_file_path}"
         )
 
-        logger.info("Proceeding to Data Validation...")
-
-               # =========================
-            # DATA VALIDATION
-            # =========================
+        # =========================
+        # DATA VALIDATION
+        # =========================
         logger.info("Starting Data Validation")
 
-        data_validation_config = DataValidationConfig(
-            training_pipeline_config=self.training_pipeline_config
-        )
+        data_validation_config = DataValidationConfig(training_pipeline_config=config)
 
-        data_validation = DataValidation(
-            data_ingestion_artifact=data_ingestion_artifact,
-            data_validation_config=data_validation_config,
+        validation_key = self.stage_key("data_validation", {
+            "data_ingestion": ingestion_key,
+            "schema": schema_hash,
+        })
+        data_validation_artifact = self.run_stage(
+            "data_validation",
+            data_validation_config.data_validation_dir,
+            validation_key,
+            DataValidationArtifact,
+            lambda: DataValidation(
+                data_ingestion_artifact=data_ingestion_artifact,
+                data_validation_config=data_validation_config,
+            ).initiate_data_validation(),
         )
 
-        data_validation_artifact = data_validation.initiate_data_validation()
-
         if not data_validation_artifact.validation_status:
             raise Exception(
                 "Data validation failed. Pipeline execution stopped."
@@ -62,63 +358,99 @@ class TrainingPipeline:
             f"Drift report: {data_validation_artifact.drift_report_file_path}"
         )
 
-
+        # =========================
+        # DATA TRANSFORMATION
+        # =========================
         logger.info("Starting Data Transformation")
 
-        data_transformation_config = DataTransformationConfig(
-            training_pipeline_config=self.training_pipeline_config
-        )
+        data_transformation_config = DataTransformationConfig(training_pipeline_config=config)
 
-        data_transformation = DataTransformation(
-            data_validation_artifact=data_validation_artifact,
-            data_transformation_config=data_transformation_config,
+        transformation_key = self.stage_key("data_transformation", {
+            "data_validation": validation_key,
+            "schema": schema_hash,
+        })
+        data_transformation_artifact = self.run_stage(
+            "data_transformation",
+            data_transformation_config.data_transformation_dir,
+            transformation_key,
+            DataTransformationArtifact,
+            lambda: DataTransformation(
+                data_validation_artifact=data_validation_artifact,
+                data_transformation_config=data_transformation_config,
+            ).initiate_data_transformation(),
         )
 
-        data_transformation_artifact = data_transformation.initiate_data_transformation()
-
         logger.info(
             f"Data transformation completed | "
-            f"Train features: {data_transformation_artifact.transformed_train_path}"
+            f"Train matrix: {data_transformation_artifact.train_matrix_path}"
         )
+
+        # =========================
+        # MODEL TRAINING
+        # =========================
         logger.info("Starting Model Training")
 
-        model_trainer_config = ModelTrainerConfig(
-            training_pipeline_config=self.training_pipeline_config
-        )
+        model_trainer_config = ModelTrainerConfig(training_pipeline_config=config)
 
-        model_trainer = ModelTrainer(
-            data_transformation_artifact=data_transformation_artifact,
-            model_trainer_config=model_trainer_config,
+        trainer_key = self.stage_key("model_trainer", {
+            "data_transformation": transformation_key,
+        })
+        model_trainer_artifact = self.run_stage(
+            "model_trainer",
+            model_trainer_config.model_trainer_dir,
+            trainer_key,
+            ModelTrainerArtifact,
+            lambda: ModelTrainer(
+                data_transformation_artifact=data_transformation_artifact,
+                model_trainer_config=model_trainer_config,
+            ).initiate_model_training(),
         )
 
-        model_trainer_artifact = model_trainer.initiate_model_training()
-
         logger.info(
             f"Model training completed | Best model: {model_trainer_artifact.best_model_name}"
         )
-        
+
+        # =========================
+        # MODEL EVALUATION
+        # =========================
         logger.info("Starting Model Evaluation")
 
-        model_evaluation_config = ModelEvaluationConfig(
-            training_pipeline_config=self.training_pipeline_config
-        )
+        model_evaluation_config = ModelEvaluationConfig(training_pipeline_config=config)
 
-        model_evaluation = ModelEvaluation(
-            model_trainer_artifact=model_trainer_artifact,
-            data_transformation_artifact=data_transformation_artifact,
-            model_evaluation_config=model_evaluation_config,
+        evaluation_key = self.stage_key("model_evaluation", {
+            "model_trainer": trainer_key,
+            "data_transformation": transformation_key,
+        })
+        model_evaluation_artifact = self.run_stage(
+            "model_evaluation",
+            model_evaluation_config.model_evaluation_dir,
+            evaluation_key,
+            ModelEvaluationArtifact,
+            lambda: ModelEvaluation(
+                model_trainer_artifact=model_trainer_artifact,
+                data_transformation_artifact=data_transformation_artifact,
+                model_evaluation_config=model_evaluation_config,
+            ).initiate_model_evaluation(),
         )
 
-        model_evaluation_artifact = model_evaluation.initiate_model_evaluation()
-
         if not model_evaluation_artifact.is_model_accepted:
             raise Exception("Model rejected by evaluation guardrails")
 
         logger.info("Model accepted by evaluation")
 
-        if model_evaluation_artifact.is_model_accepted:
+        hits = [name for name, stage in self.profiler.stages.items() if stage.get("cache_hit")]
+        logger.info(f"Stage cache hits: {hits or 'none'}")
+
+        if self.promote:
             update_latest_artifacts(
-                current_artifact_dir=self.training_pipeline_config.artifact_dir,
-                latest_dir="artifacts/latest"
+                current_artifact_dir=config.artifact_dir,
+                latest_dir=ARTIFACT_LATEST_DIR,
+                promoted_runs_file=ARTIFACT_PROMOTED_RUNS_FILE,
+            )
+            prune_artifact_runs(
+                artifact_root=config.artifact_root,
+                latest_dir=ARTIFACT_LATEST_DIR,
+                keep=ARTIFACT_RETENTION_RUNS,
+                promoted_runs_file=ARTIFACT_PROMOTED_RUNS_FILE,
+                stage_cache_dir=PIPELINE_STAGE_CACHE_DIR,
             )
-
@@ -0,0 +1,110 @@
+import asyncio
+import time
+from typing import Any, Callable, List
+
+from src.logger import logger
+
+
+class AdaptiveBatcher:
+    """
+    Groups concurrent single-item calls into one batched call.
+
+    Items queued while a batch is being scored are drained together. The
+    wait for stragglers is capped by max_latency_ms and adapts to the
+    observed scoring time, so under light load a request is not held back
+    longer than scoring a batch would take anyway.
+    """
+
+    def __init__(
+        self,
+        batch_fn: Callable[[List[Any]], List[Any]],
+        max_batch_size: int,
+        max_latency_ms: float,
+    ):
+        self.batch_fn = batch_fn
+        self.max_batch_size = max_batch_size
+        self.max_latency = max_latency_ms / 1000.0
+
+        # EWMA of batch scoring time (seconds)
+        self._batch_time = self.max_latency
+        self._queue = None
+        self._worker = None
+
+    async def submit(self, item: Any) -> Any:
+        if self._worker is None or self._worker.done():
+            self._queue = asyncio.Queue()
+            self._worker = asyncio.create_task(self._run())
+
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((item, future))
+        return await future
+
+    async def _collect(self) -> list:
+        batch = [await self._queue.get()]
+
+        # Drain whatever is already waiting without blocking
+        while len(batch) < self.max_batch_size and not self._queue.empty():
+            batch.append(self._queue.get_nowait())
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + min(self.max_latency, self._batch_time)
+
+        while len(batch) < self.max_batch_size:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+
+        return batch
+
+    async def _score_individually(self, batch: list) -> None:
+        # A failed batch may be caused by one item (or a transient error):
+        # score each item alone so unrelated callers still get results
+        loop = asyncio.get_running_loop()
+        for item, future in batch:
+            try:
+                result = (await loop.run_in_executor(None, self.batch_fn, [item]))[0]
+            except Exception as e:
+                if not future.done():
+                    future.set_exception(e)
+                continue
+            if not future.done():
+                future.set_result(result)
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+
+        while True:
+            batch = await self._collect()
+            items = [item for item, _ in batch]
+
+            start = time.perf_counter()
+            try:
+                results = await loop.run_in_executor(None, self.batch_fn, items)
+            except Exception as e:
+                logger.exception(e)
+                if len(batch) > 1:
+                    await self._score_individually(batch)
+                else:
+                    _, future = batch[0]
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+
+            elapsed = time.perf_counter() - start
+            self._batch_time = 0.8 * self._batch_time + 0.2 * elapsed
+
+            for (_, future), result in zip(batch, results):
+                if not future.done():
+                    future.set_result(result)
+
+            if len(results) != len(batch):
+                # Callers without a result would otherwise wait forever
+                error = RuntimeError(f"batch_fn returned {len(results)} results for {len(batch)} items")
+                logger.error(str(error))
+                for _, future in batch[len(results):]:
+                    if not future.done():
+                        future.set_exception(error)
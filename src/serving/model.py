@@ -0,0 +1,205 @@
+import threading
+from dataclasses import dataclass
+from datetime import datetime
+from typing import List, Optional
+
+import bentoml
+import numpy as np
+
+from src.constants.serving import (
+    MODEL_FORMAT_COMPACT,
+    DEFAULT_THRESHOLD,
+    SERVING_WARMUP_ROWS,
+    VELOCITY_STORE_PATH,
+    VELOCITY_RECORD_REQUESTS,
+)
+from src.constants.training_pipeline import SCHEMA_FILE_PATH, TARGET_COLUMN
+from src.features.engineering import FeatureEngineer
+from src.features.velocity import VelocityEngine, VelocityStore
+from src.logger import logger
+from src.models.compact import CompactModel
+from src.utils import read_yaml_file
+from src.validation.request import RequestValidator
+
+
+_VELOCITY_STORE = None
+_VELOCITY_STORE_LOCK = threading.Lock()
+
+
+def get_velocity_store() -> VelocityStore:
+    """Process-wide live store, shared by every model version a reload swaps in."""
+    global _VELOCITY_STORE
+    with _VELOCITY_STORE_LOCK:
+        if _VELOCITY_STORE is None:
+            _VELOCITY_STORE = VelocityStore(VELOCITY_STORE_PATH)
+        return _VELOCITY_STORE
+
+
+def load_served_model(model_ref):
+    """
+    Loads a registered fraud_detector for inference.
+
+    Compact exports are memory-mapped from the model store, so all worker
+    processes share one copy of the arrays; older models load via sklearn.
+    """
+    if model_ref.info.metadata.get("format") == MODEL_FORMAT_COMPACT:
+        return CompactModel.load(model_ref.path, mmap_mode="r")
+    return bentoml.sklearn.load_model(model_ref)
+
+
+@dataclass(frozen=True)
+class ModelBundle:
+    """
+    Everything one model version needs to score a request.
+
+    Model, threshold, feature layout and request validator always come
+    from the same model version. The bundle is never mutated: a reload
+    builds a new one and swaps the reference, and a request holding the
+    old bundle finishes with it.
+    """
+
+    tag: str
+    model: object
+    threshold: float
+    features: List[str]
+    feature_engineer: FeatureEngineer
+    request_validator: RequestValidator
+    model_format: str
+    loaded_at: str
+    velocity: Optional[VelocityEngine] = None
+
+    @classmethod
+    def load(cls, model_ref) -> "ModelBundle":
+        metadata = model_ref.info.metadata
+
+        # Target is never a model input
+        features = [col for col in metadata["features"] if col != TARGET_COLUMN]
+
+        # Same feature engineering as training, compiled to this model's order
+        feature_engineer = FeatureEngineer.from_metadata(metadata, columns=features)
+
+        # Schema the model was trained against (older models: repo schema)
+        schema = metadata.get("schema") or read_yaml_file(SCHEMA_FILE_PATH)
+
+        bundle = cls(
+            tag=str(model_ref.tag),
+            model=load_served_model(model_ref),
+            threshold=metadata.get("threshold", DEFAULT_THRESHOLD),
+            features=features,
+            feature_engineer=feature_engineer,
+            # Fields the model reads are required, the rest checked if present
+            request_validator=RequestValidator(
+                schema, required_fields=feature_engineer.input_columns
+            ),
+            model_format=metadata.get("format", "sklearn"),
+            loaded_at=datetime.now().isoformat(timespec="seconds"),
+            # Models trained with velocity features read the live store
+            velocity=VelocityEngine(store=get_velocity_store())
+            if feature_engineer.velocity_features else None,
+        )
+        bundle.warm()
+        return bundle
+
+    def warm(self) -> None:
+        # First calls pay one-off costs (mmap page faults, sklearn checks)
+        self.model.predict_proba(np.zeros((SERVING_WARMUP_ROWS, len(self.features))))
+
+    def predict_proba(self, records: list) -> np.ndarray:
+        # Raw transactions -> training feature space
+        X = self.feature_engineer.transform_records(records)
+        return self.model.predict_proba(X)[:, 1]
+
+    def score(self, records: list) -> list:
+        if self.velocity is None:
+            probs = self.predict_proba(records)
+        else:
+            # Windows as of each transaction. Lookup, scoring and recording
+            # are one store transaction: concurrent workers see each other's
+            # events, and a failed request leaves the windows as they were
+            with self.velocity.recording(records, persist=VELOCITY_RECORD_REQUESTS) as velocity:
+                probs = self.predict_proba(
+                    [{**record, **features} for record, features in zip(records, velocity)]
+                )
+
+        return [
+            {
+                "fraud_probability": float(prob),
+                "threshold": self.threshold,
+                "is_fraud": int(prob >= self.threshold)
+            }
+            for prob in probs
+        ]
+
+    def info(self) -> dict:
+        return {
+            "model_tag": self.tag,
+            "model_format": self.model_format,
+            "threshold": self.threshold,
+            "n_features": len(self.features),
+            "velocity_store": self.velocity.store.path if self.velocity else None,
+            "loaded_at": self.loaded_at,
+        }
+
+
+class ModelReloader:
+    """
+    Keeps `current` pointed at the newest version of model_tag.
+
+    A daemon thread polls the model store; a new version is loaded and
+    warmed off the request path, then published with a single reference
+    assignment. Load failures are logged and the current bundle keeps
+    serving.
+    """
+
+    def __init__(self, model_tag: str, bundle: ModelBundle, poll_seconds: float):
+        self.model_tag = model_tag
+        self.current = bundle
+        self.poll_seconds = poll_seconds
+        self.last_check: Optional[str] = None
+        self.last_error: Optional[str] = None
+
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def check(self) -> bool:
+        """Loads and swaps in a newer model version if there is one."""
+        with self._lock:
+            self.last_check = datetime.now().isoformat(timespec="seconds")
+            try:
+                model_ref = bentoml.models.get(self.model_tag)
+                if str(model_ref.tag) == self.current.tag:
+                    return False
+
+                logger.info(f"Loading {model_ref.tag} (serving {self.current.tag})")
+                bundle = ModelBundle.load(model_ref)
+            except Exception as e:
+                self.last_error = f"{type(e).__name__}: {e}"
+                logger.error(f"Model reload failed, keeping {self.current.tag}: {self.last_error}")
+                return False
+
+            previous, self.current = self.current, bundle
+            self.last_error = None
+            logger.info(f"Swapped model {previous.tag} -> {bundle.tag}")
+            return True
+
+    def _poll(self) -> None:
+        while not self._stop.wait(self.poll_seconds):
+            self.check()
+
+    def start(self) -> None:
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._poll, name="model-reloader", daemon=True)
+            self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    def status(self) -> dict:
+        return {
+            **self.current.info(),
+            "watching": self.model_tag,
+            "poll_seconds": self.poll_seconds,
+            "last_check": self.last_check,
+            "last_error": self.last_error,
+        }
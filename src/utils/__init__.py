@@ -3,6 +3,7 @@ from src.exception import CustomException
 from src.logger import logging
 import os,sys
 import numpy as np
+import pandas as pd
 #import dill
 import pickle
 import shutil
@@ -28,9 +29,285 @@ def write_yaml_file(file_path: str, content: object, replace: bool = False) -> N
     except Exception as e:
         raise CustomException(e, sys)
 
-def update_latest_artifacts(current_artifact_dir: str, latest_dir: str):
-    if os.path.exists(latest_dir):
-        shutil.rmtree(latest_dir)
+# schema.yaml type -> pandas dtype
+SCHEMA_DTYPES = {
+    "int": "int64",
+    "float": "float64",
+    "object": "string",
+    "datetime": "datetime64[ns]",
+}
 
-    shutil.copytree(current_artifact_dir, latest_dir)
+def get_schema_dtypes(schema_config: dict, nullable: bool = False) -> dict:
+    """
+    pandas dtypes for the schema columns. With nullable=True integer
+    columns use the nullable Int64 dtype, so rows with missing values can
+    be read and then rejected by validation instead of failing the read.
+    """
+    dtypes = {
+        column: SCHEMA_DTYPES[spec["type"]]
+        for column, spec in schema_config["columns"].items()
+    }
+    if nullable:
+        dtypes = {c: "Int64" if t == "int64" else t for c, t in dtypes.items()}
+    return dtypes
+
+def get_raw_dtypes(schema_config: dict) -> dict:
+    """
+    Every schema column as text. Malformed cells (e.g. "abc" in an int
+    column, an unparseable date) are then read as-is and rejected row by
+    row by SchemaValidator instead of failing the whole read.
+    """
+    return {column: "string" for column in schema_config["columns"]}
+
+def _csv_dtypes(dtypes: dict) -> dict:
+    # Datetimes are parsed after reading, everything else is typed upfront
+    return {c: t for c, t in dtypes.items() if not t.startswith("datetime")}
+
+def apply_dtypes(df: pd.DataFrame, dtypes: dict) -> pd.DataFrame:
+    for column, dtype in dtypes.items():
+        if dtype.startswith("datetime") and column in df.columns:
+            df[column] = pd.to_datetime(df[column])
+
+    casts = {
+        c: t for c, t in dtypes.items()
+        if c in df.columns and str(df[c].dtype) != t
+    }
+    return df.astype(casts) if casts else df
+
+def read_dataframe(file_path: str, dtypes: dict = None, columns: list = None) -> pd.DataFrame:
+    try:
+        dtypes = dtypes or {}
+
+        if file_path.endswith(".parquet"):
+            df = pd.read_parquet(file_path, columns=columns)
+        else:
+            # Explicit dtypes skip CSV type inference
+            df = pd.read_csv(file_path, dtype=_csv_dtypes(dtypes), usecols=columns)
+
+        return apply_dtypes(df, dtypes)
+    except Exception as e:
+        raise CustomException(e, sys) from e
+
+def iter_dataframe_chunks(file_path: str, chunk_size: int, dtypes: dict = None):
+    """Yields the file as DataFrames of at most chunk_size rows."""
+    try:
+        dtypes = dtypes or {}
+
+        if file_path.endswith(".parquet"):
+            import pyarrow.parquet as pq
+
+            batches = pq.ParquetFile(file_path).iter_batches(batch_size=chunk_size)
+            chunks = (batch.to_pandas() for batch in batches)
+        elif file_path.endswith(".jsonl"):
+            chunks = pd.read_json(file_path, lines=True, chunksize=chunk_size)
+        else:
+            chunks = pd.read_csv(file_path, dtype=_csv_dtypes(dtypes), chunksize=chunk_size)
+
+        for chunk in chunks:
+            yield apply_dtypes(chunk, dtypes)
+    except Exception as e:
+        raise CustomException(e, sys) from e
+
+def write_dataframe(df: pd.DataFrame, file_path: str) -> None:
+    try:
+        os.makedirs(os.path.dirname(file_path) or ".", exist_ok=True)
+        if file_path.endswith(".parquet"):
+            df.to_parquet(file_path, index=False)
+        else:
+            df.to_csv(file_path, index=False)
+    except Exception as e:
+        raise CustomException(e, sys) from e
+
+class DataFrameChunkWriter:
+    """Appends DataFrame chunks to a single Parquet, JSONL or CSV file."""
+
+    def __init__(self, file_path: str):
+        self.file_path = file_path
+        self.rows_written = 0
+        self._parquet_writer = None
+        self._started = False
+        os.makedirs(os.path.dirname(file_path) or ".", exist_ok=True)
+
+    def write(self, df: pd.DataFrame) -> None:
+        try:
+            if self.file_path.endswith(".parquet"):
+                import pyarrow as pa
+                import pyarrow.parquet as pq
+
+                if self._parquet_writer is None:
+                    table = pa.Table.from_pandas(df, preserve_index=False)
+                    self._parquet_writer = pq.ParquetWriter(self.file_path, table.schema)
+                else:
+                    table = pa.Table.from_pandas(
+                        df, schema=self._parquet_writer.schema, preserve_index=False
+                    )
+                self._parquet_writer.write_table(table)
+            elif self.file_path.endswith(".jsonl"):
+                with open(self.file_path, "a" if self._started else "w") as f:
+                    df.to_json(f, orient="records", lines=True, date_format="iso")
+            else:
+                df.to_csv(
+                    self.file_path,
+                    mode="a" if self._started else "w",
+                    header=not self._started,
+                    index=False,
+                )
+
+            self._started = True
+            self.rows_written += len(df)
+        except Exception as e:
+            raise CustomException(e, sys) from e
+
+    def close(self) -> None:
+        if self._parquet_writer is not None:
+            self._parquet_writer.close()
+            self._parquet_writer = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+# Marker in a run directory while its pipeline is running (holds the pid)
+RUN_IN_PROGRESS_FILE_NAME = ".running"
+
+
+def mark_run_started(artifact_dir: str) -> None:
+    os.makedirs(artifact_dir, exist_ok=True)
+    with open(os.path.join(artifact_dir, RUN_IN_PROGRESS_FILE_NAME), "w") as f:
+        f.write(str(os.getpid()))
+
+
+def mark_run_finished(artifact_dir: str) -> None:
+    marker = os.path.join(artifact_dir, RUN_IN_PROGRESS_FILE_NAME)
+    if os.path.exists(marker):
+        os.remove(marker)
+
+
+def _run_start_time(run_dir: str):
+    """Start time of a run still in progress, None for a finished (or crashed) run."""
+    marker = os.path.join(run_dir, RUN_IN_PROGRESS_FILE_NAME)
+    try:
+        with open(marker) as f:
+            pid = int(f.read().strip())
+        os.kill(pid, 0)
+        return os.path.getmtime(marker)
+    except (OSError, ValueError):
+        return None
+
+
+def read_promoted_runs(promoted_runs_file: str) -> list:
+    """Names of promoted run directories, oldest first."""
+    if not os.path.exists(promoted_runs_file):
+        return []
+    with open(promoted_runs_file) as f:
+        names = [line.strip() for line in f if line.strip()]
+    # A run promoted twice counts at its last promotion
+    return list(reversed(dict.fromkeys(reversed(names))))
+
+
+def update_latest_artifacts(current_artifact_dir: str, latest_dir: str, promoted_runs_file: str = None):
+    """
+    Points latest_dir at current_artifact_dir without copying anything.
+
+    A symlink is created under a temporary name and renamed over latest_dir,
+    so readers see either the previous run or the new one, never a partial
+    directory. A latest_dir left by the old copy-based promotion is moved
+    aside first and removed once the link is in place. The run is appended
+    to promoted_runs_file, which retention counts.
+    """
+    try:
+        parent = os.path.dirname(latest_dir) or "."
+        tmp_link = os.path.join(parent, f".{os.path.basename(latest_dir)}.tmp-{os.getpid()}")
+
+        if os.path.lexists(tmp_link):
+            os.unlink(tmp_link)
+        os.symlink(os.path.relpath(current_artifact_dir, parent), tmp_link)
+
+        legacy_dir = None
+        if os.path.isdir(latest_dir) and not os.path.islink(latest_dir):
+            legacy_dir = f"{latest_dir}.legacy-{os.getpid()}"
+            os.rename(latest_dir, legacy_dir)
+
+        os.replace(tmp_link, latest_dir)
+        logging.info(f"Promoted {current_artifact_dir} -> {latest_dir}")
+
+        if promoted_runs_file:
+            with open(promoted_runs_file, "a") as f:
+                f.write(os.path.basename(os.path.normpath(current_artifact_dir)) + "\n")
+
+        if legacy_dir:
+            shutil.rmtree(legacy_dir)
+    except Exception as e:
+        raise CustomException(e, sys) from e
+
+def prune_artifact_runs(
+    artifact_root: str,
+    latest_dir: str,
+    keep: int,
+    promoted_runs_file: str,
+    stage_cache_dir: str = None,
+) -> list:
+    """
+    Deletes promoted runs beyond the `keep` most recently promoted ones.
+
+    Only runs listed in promoted_runs_file count: runs that were never
+    promoted (benchmark sweeps, rejected models) are left alone, and the
+    run latest_dir points to is always kept. Entries of stage_cache_dir that
+    no remaining run links to are removed too, except those used since the
+    oldest run still in progress started (it may have loaded one as a cache
+    hit and not linked it yet). Returns the deleted paths.
+    """
+    try:
+        latest_target = os.path.realpath(latest_dir)
+
+        promoted = [
+            name for name in read_promoted_runs(promoted_runs_file)
+            if os.path.isdir(os.path.join(artifact_root, name))
+        ]
+        kept_promoted = promoted[-keep:] if keep > 0 else []
+        removed = [
+            os.path.join(artifact_root, name) for name in promoted
+            if name not in kept_promoted and os.path.realpath(os.path.join(artifact_root, name)) != latest_target
+        ]
+        for run in removed:
+            shutil.rmtree(run)
+
+        remaining = [name for name in promoted if os.path.join(artifact_root, name) not in removed]
+        tmp_file = f"{promoted_runs_file}.tmp-{os.getpid()}"
+        with open(tmp_file, "w") as f:
+            f.writelines(f"{name}\n" for name in remaining)
+        os.replace(tmp_file, promoted_runs_file)
+
+        runs = [
+            entry.path for entry in os.scandir(artifact_root)
+            if entry.is_dir(follow_symlinks=False) and not entry.name.startswith(".")
+        ]
+
+        # Cache entries (one directory per stage key) still linked from a run
+        linked = {
+            os.path.realpath(entry.path)
+            for run in runs
+            for entry in os.scandir(run)
+            if entry.is_symlink()
+        }
+        starts = [start for start in map(_run_start_time, runs) if start is not None]
+        in_use_since = min(starts) if starts else float("inf")
+
+        stages = os.scandir(stage_cache_dir) if stage_cache_dir and os.path.isdir(stage_cache_dir) else []
+        for stage in stages:
+            if stage.is_dir(follow_symlinks=False):
+                for entry in os.scandir(stage.path):
+                    if entry.is_dir(follow_symlinks=False) and ".tmp-" not in entry.name \
+                            and os.path.realpath(entry.path) not in linked \
+                            and os.path.getmtime(entry.path) < in_use_since:
+                        shutil.rmtree(entry.path)
+                        removed.append(entry.path)
+
+        if removed:
+            logging.info(f"Pruned {len(removed)} old artifact directories")
+        return removed
+    except Exception as e:
+        raise CustomException(e, sys) from e
  
\ No newline at end of file
@@ -0,0 +1,159 @@
+import hashlib
+import json
+import os
+import pickle
+import shutil
+import sys
+from dataclasses import asdict
+
+from src.exception import CustomException
+from src.utils import read_yaml_file, write_yaml_file
+
+HASH_CHUNK_SIZE = 1 << 20
+
+
+def hash_file(file_path: str) -> str:
+    try:
+        digest = hashlib.sha256()
+        with open(file_path, "rb") as f:
+            for block in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+                digest.update(block)
+        return digest.hexdigest()
+    except Exception as e:
+        raise CustomException(e, sys) from e
+
+
+def hash_object(obj) -> str:
+    """Stable hash of JSON-like content; other values hash by repr."""
+    payload = json.dumps(obj, sort_keys=True, default=repr)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class PickleCache:
+    """Content-addressed pickle store: one file per key under cache_dir."""
+
+    def __init__(self, cache_dir: str):
+        self.cache_dir = cache_dir
+
+    def path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.pkl")
+
+    def get(self, key: str):
+        path = self.path(key)
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, "rb") as f:
+                return pickle.load(f)
+        except Exception:
+            # Unreadable entry (e.g. interrupted write): treat as a miss
+            return None
+
+    def put(self, key: str, value) -> None:
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            tmp_path = f"{self.path(key)}.tmp"
+            with open(tmp_path, "wb") as f:
+                pickle.dump(value, f)
+            os.replace(tmp_path, self.path(key))
+        except Exception as e:
+            raise CustomException(e, sys) from e
+
+
+def hash_paths(paths) -> str:
+    """Hash of source files; directories contribute their *.py files."""
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            files.extend(
+                os.path.join(path, name) for name in sorted(os.listdir(path)) if name.endswith(".py")
+            )
+        else:
+            files.append(path)
+    return hash_object([[os.path.basename(f), hash_file(f)] for f in files])
+
+
+def module_constants(module, names) -> dict:
+    """The named constants of module; a missing name raises AttributeError."""
+    return {name: getattr(module, name) for name in names}
+
+
+class StageCache:
+    """
+    Content-addressed store of finished pipeline stage directories.
+
+    An entry <cache_dir>/<stage>/<key>/ holds everything the stage wrote
+    plus STAGE_ARTIFACT_FILE_NAME (its artifact). A run's stage directory
+    is a relative symlink to the entry, so the artifact paths stay valid
+    and nothing is copied. Entries are published with a rename and never
+    modified afterwards.
+    """
+
+    STAGE_ARTIFACT_FILE_NAME = "stage_artifact.yaml"
+
+    def __init__(self, cache_dir: str):
+        self.cache_dir = cache_dir
+
+    def entry_dir(self, stage: str, key: str) -> str:
+        return os.path.join(self.cache_dir, stage, key)
+
+    def load(self, stage: str, key: str, artifact_cls, artifact_dir: str):
+        """The cached artifact rebased onto artifact_dir, or None on a miss."""
+        meta_path = os.path.join(self.entry_dir(stage, key), self.STAGE_ARTIFACT_FILE_NAME)
+        if not os.path.exists(meta_path):
+            return None
+
+        # Marks the entry as in use: pruning skips entries touched since the
+        # oldest unfinished run started
+        os.utime(self.entry_dir(stage, key))
+
+        meta = read_yaml_file(meta_path)
+        prefix = meta["artifact_dir"].rstrip(os.sep) + os.sep
+        fields = {
+            name: os.path.join(artifact_dir, value[len(prefix):])
+            if isinstance(value, str) and value.startswith(prefix) else value
+            for name, value in meta["artifact"].items()
+        }
+        return artifact_cls(**fields)
+
+    @staticmethod
+    def clear(stage_dir: str) -> None:
+        # A rerun into the same run dir must never write through a cache link
+        if os.path.islink(stage_dir):
+            os.unlink(stage_dir)
+        elif os.path.isdir(stage_dir):
+            shutil.rmtree(stage_dir)
+
+    def link(self, stage: str, key: str, stage_dir: str) -> None:
+        parent = os.path.dirname(stage_dir) or "."
+        os.makedirs(parent, exist_ok=True)
+        self.clear(stage_dir)
+        os.symlink(os.path.relpath(self.entry_dir(stage, key), parent), stage_dir)
+
+    def store(self, stage: str, key: str, stage_dir: str, artifact, artifact_dir: str) -> None:
+        try:
+            entry = self.entry_dir(stage, key)
+            tmp_entry = f"{entry}.tmp-{os.getpid()}"
+            os.makedirs(os.path.dirname(entry), exist_ok=True)
+
+            shutil.move(stage_dir, tmp_entry)
+            write_yaml_file(
+                os.path.join(tmp_entry, self.STAGE_ARTIFACT_FILE_NAME),
+                {
+                    "artifact_dir": artifact_dir,
+                    "artifact": {
+                        name: value.item() if hasattr(value, "item") else value
+                        for name, value in asdict(artifact).items()
+                    },
+                },
+            )
+
+            if os.path.exists(entry):
+                # Same key finished concurrently; contents are equivalent
+                shutil.rmtree(tmp_entry)
+            else:
+                os.rename(tmp_entry, entry)
+
+            self.link(stage, key, stage_dir)
+        except Exception as e:
+            raise CustomException(e, sys) from e
@@ -0,0 +1,137 @@
+import cProfile
+import io
+import os
+import pstats
+import resource
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+from src.logger import logger
+
+# Writing "5" resets the kernel's peak-RSS counter (VmHWM) for this process
+_CLEAR_REFS = "/proc/self/clear_refs"
+_STATUS = "/proc/self/status"
+
+
+def reset_peak_rss() -> bool:
+    try:
+        with open(_CLEAR_REFS, "w") as f:
+            f.write("5")
+        return True
+    except OSError:
+        return False
+
+
+def _children_cpu_seconds() -> float:
+    # Reaped child processes only (process pools are joined inside a stage)
+    usage = resource.getrusage(resource.RUSAGE_CHILDREN)
+    return usage.ru_utime + usage.ru_stime
+
+
+def peak_rss_mb() -> float:
+    try:
+        with open(_STATUS) as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    # Lifetime high-water mark (KiB on Linux, bytes on macOS)
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+class StageProfiler:
+    """
+    Times pipeline stages and records their peak memory.
+
+    Per stage: wall and CPU seconds (own and joined child processes), peak
+    process RSS (reset per stage where the kernel allows it), and
+    optionally the peak of Python/NumPy allocations via tracemalloc. With
+    cprofile=True each stage is also run under cProfile; the .prof file
+    and a top-N cumulative summary are written to profile_dir.
+    """
+
+    def __init__(
+        self,
+        trace_memory: bool = False,
+        cprofile: bool = False,
+        profile_dir: str = None,
+        top_n: int = 25,
+    ):
+        self.trace_memory = trace_memory
+        self.cprofile = cprofile
+        self.profile_dir = profile_dir
+        self.top_n = top_n
+        self.stages = {}
+
+    @contextmanager
+    def stage(self, name: str):
+        rss_reset = reset_peak_rss()
+        if self.trace_memory:
+            tracemalloc.start()
+        profiler = cProfile.Profile() if self.cprofile else None
+
+        wall, cpu, children_cpu = time.perf_counter(), time.process_time(), _children_cpu_seconds()
+        status = "failed"
+        # Callers may annotate the stage (e.g. cache hits) through this dict
+        info = {}
+        try:
+            if profiler:
+                profiler.enable()
+            yield info
+            status = "completed"
+        finally:
+            if profiler:
+                profiler.disable()
+
+            result = {
+                "status": status,
+                "wall_seconds": round(time.perf_counter() - wall, 3),
+                "cpu_seconds": round(time.process_time() - cpu, 3),
+                "children_cpu_seconds": round(_children_cpu_seconds() - children_cpu, 3),
+                "peak_rss_mb": round(peak_rss_mb(), 1),
+                "peak_rss_is_stage_local": rss_reset,
+                **info,
+            }
+            if self.trace_memory:
+                result["python_peak_mb"] = round(tracemalloc.get_traced_memory()[1] / 2**20, 1)
+                tracemalloc.stop()
+            if profiler:
+                result["cprofile"] = self._dump(name, profiler)
+
+            self.stages[name] = result
+            logger.info(
+                f"Stage {name} {status} in {result['wall_seconds']}s "
+                f"(peak RSS {result['peak_rss_mb']} MB)"
+            )
+
+    def _dump(self, name: str, profiler: cProfile.Profile) -> str:
+        os.makedirs(self.profile_dir, exist_ok=True)
+        prof_path = os.path.join(self.profile_dir, f"{name}.prof")
+        profiler.dump_stats(prof_path)
+
+        summary = io.StringIO()
+        pstats.Stats(profiler, stream=summary).sort_stats("cumulative").print_stats(self.top_n)
+        with open(os.path.join(self.profile_dir, f"{name}.txt"), "w") as f:
+            f.write(summary.getvalue())
+
+        return prof_path
+
+    def report(self) -> dict:
+        return {
+            "total_wall_seconds": round(sum(s["wall_seconds"] for s in self.stages.values()), 3),
+            "max_peak_rss_mb": max((s["peak_rss_mb"] for s in self.stages.values()), default=0.0),
+            "stages": self.stages,
+        }
+
+    def metrics(self) -> dict:
+        """Flat numeric metrics, e.g. for MLflow."""
+        metrics = {}
+        for name, stage in self.stages.items():
+            for key in ("wall_seconds", "cpu_seconds", "children_cpu_seconds", "peak_rss_mb", "python_peak_mb"):
+                if key in stage:
+                    metrics[f"{name}_{key}"] = stage[key]
+        return metrics
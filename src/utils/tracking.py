@@ -0,0 +1,374 @@
+import atexit
+import json
+import os
+import queue
+import shutil
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from typing import Dict, List, Optional
+
+from mlflow.entities import Metric, Param, RunTag
+from mlflow.tracking import MlflowClient
+
+from src.logger import logger
+from src.constants.training_pipeline import (
+    MLFLOW_EXPERIMENT_ID,
+    MLFLOW_FLUSH_SECONDS,
+    MLFLOW_MAX_RETRIES,
+    MLFLOW_RETRY_BACKOFF_SECONDS,
+    MLFLOW_SPOOL_DIR,
+)
+
+SPOOL_FILE_NAME = "spool.jsonl"
+SPOOL_ARTIFACT_DIR_NAME = "artifacts"
+
+# MLflow log_batch limits
+_MAX_METRICS_PER_BATCH = 1000
+_MAX_PARAMS_TAGS_PER_BATCH = 100
+
+_FLUSH = object()
+_STOP = object()
+
+
+def _now_ms() -> int:
+    return int(time.time() * 1000)
+
+
+def _chunks(items: list, size: int):
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+class TrackedRun:
+    """Run handle from BufferedTracker.start_run; every call only enqueues."""
+
+    def __init__(self, tracker: "BufferedTracker", key: str):
+        self._tracker = tracker
+        self.key = key
+
+    def log_param(self, key: str, value) -> None:
+        self.log_params({key: value})
+
+    def log_params(self, params: dict) -> None:
+        if params:
+            # Stringified now: the value may change before the flush
+            self._tracker._put(self.key, "params", {k: str(v) for k, v in params.items()})
+
+    def log_metric(self, key: str, value: float, step: int = 0) -> None:
+        self.log_metrics({key: value}, step=step)
+
+    def log_metrics(self, metrics: dict, step: int = 0) -> None:
+        if metrics:
+            self._tracker._put(self.key, "metrics", {
+                "values": {k: float(v) for k, v in metrics.items()},
+                "step": step,
+                "timestamp": _now_ms(),
+            })
+
+    def set_tags(self, tags: dict) -> None:
+        if tags:
+            self._tracker._put(self.key, "tags", {k: str(v) for k, v in tags.items()})
+
+    def log_artifact(self, local_path: str) -> None:
+        self._tracker._put(self.key, "artifact", {"path": os.path.abspath(local_path)})
+
+
+class BufferedTracker:
+    """
+    Non-blocking MLflow logging.
+
+    Runs, params, metrics, tags and artifacts are queued and written by a
+    background thread, which groups what arrives within flush_seconds into
+    log_batch calls per run. A write that keeps failing (e.g. the sqlite
+    store is locked) is retried with backoff, then the operations not yet
+    applied are appended to a JSONL spool (artifacts are copied next to
+    it). Later operations of a spooled run are spooled too, so they stay in
+    order. The spool is replayed when the worker starts and by
+    replay_spool.
+
+    flush blocks until everything queued so far is written or spooled;
+    close flushes and stops the worker, and also runs at interpreter exit.
+    """
+
+    def __init__(
+        self,
+        experiment_id: str = MLFLOW_EXPERIMENT_ID,
+        spool_dir: str = MLFLOW_SPOOL_DIR,
+        tracking_uri: Optional[str] = None,
+        flush_seconds: float = MLFLOW_FLUSH_SECONDS,
+        max_retries: int = MLFLOW_MAX_RETRIES,
+        retry_backoff: float = MLFLOW_RETRY_BACKOFF_SECONDS,
+    ):
+        self.experiment_id = experiment_id
+        self.spool_dir = spool_dir
+        self.spool_path = os.path.join(spool_dir, SPOOL_FILE_NAME)
+        self.tracking_uri = tracking_uri
+        self.flush_seconds = flush_seconds
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+
+        self._queue = queue.Queue()
+        # run key -> {"run_id", "spooled"}; touched by the worker thread only
+        self._runs = {}
+        self._client = None
+        self._thread = None
+        self._lock = threading.Lock()
+        atexit.register(self.close)
+
+    # -------------------------
+    # PRODUCER SIDE
+    # -------------------------
+    @contextmanager
+    def start_run(self, run_name: str, tags: Optional[dict] = None):
+        key = uuid.uuid4().hex
+        self._put(key, "start", {
+            "experiment_id": self.experiment_id,
+            "run_name": run_name,
+            "start_time": _now_ms(),
+        })
+        run = TrackedRun(self, key)
+        run.set_tags(tags)
+
+        status = "FAILED"
+        try:
+            yield run
+            status = "FINISHED"
+        finally:
+            self._put(key, "end", {"status": status, "end_time": _now_ms()})
+
+    def _put(self, run_key: str, kind: str, data: dict) -> None:
+        self._ensure_worker()
+        self._queue.put({"run": run_key, "kind": kind, "data": data})
+
+    def _ensure_worker(self) -> None:
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._worker, name="mlflow-tracker", daemon=True)
+                self._thread.start()
+
+    def flush(self) -> None:
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                return
+        done = threading.Event()
+        self._queue.put((_FLUSH, done))
+        done.wait()
+
+    def close(self) -> None:
+        self.flush()
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is not None and thread.is_alive():
+            self._queue.put((_STOP, None))
+            thread.join()
+
+    # -------------------------
+    # WORKER THREAD
+    # -------------------------
+    def _worker(self) -> None:
+        self._safely(self.replay_spool)
+
+        while True:
+            ops, control = [], None
+            item = self._queue.get()
+            deadline = time.monotonic() + self.flush_seconds
+
+            # Collect a batch until the deadline or a flush / stop request
+            while True:
+                if isinstance(item, tuple):
+                    control = item
+                    break
+                ops.append(item)
+                try:
+                    item = self._queue.get(timeout=max(0.0, deadline - time.monotonic()))
+                except queue.Empty:
+                    break
+
+            if ops:
+                self._safely(self._send, ops)
+            if control is not None:
+                signal, done = control
+                if signal is _STOP:
+                    # Last chance for this process to empty the spool
+                    self._safely(self.replay_spool)
+                    return
+                done.set()
+
+    @staticmethod
+    def _safely(fn, *args) -> None:
+        # The worker must outlive any error, or flush would wait forever
+        try:
+            fn(*args)
+        except Exception as e:
+            logger.error(f"MLflow tracker: {fn.__name__} failed: {e}")
+
+    def _get_client(self) -> MlflowClient:
+        if self._client is None:
+            self._client = MlflowClient(self.tracking_uri)
+        return self._client
+
+    def _send(self, ops: List[dict]) -> None:
+        by_run: Dict[str, List[dict]] = {}
+        for op in ops:
+            by_run.setdefault(op["run"], []).append(op)
+
+        for key, run_ops in by_run.items():
+            state = self._runs.setdefault(key, {"run_id": None, "spooled": False})
+            pending = run_ops if state["spooled"] else self._apply_with_retries(state, run_ops)
+            if pending:
+                state["spooled"] = True
+                self._spool(state, pending)
+
+            if run_ops[-1]["kind"] == "end":
+                del self._runs[key]
+
+    def _apply_with_retries(self, state: dict, ops: List[dict]) -> List[dict]:
+        """Applies ops in order; returns the ones still unapplied after all retries."""
+        for attempt in range(1, self.max_retries + 1):
+            try:
+                applied = 0
+                for group in self._groups(ops):
+                    self._apply(state, group)
+                    applied += len(group)
+                return []
+            except Exception as e:
+                ops = ops[applied:]
+                if attempt == self.max_retries:
+                    logger.warning(
+                        f"MLflow write failed {attempt} times ({e}); spooling {len(ops)} operations to {self.spool_path}"
+                    )
+                    return ops
+                time.sleep(self.retry_backoff * 2 ** (attempt - 1))
+        return ops
+
+    @staticmethod
+    def _groups(ops: List[dict]):
+        # Consecutive params / metrics / tags go out in one log_batch
+        group = []
+        for op in ops:
+            if op["kind"] in ("params", "metrics", "tags"):
+                group.append(op)
+                continue
+            if group:
+                yield group
+                group = []
+            yield [op]
+        if group:
+            yield group
+
+    def _apply(self, state: dict, group: List[dict]) -> None:
+        client = self._get_client()
+        kind, data = group[0]["kind"], group[0]["data"]
+
+        if kind == "start":
+            run = client.create_run(
+                data["experiment_id"], start_time=data["start_time"], run_name=data["run_name"]
+            )
+            state["run_id"] = run.info.run_id
+        elif kind == "artifact":
+            if os.path.exists(data["path"]):
+                client.log_artifact(state["run_id"], data["path"])
+            else:
+                # Retrying cannot bring it back; keep the rest of the run
+                logger.warning(f"Skipping missing MLflow artifact {data['path']}")
+        elif kind == "end":
+            client.set_terminated(state["run_id"], status=data["status"], end_time=data["end_time"])
+        else:
+            params, tags, metrics = {}, {}, []
+            for op in group:
+                if op["kind"] == "params":
+                    params.update(op["data"])
+                elif op["kind"] == "tags":
+                    tags.update(op["data"])
+                else:
+                    d = op["data"]
+                    metrics.extend(Metric(k, v, d["timestamp"], d["step"]) for k, v in d["values"].items())
+
+            params = [Param(k, v) for k, v in params.items()]
+            tags = [RunTag(k, v) for k, v in tags.items()]
+            for chunk in _chunks(params, _MAX_PARAMS_TAGS_PER_BATCH):
+                client.log_batch(state["run_id"], params=chunk)
+            for chunk in _chunks(tags, _MAX_PARAMS_TAGS_PER_BATCH):
+                client.log_batch(state["run_id"], tags=chunk)
+            for chunk in _chunks(metrics, _MAX_METRICS_PER_BATCH):
+                client.log_batch(state["run_id"], metrics=chunk)
+
+    # -------------------------
+    # SPOOL
+    # -------------------------
+    def _spool(self, state: dict, ops: List[dict]) -> None:
+        os.makedirs(self.spool_dir, exist_ok=True)
+        with open(self.spool_path, "a") as f:
+            for op in ops:
+                if op["kind"] == "artifact":
+                    op = {**op, "data": {"path": self._spool_artifact(op)}}
+                f.write(json.dumps({**op, "run_id": state["run_id"]}) + "\n")
+
+    def _spool_artifact(self, op: dict) -> str:
+        # The original file may be replaced or deleted before the replay
+        source = op["data"]["path"]
+        if not os.path.exists(source):
+            logger.warning(f"Artifact {source} no longer exists; spooling its path only")
+            return source
+        target_dir = os.path.join(self.spool_dir, SPOOL_ARTIFACT_DIR_NAME, op["run"], uuid.uuid4().hex[:8])
+        os.makedirs(target_dir, exist_ok=True)
+        target = os.path.join(target_dir, os.path.basename(source))
+        shutil.copy2(source, target)
+        return os.path.abspath(target)
+
+    def replay_spool(self) -> int:
+        """Writes spooled runs to the tracking store; returns the operations replayed."""
+        if not os.path.exists(self.spool_path):
+            return 0
+
+        with open(self.spool_path) as f:
+            lines = [json.loads(line) for line in f if line.strip()]
+
+        by_run: Dict[str, List[dict]] = {}
+        for op in lines:
+            by_run.setdefault(op["run"], []).append(op)
+
+        remaining, replayed = [], 0
+        for key, ops in by_run.items():
+            # run_id of the last spooled op: the run may have been created since
+            state = {"run_id": ops[-1]["run_id"], "spooled": False}
+            try:
+                for group in self._groups(ops):
+                    self._apply(state, group)
+                    replayed += len(group)
+                    ops = ops[len(group):]
+                    for op in ops:
+                        op["run_id"] = state["run_id"]
+            except Exception as e:
+                logger.warning(f"Could not replay spooled MLflow run {key}: {e}")
+                remaining.extend(ops)
+                continue
+            shutil.rmtree(os.path.join(self.spool_dir, SPOOL_ARTIFACT_DIR_NAME, key), ignore_errors=True)
+
+        tmp_path = f"{self.spool_path}.tmp"
+        with open(tmp_path, "w") as f:
+            f.writelines(json.dumps(op) + "\n" for op in remaining)
+        if remaining:
+            os.replace(tmp_path, self.spool_path)
+        else:
+            os.remove(tmp_path)
+            os.remove(self.spool_path)
+
+        if replayed:
+            logger.info(f"Replayed {replayed} spooled MLflow operations")
+        return replayed
+
+
+_TRACKER = None
+_TRACKER_LOCK = threading.Lock()
+
+
+def get_tracker() -> BufferedTracker:
+    """Process-wide tracker shared by the pipeline stages."""
+    global _TRACKER
+    with _TRACKER_LOCK:
+        if _TRACKER is None:
+            _TRACKER = BufferedTracker()
+        return _TRACKER
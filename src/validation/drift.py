@@ -0,0 +1,141 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Tuple
+
+import numpy as np
+import pandas as pd
+from scipy.stats import chi2_contingency, ks_2samp
+
+from src.constants.data_validation import (
+    DRIFT_P_VALUE_THRESHOLD,
+    DRIFT_MAX_CATEGORIES,
+    DRIFT_N_JOBS,
+    DRIFT_PARALLEL_MIN_ROWS,
+)
+
+PSI_EPSILON = 1e-6
+
+
+def ks_test(base: np.ndarray, current: np.ndarray) -> Tuple[float, float]:
+    result = ks_2samp(base, current)
+    return float(result.statistic), float(result.pvalue)
+
+
+def population_stability_index(base_freq: np.ndarray, current_freq: np.ndarray) -> float:
+    base_freq = np.clip(base_freq, PSI_EPSILON, None)
+    current_freq = np.clip(current_freq, PSI_EPSILON, None)
+    return float(np.sum((current_freq - base_freq) * np.log(current_freq / base_freq)))
+
+
+def binned_counts(
+    base: pd.Series, current: pd.Series, max_categories: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Counts per top-k base category plus one trailing "other" bin."""
+    base_counts = base.value_counts()
+    current_counts = current.value_counts()
+
+    top = base_counts.index[:max_categories]
+
+    base_binned = base_counts.reindex(top, fill_value=0).to_numpy()
+    current_binned = current_counts.reindex(top, fill_value=0).to_numpy()
+
+    return (
+        np.append(base_binned, base_counts.sum() - base_binned.sum()),
+        np.append(current_binned, current_counts.sum() - current_binned.sum()),
+    )
+
+
+def frequency_test(
+    base_counts: np.ndarray, current_counts: np.ndarray
+) -> Tuple[float, float, float]:
+    """Chi-square test and PSI on two aligned frequency tables."""
+    psi = population_stability_index(
+        base_counts / max(base_counts.sum(), 1),
+        current_counts / max(current_counts.sum(), 1),
+    )
+
+    table = np.vstack([base_counts, current_counts])
+    table = table[:, table.sum(axis=0) > 0]
+    if table.shape[1] < 2:
+        # Single populated bin on both sides: nothing to compare
+        return 0.0, 1.0, psi
+
+    statistic, p_value, _, _ = chi2_contingency(table)
+    return float(statistic), float(p_value), psi
+
+
+def categorical_test(
+    base: pd.Series, current: pd.Series, max_categories: int
+) -> Tuple[float, float, float]:
+    base_counts, current_counts = binned_counts(base, current, max_categories)
+    return frequency_test(base_counts, current_counts)
+
+
+class DriftDetector:
+    """
+    Typed drift detection driven by schema.yaml.
+
+    Numerical columns get a two-sample KS test, run in a process pool for
+    large frames. Categorical columns get a chi-square test and PSI on
+    top-k binned frequencies. Identifier columns are never tested.
+    """
+
+    def __init__(
+        self,
+        schema_config: dict,
+        threshold: float = DRIFT_P_VALUE_THRESHOLD,
+        max_categories: int = DRIFT_MAX_CATEGORIES,
+        n_jobs: int = DRIFT_N_JOBS,
+    ):
+        id_columns = set(schema_config.get("id_columns", []))
+
+        self.numerical_columns = [
+            c for c in schema_config["numerical_columns"] if c not in id_columns
+        ]
+        self.categorical_columns = [
+            c for c in schema_config["categorical_columns"] if c not in id_columns
+        ]
+        self.threshold = threshold
+        self.max_categories = max_categories
+        self.n_jobs = os.cpu_count() if n_jobs == -1 else n_jobs
+
+    def _numerical_results(self, base_df: pd.DataFrame, current_df: pd.DataFrame) -> dict:
+        pairs = [
+            (base_df[c].dropna().to_numpy(), current_df[c].dropna().to_numpy())
+            for c in self.numerical_columns
+        ]
+
+        if self.n_jobs > 1 and len(pairs) > 1 and len(base_df) >= DRIFT_PARALLEL_MIN_ROWS:
+            workers = min(self.n_jobs, len(pairs))
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(ks_test, *zip(*pairs)))
+        else:
+            results = [ks_test(base, current) for base, current in pairs]
+
+        return dict(zip(self.numerical_columns, results))
+
+    def detect(self, base_df: pd.DataFrame, current_df: pd.DataFrame) -> Tuple[bool, Dict[str, dict]]:
+        report = {}
+
+        for column, (statistic, p_value) in self._numerical_results(base_df, current_df).items():
+            report[column] = {
+                "test_type": "ks",
+                "statistic": statistic,
+                "p_value": p_value,
+                "drift_detected": bool(p_value < self.threshold),
+            }
+
+        for column in self.categorical_columns:
+            statistic, p_value, psi = categorical_test(
+                base_df[column], current_df[column], self.max_categories
+            )
+            report[column] = {
+                "test_type": "chi_square",
+                "statistic": statistic,
+                "p_value": p_value,
+                "psi": psi,
+                "drift_detected": bool(p_value < self.threshold),
+            }
+
+        status = not any(result["drift_detected"] for result in report.values())
+        return status, report
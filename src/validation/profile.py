@@ -0,0 +1,215 @@
+from typing import Dict, Iterable, List, Tuple
+
+import numpy as np
+import pandas as pd
+from scipy.stats import kstwobign
+
+from src.constants.data_validation import (
+    DRIFT_P_VALUE_THRESHOLD,
+    PROFILE_NUM_BINS,
+    PROFILE_TOP_K,
+    PROFILE_SAMPLE_ROWS,
+)
+from src.utils import read_yaml_file, write_yaml_file
+from src.validation.drift import frequency_test, population_stability_index
+
+
+class NumericSketch:
+    """Reference quantile edges of a numeric column and the counts per bin."""
+
+    def __init__(self, edges: List[float], counts: List[int]):
+        self.edges = np.asarray(edges, dtype=np.float64)
+        self.counts = np.asarray(counts, dtype=np.int64)
+
+    @classmethod
+    def from_series(cls, series: pd.Series, num_bins: int, sample_rows: int) -> "NumericSketch":
+        values = series.dropna().to_numpy(dtype=np.float64)
+        if not len(values):
+            # Empty or all-null column: one empty bin, nothing to take quantiles of
+            return cls([], [0])
+
+        sample = values
+        if len(values) > sample_rows:
+            rng = np.random.default_rng(0)
+            sample = rng.choice(values, size=sample_rows, replace=False)
+
+        edges = np.unique(np.quantile(sample, np.linspace(0, 1, num_bins + 1)))
+        sketch = cls(edges, np.zeros(max(len(edges) - 1, 1), dtype=np.int64))
+        sketch.counts = sketch.bin_counts(values)
+        return sketch
+
+    def bin_counts(self, values: np.ndarray) -> np.ndarray:
+        # Interior edges only: values outside the reference range fall
+        # into the first/last bin
+        bins = np.searchsorted(self.edges[1:-1], values, side="right")
+        return np.bincount(bins, minlength=len(self.counts))
+
+    def to_dict(self) -> dict:
+        return {"edges": self.edges.tolist(), "counts": self.counts.tolist()}
+
+
+class CategoricalSketch:
+    """Top-k reference categories with their counts plus an "other" count."""
+
+    def __init__(self, categories: List[str], counts: List[int], other: int):
+        self.categories = list(categories)
+        self.counts = np.append(np.asarray(counts, dtype=np.int64), other)
+        self.index = pd.Index(self.categories)
+
+    @classmethod
+    def from_series(cls, series: pd.Series, top_k: int) -> "CategoricalSketch":
+        value_counts = series.dropna().astype(str).value_counts()
+        top = value_counts.iloc[:top_k]
+        return cls(top.index.tolist(), top.to_numpy(), int(value_counts.sum() - top.sum()))
+
+    def bin_counts(self, values: pd.Series) -> np.ndarray:
+        codes = self.index.get_indexer(values.dropna().astype(str))
+        codes[codes < 0] = len(self.categories)
+        return np.bincount(codes, minlength=len(self.counts))
+
+    def to_dict(self) -> dict:
+        return {
+            "categories": self.categories,
+            "counts": self.counts[:-1].tolist(),
+            "other": int(self.counts[-1]),
+        }
+
+
+class ReferenceProfile:
+    """
+    Compact summary of the accepted training data.
+
+    Later batches or live traffic are compared against the profile instead
+    of the original training files (see ProfileDriftMonitor).
+    """
+
+    def __init__(
+        self,
+        n_rows: int,
+        numeric: Dict[str, NumericSketch],
+        categorical: Dict[str, CategoricalSketch],
+    ):
+        self.n_rows = n_rows
+        self.numeric = numeric
+        self.categorical = categorical
+
+    @classmethod
+    def from_dataframe(
+        cls,
+        df: pd.DataFrame,
+        schema_config: dict,
+        num_bins: int = PROFILE_NUM_BINS,
+        top_k: int = PROFILE_TOP_K,
+        sample_rows: int = PROFILE_SAMPLE_ROWS,
+    ) -> "ReferenceProfile":
+        id_columns = set(schema_config.get("id_columns", []))
+
+        numeric = {
+            col: NumericSketch.from_series(df[col], num_bins, sample_rows)
+            for col in schema_config["numerical_columns"]
+            if col not in id_columns
+        }
+        categorical = {
+            col: CategoricalSketch.from_series(df[col], top_k)
+            for col in schema_config["categorical_columns"]
+            if col not in id_columns
+        }
+        return cls(len(df), numeric, categorical)
+
+    def to_dict(self) -> dict:
+        return {
+            "n_rows": int(self.n_rows),
+            "numeric": {col: s.to_dict() for col, s in self.numeric.items()},
+            "categorical": {col: s.to_dict() for col, s in self.categorical.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, content: dict) -> "ReferenceProfile":
+        return cls(
+            content["n_rows"],
+            {col: NumericSketch(**s) for col, s in content["numeric"].items()},
+            {col: CategoricalSketch(**s) for col, s in content["categorical"].items()},
+        )
+
+    def save(self, file_path: str) -> None:
+        write_yaml_file(file_path, self.to_dict(), replace=True)
+
+    @classmethod
+    def load(cls, file_path: str) -> "ReferenceProfile":
+        return cls.from_dict(read_yaml_file(file_path))
+
+
+class ProfileDriftMonitor:
+    """
+    Streams batches against a ReferenceProfile in constant memory.
+
+    Only per-bin counts are accumulated. Numerical columns are compared
+    with a KS statistic over the reference bin edges (asymptotic p-value),
+    categorical columns with chi-square on the top-k bins. Both report PSI.
+    """
+
+    def __init__(self, profile: ReferenceProfile, threshold: float = DRIFT_P_VALUE_THRESHOLD):
+        self.profile = profile
+        self.threshold = threshold
+        self.n_rows = 0
+        self.counts = {
+            col: np.zeros_like(sketch.counts)
+            for col, sketch in {**profile.numeric, **profile.categorical}.items()
+        }
+
+    def update(self, df: pd.DataFrame) -> None:
+        self.n_rows += len(df)
+
+        for col, sketch in self.profile.numeric.items():
+            values = df[col].dropna().to_numpy(dtype=np.float64)
+            self.counts[col] += sketch.bin_counts(values)
+
+        for col, sketch in self.profile.categorical.items():
+            self.counts[col] += sketch.bin_counts(df[col])
+
+    def update_all(self, chunks: Iterable[pd.DataFrame]) -> "ProfileDriftMonitor":
+        for chunk in chunks:
+            self.update(chunk)
+        return self
+
+    @staticmethod
+    def binned_ks(base_counts: np.ndarray, current_counts: np.ndarray) -> Tuple[float, float]:
+        n, m = base_counts.sum(), current_counts.sum()
+        if n == 0 or m == 0:
+            return 0.0, 1.0
+
+        statistic = float(np.max(np.abs(
+            np.cumsum(base_counts) / n - np.cumsum(current_counts) / m
+        )))
+        p_value = float(kstwobign.sf(statistic * np.sqrt(n * m / (n + m))))
+        return statistic, p_value
+
+    def report(self) -> Tuple[bool, Dict[str, dict]]:
+        report = {}
+
+        for col, sketch in self.profile.numeric.items():
+            current = self.counts[col]
+            statistic, p_value = self.binned_ks(sketch.counts, current)
+            report[col] = {
+                "test_type": "ks_binned",
+                "statistic": statistic,
+                "p_value": p_value,
+                "psi": population_stability_index(
+                    sketch.counts / max(sketch.counts.sum(), 1),
+                    current / max(current.sum(), 1),
+                ),
+                "drift_detected": bool(p_value < self.threshold),
+            }
+
+        for col, sketch in self.profile.categorical.items():
+            statistic, p_value, psi = frequency_test(sketch.counts, self.counts[col])
+            report[col] = {
+                "test_type": "chi_square",
+                "statistic": statistic,
+                "p_value": p_value,
+                "psi": psi,
+                "drift_detected": bool(p_value < self.threshold),
+            }
+
+        status = not any(result["drift_detected"] for result in report.values())
+        return status, report
@@ -0,0 +1,114 @@
+from typing import Dict, List
+
+import numpy as np
+import pandas as pd
+
+from src.validation.schema import TYPE_CHECKS, SchemaValidator
+
+_MISSING = object()
+
+
+def request_schema(schema_config: dict, required_fields: List[str]) -> dict:
+    """
+    Schema of scoring input for SchemaValidator: the target is dropped and
+    fields outside required_fields may be absent, i.e. null in a frame.
+    """
+    target = schema_config.get("target_column")
+    required = set(required_fields)
+    return {
+        "columns": {
+            name: {**spec, "nullable": spec.get("nullable", True) or name not in required}
+            for name, spec in schema_config["columns"].items()
+            if name != target
+        }
+    }
+
+
+class RequestValidator:
+    """
+    Validates serving payloads against schema.yaml.
+
+    Compiled once at startup into a flat tuple of per-field checks, so a
+    single record costs a handful of isinstance/compare operations. Fields
+    the model reads are required; other schema fields are checked only when
+    present. A batch is validated column-wise with SchemaValidator masks in
+    strict mode, which applies the same TYPE_CHECKS as a single record.
+
+    Errors are dicts: {"field", "error", "message"} where error is one of
+    missing, null, type, min, max.
+    """
+
+    def __init__(self, schema_config: dict, required_fields: List[str]):
+        target = schema_config.get("target_column")
+        columns = {
+            name: spec for name, spec in schema_config["columns"].items()
+            if name != target
+        }
+        required = set(required_fields)
+
+        self.fields = tuple(
+            (
+                name,
+                name in required,
+                spec.get("nullable", True),
+                TYPE_CHECKS[spec["type"]],
+                spec["type"],
+                spec.get("min"),
+                spec.get("max"),
+            )
+            for name, spec in columns.items()
+        )
+
+        self.batch_validator = SchemaValidator(
+            request_schema(schema_config, required_fields), strict=True
+        )
+        self.field_names = list(columns)
+
+    @staticmethod
+    def _error(field: str, error: str, message: str) -> dict:
+        return {"field": field, "error": error, "message": message}
+
+    def validate(self, record: dict) -> List[dict]:
+        errors = []
+
+        for name, required, nullable, type_check, kind, min_value, max_value in self.fields:
+            value = record.get(name, _MISSING)
+
+            if value is _MISSING:
+                if required:
+                    errors.append(self._error(name, "missing", "field is required"))
+                continue
+
+            if value is None:
+                if not nullable:
+                    errors.append(self._error(name, "null", "field may not be null"))
+                continue
+
+            if not type_check(value):
+                errors.append(self._error(name, "type", f"expected {kind}, got {value!r}"))
+                continue
+
+            if min_value is not None and value < min_value:
+                errors.append(self._error(name, "min", f"{value!r} is below {min_value}"))
+            elif max_value is not None and value > max_value:
+                errors.append(self._error(name, "max", f"{value!r} is above {max_value}"))
+
+        return errors
+
+    def validate_batch(self, records: List[dict]) -> List[List[dict]]:
+        """Errors per record, checked column-wise over the whole batch."""
+        df = pd.DataFrame.from_records(records).reindex(columns=self.field_names)
+        masks = self.batch_validator.check(df)
+
+        errors: Dict[int, List[dict]] = {}
+        for rule, mask in masks.items():
+            name, error = rule.rsplit(":", 1)
+            for row in np.flatnonzero(mask):
+                if error == "not_null":
+                    error_name = "null" if name in records[row] else "missing"
+                    message = "field is required" if error_name == "missing" else "field may not be null"
+                else:
+                    error_name, message = error, f"violates {error} constraint"
+                errors.setdefault(row, []).append(self._error(name, error_name, message))
+
+        return [errors.get(row, []) for row in range(len(records))]
@@ -0,0 +1,237 @@
+from datetime import datetime
+from typing import Dict, Iterable, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+from src.utils import DataFrameChunkWriter, apply_dtypes, get_schema_dtypes
+
+VIOLATIONS_COLUMN = "violated_rules"
+
+
+def is_number(value) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool) and value == value
+
+
+def is_datetime(value) -> bool:
+    if isinstance(value, datetime):
+        return True
+    try:
+        datetime.fromisoformat(value)
+        return True
+    except (TypeError, ValueError):
+        return False
+
+
+# schema.yaml type -> check of one JSON-decoded value (strict mode)
+TYPE_CHECKS = {
+    "int": lambda v: is_number(v) and float(v).is_integer(),
+    "float": is_number,
+    "object": lambda v: isinstance(v, str),
+    "datetime": is_datetime,
+}
+
+
+class SchemaValidator:
+    """
+    Row-level enforcement of the schema.yaml column constraints.
+
+    The schema is compiled once into per-column checks (nullable, type,
+    min, max). Each column is coerced at most once per chunk and every
+    rule is a vectorized mask, so a chunk is split into valid and invalid
+    rows in a single pass. Works on a whole DataFrame or on a stream of
+    chunks.
+
+    By default values may be text, as read from files: "3" is a valid int.
+    strict=True applies the rules of decoded JSON requests instead, value
+    by value with TYPE_CHECKS: numbers must be numbers (not strings or
+    booleans), text must be str, dates datetimes or ISO strings.
+    """
+
+    def __init__(self, schema_config: dict, strict: bool = False):
+        self.strict = strict
+        self.columns = schema_config["columns"]
+        self.dtypes = get_schema_dtypes({"columns": self.columns})
+        self.rule_names = []
+
+        # column -> (type, nullable, min, max)
+        self.checks = {}
+        for column, spec in self.columns.items():
+            check = (
+                spec["type"],
+                spec.get("nullable", True),
+                spec.get("min"),
+                spec.get("max"),
+            )
+            self.checks[column] = check
+
+            kind, nullable, min_value, max_value = check
+            if not nullable:
+                self.rule_names.append(f"{column}:not_null")
+            if kind != "object" or strict:
+                self.rule_names.append(f"{column}:type")
+            if min_value is not None:
+                self.rule_names.append(f"{column}:min")
+            if max_value is not None:
+                self.rule_names.append(f"{column}:max")
+
+    def missing_columns(self, df: pd.DataFrame) -> List[str]:
+        return [column for column in self.columns if column not in df.columns]
+
+    def _type_mask(self, series: pd.Series, kind: str) -> np.ndarray:
+        """Non-null values of the wrong type for this mode, before coercion."""
+        dtype = series.dtype
+        none_bad = np.zeros(len(series), dtype=bool)
+
+        if pd.api.types.is_bool_dtype(dtype):
+            # Booleans are never numbers, dates or text
+            return series.notna().to_numpy()
+
+        if not self.strict:
+            if dtype == object:
+                return series.map(lambda v: isinstance(v, bool)).to_numpy(dtype=bool)
+            return none_bad
+
+        # Typed columns are, or are not, of the kind as a whole
+        if pd.api.types.is_numeric_dtype(dtype):
+            return none_bad if kind in ("int", "float") else series.notna().to_numpy()
+        if pd.api.types.is_datetime64_any_dtype(dtype):
+            return none_bad if kind == "datetime" else series.notna().to_numpy()
+        if kind == "object" and pd.api.types.is_string_dtype(dtype) and dtype != object:
+            return none_bad
+
+        # Text or mixed values: checked one by one
+        valid = series.map(TYPE_CHECKS[kind], na_action="ignore").fillna(True).astype(bool)
+        return (series.notna() & ~valid).to_numpy()
+
+    def _coerce(self, series: pd.Series, kind: str):
+        """Typed values plus a mask of non-null values that failed the type."""
+        bad = self._type_mask(series, kind)
+        if bad.any():
+            series = series.where(~bad)
+
+        if kind == "datetime":
+            if pd.api.types.is_datetime64_any_dtype(series):
+                return series, bad
+            # Strict values already passed is_datetime; any ISO form parses
+            values = pd.to_datetime(series, errors="coerce", format="ISO8601" if self.strict else None)
+            return values, bad | (values.isna() & series.notna()).to_numpy()
+
+        if pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series):
+            values = series.to_numpy(dtype=np.float64, na_value=np.nan)
+        else:
+            values = pd.to_numeric(series, errors="coerce").to_numpy(dtype=np.float64, na_value=np.nan)
+            bad = bad | (np.isnan(values) & series.notna().to_numpy())
+
+        if kind == "int" and not pd.api.types.is_integer_dtype(series):
+            with np.errstate(invalid="ignore"):
+                bad |= ~np.isnan(values) & (values % 1 != 0)
+
+        return values, bad
+
+    def _check(self, df: pd.DataFrame) -> Tuple[Dict[str, np.ndarray], dict]:
+        """Violation mask per rule, plus the coerced values per typed column."""
+        masks, coerced = {}, {}
+
+        for column, (kind, nullable, min_value, max_value) in self.checks.items():
+            series = df[column]
+
+            if not nullable:
+                masks[f"{column}:not_null"] = series.isna().to_numpy()
+
+            if kind == "object":
+                if self.strict:
+                    masks[f"{column}:type"] = self._type_mask(series, kind)
+                continue
+
+            values, bad_type = self._coerce(series, kind)
+            masks[f"{column}:type"] = bad_type
+            coerced[column] = values
+
+            if kind == "datetime":
+                continue
+
+            with np.errstate(invalid="ignore"):
+                if min_value is not None:
+                    masks[f"{column}:min"] = values < min_value
+                if max_value is not None:
+                    masks[f"{column}:max"] = values > max_value
+
+        return masks, coerced
+
+    def check(self, df: pd.DataFrame) -> Dict[str, np.ndarray]:
+        """Violation mask per rule."""
+        return self._check(df)[0]
+
+    def _cast_valid(self, df: pd.DataFrame, coerced: dict, valid: np.ndarray) -> pd.DataFrame:
+        # Valid rows take the values the checks already parsed, so text
+        # input ("3", "3.0", dates) is typed exactly as it was validated
+        valid_df = df[valid].copy()
+        for column, values in coerced.items():
+            dtype = self.dtypes[column]
+            if str(valid_df[column].dtype) == dtype:
+                continue
+            values = values[valid]
+            if dtype == "int64" and np.isnan(values).any():
+                # Only a nullable int column can still hold nulls here
+                valid_df[column] = pd.array(values, dtype="Float64").astype("Int64")
+            else:
+                valid_df[column] = np.asarray(values).astype(dtype)
+        return apply_dtypes(valid_df, self.dtypes)
+
+    def validate(self, df: pd.DataFrame) -> Tuple[pd.DataFrame, pd.DataFrame, Dict[str, int]]:
+        masks, coerced = self._check(df)
+
+        invalid = np.zeros(len(df), dtype=bool)
+        for mask in masks.values():
+            invalid |= mask
+
+        counts = {rule: int(mask.sum()) for rule, mask in masks.items()}
+
+        valid_df = self._cast_valid(df, coerced, ~invalid)
+
+        invalid_df = df[invalid].copy()
+        if len(invalid_df):
+            rules = np.full(len(invalid_df), "", dtype=object)
+            for rule, mask in masks.items():
+                hit = mask[invalid]
+                rules[hit] = rules[hit] + rule + ";"
+            invalid_df[VIOLATIONS_COLUMN] = rules
+        else:
+            invalid_df[VIOLATIONS_COLUMN] = pd.Series(dtype=object)
+
+        # Offending values may not fit the schema type; keep them as text
+        invalid_df = invalid_df.astype("string")
+
+        return valid_df, invalid_df, counts
+
+    def validate_chunks(
+        self,
+        chunks: Iterable[pd.DataFrame],
+        valid_file_path: str,
+        invalid_file_path: str,
+    ) -> dict:
+        """Streams chunks, appending valid/invalid rows to their files."""
+        counts = dict.fromkeys(self.rule_names, 0)
+        missing = []
+
+        with DataFrameChunkWriter(valid_file_path) as valid_writer, \
+                DataFrameChunkWriter(invalid_file_path) as invalid_writer:
+            for chunk in chunks:
+                missing = self.missing_columns(chunk)
+                if missing:
+                    break
+
+                valid_df, invalid_df, chunk_counts = self.validate(chunk)
+                valid_writer.write(valid_df)
+                invalid_writer.write(invalid_df)
+
+                for rule, count in chunk_counts.items():
+                    counts[rule] += count
+
+        return {
+            "missing_columns": missing,
+            "valid_rows": valid_writer.rows_written,
+            "invalid_rows": invalid_writer.rows_written,
+            "violations": counts,
+        }
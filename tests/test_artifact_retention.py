@@ -0,0 +1,143 @@
+import os
+import time
+
+import pytest
+
+from src.entity.artifact_entity import DataIngestionArtifact
+from src.utils import (
+    mark_run_finished,
+    mark_run_started,
+    prune_artifact_runs,
+    read_promoted_runs,
+    update_latest_artifacts,
+    write_yaml_file,
+)
+from src.utils.cache import StageCache
+
+
+@pytest.fixture
+def root(tmp_path):
+    return tmp_path / "artifacts"
+
+
+def make_run(root, name, links=()):
+    run = root / name
+    (run / "model_trainer").mkdir(parents=True)
+    (run / "model_trainer" / "model.pkl").write_text(name)
+    for stage, target in links:
+        os.symlink(os.path.relpath(target, run), run / stage)
+    return str(run)
+
+
+def promote(root, name):
+    update_latest_artifacts(str(root / name), str(root / "latest"), str(root / "promoted_runs.txt"))
+
+
+def prune(root, keep, cache=None):
+    return prune_artifact_runs(
+        str(root), str(root / "latest"), keep, str(root / "promoted_runs.txt"),
+        stage_cache_dir=str(cache) if cache else None,
+    )
+
+
+def cache_entry(cache, stage, key):
+    entry = cache / stage / key
+    entry.mkdir(parents=True)
+    return entry
+
+
+def test_promotion_swaps_the_latest_symlink(root):
+    make_run(root, "run_1")
+    make_run(root, "run_2")
+
+    promote(root, "run_1")
+    promote(root, "run_2")
+
+    latest = root / "latest"
+    assert latest.is_symlink()
+    assert (latest / "model_trainer" / "model.pkl").read_text() == "run_2"
+    # Relative link, no temporary link left behind
+    assert not os.path.isabs(os.readlink(latest))
+    assert sorted(os.listdir(root)) == ["latest", "promoted_runs.txt", "run_1", "run_2"]
+    assert read_promoted_runs(str(root / "promoted_runs.txt")) == ["run_1", "run_2"]
+
+
+def test_promotion_migrates_a_legacy_latest_directory(root):
+    make_run(root, "latest")
+    make_run(root, "run_1")
+
+    promote(root, "run_1")
+
+    assert (root / "latest").is_symlink()
+    assert (root / "latest" / "model_trainer" / "model.pkl").read_text() == "run_1"
+    assert not [name for name in os.listdir(root) if ".legacy-" in name]
+
+
+def test_pruning_counts_only_promoted_runs(root):
+    for i in range(4):
+        make_run(root, f"run_{i}")
+        promote(root, f"run_{i}")
+    # Benchmark sweep runs are never promoted
+    for i in range(5):
+        make_run(root, f"scale_{i}")
+
+    removed = prune(root, keep=2)
+
+    assert sorted(map(os.path.basename, removed)) == ["run_0", "run_1"]
+    remaining = sorted(name for name in os.listdir(root) if name.startswith(("run_", "scale_")))
+    assert remaining == ["run_2", "run_3"] + [f"scale_{i}" for i in range(5)]
+    assert read_promoted_runs(str(root / "promoted_runs.txt")) == ["run_2", "run_3"]
+
+
+def test_pruning_keeps_the_latest_run_when_promoted_again(root):
+    for name in ["run_a", "run_b", "run_c"]:
+        make_run(root, name)
+        promote(root, name)
+    # Rolled back to run_a: it is the newest promotion now
+    promote(root, "run_a")
+
+    prune(root, keep=1)
+
+    assert os.path.isdir(root / "run_a")
+    assert not os.path.exists(root / "run_b") and not os.path.exists(root / "run_c")
+
+
+def test_pruning_removes_unlinked_cache_entries(root):
+    cache = root / "cache" / "stages"
+    used = cache_entry(cache, "data_ingestion", "used")
+    stale = cache_entry(cache, "data_ingestion", "stale")
+    make_run(root, "run_1", links=[("data_ingestion", used)])
+    promote(root, "run_1")
+
+    removed = prune(root, keep=1, cache=cache)
+
+    assert removed == [str(stale)]
+    assert used.is_dir()
+
+
+def test_pruning_keeps_cache_entries_an_unfinished_run_may_use(root):
+    cache = root / "cache" / "stages"
+    old = cache_entry(cache, "data_ingestion", "old")
+    hit = cache_entry(cache, "data_ingestion", "hit")
+    write_yaml_file(str(hit / StageCache.STAGE_ARTIFACT_FILE_NAME), {
+        "artifact_dir": "artifacts/run_0",
+        "artifact": {"train_file_path": "a", "test_file_path": "b", "artifact_dir": "c"},
+    })
+    past = time.time() - 3600
+    for entry in (old, hit):
+        os.utime(entry, (past, past))
+
+    # A run in progress gets a cache hit on "hit" but has not linked it yet
+    running = make_run(root, "run_running")
+    mark_run_started(running)
+    assert StageCache(str(cache)).load("data_ingestion", "hit", DataIngestionArtifact, running)
+
+    make_run(root, "run_1")
+    promote(root, "run_1")
+    removed = prune(root, keep=1, cache=cache)
+
+    assert removed == [str(old)]
+    assert hit.is_dir()
+
+    mark_run_finished(running)
+    assert prune(root, keep=1, cache=cache) == [str(hit)]
@@ -0,0 +1,65 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.features.encoding import CategoryEncoder
+
+
+@pytest.fixture
+def train():
+    return pd.DataFrame({
+        "Device Used": ["mobile", "desktop", "tablet", "mobile"],
+        "Payment Method": ["card", "paypal", "card", "bank"],
+    })
+
+
+def encoder(train, **kwargs):
+    return CategoryEncoder(["Device Used", "Payment Method"], **kwargs).fit(train)
+
+
+def test_width_is_fixed_by_the_fitted_vocabularies(train):
+    enc = encoder(train)
+
+    # Sorted vocabularies, first category dropped as pd.get_dummies does
+    assert enc.feature_names == [
+        "Device Used_mobile", "Device Used_tablet",
+        "Payment Method_card", "Payment Method_paypal",
+    ]
+    # A frame with one category per column still gets every column
+    single = enc.transform(pd.DataFrame({"Device Used": ["tablet"], "Payment Method": ["card"]}))
+    np.testing.assert_array_equal(single, [[0, 1, 1, 0]])
+    assert enc.transform(train).shape == (4, enc.width) == (4, 4)
+
+
+def test_matches_get_dummies_on_the_training_frame(train):
+    enc = encoder(train)
+    expected = pd.get_dummies(train, columns=enc.columns, drop_first=True, dtype=np.uint8)
+
+    actual = enc.transform_frame(train)
+
+    pd.testing.assert_frame_equal(actual, expected)
+
+
+def test_unknown_and_missing_categories_encode_as_zeros(train):
+    enc = encoder(train)
+    new = pd.DataFrame({"Device Used": ["smartwatch", None], "Payment Method": ["crypto", "card"]})
+
+    np.testing.assert_array_equal(enc.transform(new), [[0, 0, 0, 0], [0, 0, 1, 0]])
+    np.testing.assert_array_equal(enc.transform(new, sparse=True).toarray(), enc.transform(new))
+
+
+def test_unknown_categories_raise_when_asked(train):
+    enc = encoder(train, handle_unknown="error")
+
+    with pytest.raises(ValueError, match="smartwatch"):
+        enc.transform(pd.DataFrame({"Device Used": ["smartwatch"], "Payment Method": ["card"]}))
+    # Missing is not unknown
+    enc.transform(pd.DataFrame({"Device Used": [None], "Payment Method": ["card"]}))
+
+
+def test_round_trips_through_its_saved_state(train):
+    enc = encoder(train)
+    restored = CategoryEncoder.from_dict(enc.to_dict())
+
+    assert restored.feature_names == enc.feature_names
+    np.testing.assert_array_equal(restored.transform(train), enc.transform(train))
@@ -0,0 +1,63 @@
+import numpy as np
+import pytest
+from sklearn.ensemble import HistGradientBoostingClassifier, RandomForestClassifier
+from sklearn.linear_model import LogisticRegression
+from sklearn.pipeline import make_pipeline
+from sklearn.preprocessing import StandardScaler
+
+from src.constants.serving import COMPACT_TOLERANCE
+from src.models.compact import CompactModel, max_proba_difference
+
+
+def dataset(n=300, seed=0):
+    rng = np.random.default_rng(seed)
+    X = rng.normal(size=(n, 4)) * [1.0, 10.0, 100.0, 0.1]
+    y = (X[:, 0] + X[:, 1] / 10 + rng.normal(size=n) > 0.5).astype(int)
+    return X, y
+
+
+def round_trip(model, tmp_path):
+    compact = CompactModel.from_model(model)
+    compact.save(str(tmp_path / "compact"))
+    return CompactModel.load(str(tmp_path / "compact"), mmap_mode="r")
+
+
+def test_forest_round_trip_matches_sklearn(tmp_path):
+    X, y = dataset()
+    # Missing values in training give splits a learned NaN direction
+    X[::17, 2] = np.nan
+    forest = RandomForestClassifier(n_estimators=10, max_depth=6, random_state=0).fit(X, y)
+
+    loaded = round_trip(forest, tmp_path)
+
+    assert loaded.kind == "forest"
+    assert isinstance(loaded.feature, np.memmap)
+    X_new, _ = dataset(n=200, seed=1)
+    X_new[::5, 2] = np.nan
+    assert max_proba_difference(forest, loaded, X_new) <= COMPACT_TOLERANCE
+    np.testing.assert_array_equal(loaded.predict(X_new), forest.predict(X_new))
+
+
+def test_scaled_logistic_round_trip_matches_sklearn(tmp_path):
+    X, y = dataset()
+    pipeline = make_pipeline(StandardScaler(), LogisticRegression()).fit(X, y)
+
+    loaded = round_trip(pipeline, tmp_path)
+
+    assert loaded.kind == "linear"
+    assert isinstance(loaded.coef, np.memmap)
+    X_new, _ = dataset(n=200, seed=1)
+    assert max_proba_difference(pipeline, loaded, X_new) <= COMPACT_TOLERANCE
+    # A single record scores as a one-row batch
+    np.testing.assert_allclose(
+        loaded.predict_proba(X_new[0]), pipeline.predict_proba(X_new[:1]), atol=COMPACT_TOLERANCE
+    )
+
+
+@pytest.mark.parametrize("model", [
+    HistGradientBoostingClassifier(max_iter=5),
+    make_pipeline(LogisticRegression()),
+])
+def test_unsupported_models_are_not_compacted(model):
+    X, y = dataset(n=50)
+    assert CompactModel.from_model(model.fit(X, y)) is None
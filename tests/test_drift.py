@@ -0,0 +1,67 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import src.validation.drift as drift
+from src.validation.drift import DriftDetector
+
+SCHEMA = {
+    "numerical_columns": ["Transaction ID", "Transaction Amount", "Customer Age"],
+    "categorical_columns": ["Device Used"],
+    "id_columns": ["Transaction ID"],
+}
+
+
+def transactions(n=3000, seed=0, amount_shift=0.0, devices=(0.5, 0.3, 0.2)):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        "Transaction ID": np.arange(n) + seed * n,
+        "Transaction Amount": rng.lognormal(4.0, 1.0, n) + amount_shift,
+        "Customer Age": rng.integers(18, 80, n).astype(float),
+        "Device Used": rng.choice(["mobile", "desktop", "tablet"], n, p=list(devices)),
+    })
+
+
+def drifted(report):
+    return sorted(column for column, result in report.items() if result["drift_detected"])
+
+
+def test_same_distribution_passes():
+    status, report = DriftDetector(SCHEMA, n_jobs=1).detect(transactions(), transactions(seed=1))
+
+    assert status
+    # Identifier columns are never tested
+    assert set(report) == {"Transaction Amount", "Customer Age", "Device Used"}
+
+
+def test_shifted_numerical_column_is_flagged():
+    status, report = DriftDetector(SCHEMA, n_jobs=1).detect(
+        transactions(), transactions(seed=1, amount_shift=40.0)
+    )
+
+    assert not status
+    assert drifted(report) == ["Transaction Amount"]
+    assert report["Transaction Amount"]["test_type"] == "ks"
+
+
+def test_shifted_categorical_column_is_flagged():
+    status, report = DriftDetector(SCHEMA, n_jobs=1).detect(
+        transactions(), transactions(seed=1, devices=(0.2, 0.3, 0.5))
+    )
+
+    assert not status
+    assert drifted(report) == ["Device Used"]
+    assert report["Device Used"]["test_type"] == "chi_square"
+    assert report["Device Used"]["psi"] > 0.1
+
+
+def test_parallel_results_match_serial(monkeypatch):
+    base, current = transactions(), transactions(seed=1, amount_shift=40.0)
+    _, serial = DriftDetector(SCHEMA, n_jobs=1).detect(base, current)
+
+    monkeypatch.setattr(drift, "DRIFT_PARALLEL_MIN_ROWS", 0)
+    _, parallel = DriftDetector(SCHEMA, n_jobs=2).detect(base, current)
+
+    assert parallel.keys() == serial.keys()
+    for column in serial:
+        assert parallel[column]["p_value"] == pytest.approx(serial[column]["p_value"])
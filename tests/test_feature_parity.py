@@ -0,0 +1,86 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.constants.data_transformation import FREQUENCY_MIN_COUNT
+from src.features.engineering import FeatureEngineer
+
+TARGET = "Is Fraudulent"
+
+
+def transactions(n, seed):
+    rng = np.random.default_rng(seed)
+    # A few busy locations plus one-off ones below FREQUENCY_MIN_COUNT
+    locations = rng.choice([f"City {i}" for i in range(5)], n).astype(object)
+    locations[:10] = [f"Town {seed}-{i}" for i in range(10)]
+    networks = ["10.0.0", "10.0.1", "192.168.7", f"172.16.{seed}"]
+    addresses = [f"{i} Main St" for i in range(4)]
+    return pd.DataFrame({
+        "Transaction ID": np.arange(n),
+        "Customer ID": rng.integers(1, 50, n),
+        "Transaction Amount": rng.lognormal(4.0, 1.0, n).round(2),
+        "Transaction Date": "2024-02-16 12:00:00",
+        "Payment Method": rng.choice(["credit card", "debit card", "PayPal"], n),
+        "Product Category": rng.choice(["electronics", "clothing", "toys"], n),
+        "Quantity": rng.integers(1, 5, n),
+        "Customer Age": rng.integers(18, 80, n),
+        "Customer Location": locations,
+        "Device Used": rng.choice(["mobile", "desktop", "tablet"], n),
+        "IP Address": [
+            f"{rng.choice(networks)}.{host}" for host in rng.integers(1, 255, n)
+        ],
+        "Shipping Address": rng.choice(addresses, n),
+        "Billing Address": rng.choice(addresses, n),
+        "Account Age Days": rng.integers(0, 365, n),
+        "Transaction Hour": rng.integers(0, 24, n),
+        TARGET: rng.integers(0, 2, n),
+    })
+
+
+@pytest.fixture
+def engineers():
+    trained = FeatureEngineer().fit(transactions(300, seed=0))
+    frame = trained.transform_frame(transactions(300, seed=0))
+    features = [col for col in frame.columns if col != TARGET]
+
+    # Serving rebuilds the engineer from the persisted metadata
+    metadata = {
+        "columns": frame.columns.tolist(),
+        "encoder": trained.encoder.to_dict(),
+        "frequency": trained.frequency.to_dict(),
+    }
+    served = FeatureEngineer.from_metadata(metadata, columns=features)
+    return trained, served, features
+
+
+def parity(engineers, df):
+    trained, served, features = engineers
+    expected = trained.transform_frame(df)[features].to_numpy(dtype=np.float64)
+    records = df.drop(columns=TARGET).to_dict("records")
+    return expected, records
+
+
+def test_frequency_tables_are_bounded_by_min_count(engineers):
+    trained, _, _ = engineers
+
+    for table in trained.frequency.tables.values():
+        assert 0 < len(table)
+        assert min(table.values()) >= FREQUENCY_MIN_COUNT / 300
+    # One-off towns are dropped, the /24 networks are kept as prefixes
+    locations = trained.frequency.tables["Customer_Location_Freq"]
+    assert sorted(locations) == [f"City {i}" for i in range(5)]
+    assert "10.0.0" in trained.frequency.tables["IP_Prefix_Freq"]
+
+
+def test_records_match_the_training_frame(engineers):
+    # Unseen test split: new towns and an unseen network encode as 0
+    df = transactions(200, seed=1)
+    df.loc[::7, "Shipping Address"] = None
+    expected, records = parity(engineers, df)
+    _, served, features = engineers
+
+    np.testing.assert_allclose(served.transform_records(records), expected)
+    np.testing.assert_allclose(served.transform_record(records[0]), expected[0])
+
+    freq = [features.index("Customer_Location_Freq"), features.index("IP_Prefix_Freq")]
+    assert (expected[:, freq] == 0).any() and (expected[:, freq] > 0).any()
@@ -0,0 +1,41 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.components.data_ingestion import hash_split_mask
+
+
+@pytest.fixture
+def keys():
+    # Transaction IDs as read from the raw file
+    return pd.Series([f"txn-{i}" for i in range(5000)], name="Transaction ID")
+
+
+def split(keys, seed=42):
+    return hash_split_mask(keys, test_ratio=0.2, seed=seed)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 1000, 4999])
+def test_split_does_not_depend_on_chunk_size(keys, chunk_size):
+    # Chunks as pandas reads them: a running index, not 0..n per chunk
+    chunked = np.concatenate([
+        split(keys.iloc[start:start + chunk_size])
+        for start in range(0, len(keys), chunk_size)
+    ])
+
+    np.testing.assert_array_equal(chunked, split(keys))
+
+
+def test_row_order_does_not_matter(keys):
+    shuffled = keys.sample(frac=1.0, random_state=0)
+
+    np.testing.assert_array_equal(split(shuffled), split(keys)[shuffled.index])
+
+
+def test_test_share_follows_the_ratio(keys):
+    assert split(keys).mean() == pytest.approx(0.2, abs=0.02)
+
+
+def test_seed_changes_the_split(keys):
+    assert not np.array_equal(split(keys, seed=1), split(keys, seed=2))
+    np.testing.assert_array_equal(split(keys, seed=1), split(keys, seed=1))
@@ -0,0 +1,90 @@
+import numpy as np
+import pytest
+from itertools import combinations
+
+from sklearn.linear_model import LogisticRegression
+
+from src.models.imbalance import BalancedLogisticEnsemble, ChunkedSMOTE
+
+
+def imbalanced(n_majority=200, n_minority=20, dtype=np.float32, seed=0):
+    rng = np.random.default_rng(seed)
+    X = np.vstack([
+        rng.normal(0.0, 1.0, size=(n_majority, 3)),
+        rng.normal(3.0, 1.0, size=(n_minority, 3)),
+    ]).astype(dtype)
+    y = np.r_[np.zeros(n_majority, dtype=int), np.ones(n_minority, dtype=int)]
+    return X, y
+
+
+# -------------------------
+# ChunkedSMOTE
+# -------------------------
+def test_chunked_smote_keeps_float32_and_balances_classes():
+    X, y = imbalanced()
+    X_res, y_res = ChunkedSMOTE(k_neighbors=3, chunk_size=8, random_state=0).fit_resample(X, y)
+
+    assert X_res.dtype == np.float32
+    # Originals first, then 200 - 20 synthetic minority rows
+    np.testing.assert_array_equal(X_res[:len(X)], X)
+    assert len(X_res) == 400
+    assert (y_res == 1).sum() == (y_res == 0).sum() == 200
+
+
+def test_chunked_smote_neighbours_stay_inside_a_chunk():
+    # Minority rows on a parabola (convex position): every synthetic row lies
+    # on the chord of exactly one pair of rows, which tells its two parents
+    xs = np.arange(6, dtype=np.float64)
+    minority = np.column_stack([xs, xs ** 2])
+    X = np.vstack([np.full((30, 2), -50.0), minority])
+    y = np.r_[np.zeros(30, dtype=int), np.ones(6, dtype=int)]
+
+    # Chunks of 2 with k=1: each row's only candidate is its chunk partner
+    X_res, _ = ChunkedSMOTE(k_neighbors=1, chunk_size=2, random_state=0).fit_resample(X, y)
+
+    pairs = set()
+    for row in X_res[len(X):]:
+        if np.isclose(minority, row).all(axis=1).any():
+            continue  # interpolation step of 0 or 1
+        for i, j in combinations(range(len(minority)), 2):
+            a, b = minority[i], minority[j]
+            cross = (b[0] - a[0]) * (row[1] - a[1]) - (b[1] - a[1]) * (row[0] - a[0])
+            if abs(cross) < 1e-6 and min(a[0], b[0]) <= row[0] <= max(a[0], b[0]):
+                pairs.add((i, j))
+
+    # The parent pairs are the 3 chunks: disjoint, covering every row at most once
+    assert pairs
+    used = [row for pair in pairs for row in pair]
+    assert len(used) == len(set(used))
+    assert len(pairs) <= 3
+
+
+# -------------------------
+# BalancedLogisticEnsemble
+# -------------------------
+def test_balanced_ensemble_is_one_linear_model():
+    X, y = imbalanced(dtype=np.float64)
+    ensemble = BalancedLogisticEnsemble(n_estimators=5, random_state=0).fit(X, y)
+
+    probs = ensemble.predict_proba(X)
+    np.testing.assert_allclose(probs.sum(axis=1), 1.0)
+    np.testing.assert_array_equal(ensemble.predict(X), (probs[:, 1] > 0.5).astype(int))
+
+    # The serving export scores identically
+    exported = ensemble.to_logistic()
+    assert isinstance(exported, LogisticRegression)
+    np.testing.assert_allclose(exported.predict_proba(X), probs)
+
+
+def test_balanced_ensemble_finds_the_minority_class():
+    X, y = imbalanced(dtype=np.float32)
+    ensemble = BalancedLogisticEnsemble(n_estimators=3, random_state=0).fit(X, y)
+
+    assert ensemble.coef_.shape == (1, 3)
+    assert (ensemble.predict(X)[y == 1] == 1).mean() > 0.9
+
+
+def test_balanced_ensemble_rejects_multiclass_targets():
+    X, _ = imbalanced(n_majority=10, n_minority=10)
+    with pytest.raises(ValueError):
+        BalancedLogisticEnsemble().fit(X, np.arange(20) % 3)
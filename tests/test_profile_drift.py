@@ -0,0 +1,88 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.validation.profile import ProfileDriftMonitor, ReferenceProfile
+
+SCHEMA = {
+    "numerical_columns": ["Transaction ID", "Transaction Amount", "Customer Age"],
+    "categorical_columns": ["Device Used"],
+    "id_columns": ["Transaction ID"],
+}
+
+
+def transactions(n=3000, seed=0, amount_shift=0.0, devices=(0.5, 0.3, 0.2)):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        "Transaction ID": np.arange(n) + seed * n,
+        "Transaction Amount": rng.lognormal(4.0, 1.0, n) + amount_shift,
+        "Customer Age": rng.integers(18, 80, n).astype(float),
+        "Device Used": rng.choice(["mobile", "desktop", "tablet"], n, p=list(devices)),
+    })
+
+
+def chunks(df, size=700):
+    return (df.iloc[start:start + size] for start in range(0, len(df), size))
+
+
+@pytest.fixture
+def profile(tmp_path):
+    # As validation persists it and monitoring reads it back
+    path = str(tmp_path / "reference_profile.yaml")
+    ReferenceProfile.from_dataframe(transactions(), SCHEMA).save(path)
+    return ReferenceProfile.load(path)
+
+
+def drifted(report):
+    return sorted(column for column, result in report.items() if result["drift_detected"])
+
+
+def test_profile_keeps_only_bin_counts(profile):
+    assert profile.n_rows == 3000
+    assert set(profile.numeric) == {"Transaction Amount", "Customer Age"}
+    assert profile.numeric["Transaction Amount"].counts.sum() == 3000
+    assert profile.categorical["Device Used"].counts.sum() == 3000
+
+
+def test_same_distribution_passes(profile):
+    status, report = ProfileDriftMonitor(profile).update_all(chunks(transactions(seed=1))).report()
+
+    assert status
+    assert drifted(report) == []
+
+
+def test_shifted_numerical_column_is_flagged(profile):
+    monitor = ProfileDriftMonitor(profile).update_all(chunks(transactions(seed=1, amount_shift=40.0)))
+    status, report = monitor.report()
+
+    assert not status
+    assert drifted(report) == ["Transaction Amount"]
+    assert report["Transaction Amount"]["test_type"] == "ks_binned"
+
+
+def test_shifted_categorical_column_is_flagged(profile):
+    current = transactions(seed=1, devices=(0.2, 0.3, 0.5))
+    status, report = ProfileDriftMonitor(profile).update_all(chunks(current)).report()
+
+    assert not status
+    assert drifted(report) == ["Device Used"]
+
+
+def test_counts_do_not_depend_on_chunking(profile):
+    current = transactions(seed=1, amount_shift=40.0)
+    whole = ProfileDriftMonitor(profile).update_all([current])
+    chunked = ProfileDriftMonitor(profile).update_all(chunks(current, size=97))
+
+    assert chunked.n_rows == whole.n_rows == 3000
+    for column in whole.counts:
+        np.testing.assert_array_equal(chunked.counts[column], whole.counts[column])
+
+
+def test_empty_numeric_column_is_not_drift():
+    reference = transactions()
+    reference["Customer Age"] = np.nan
+    profile = ReferenceProfile.from_dataframe(reference, SCHEMA)
+
+    _, report = ProfileDriftMonitor(profile).update_all([transactions(seed=1)]).report()
+
+    assert not report["Customer Age"]["drift_detected"]
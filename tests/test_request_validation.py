@@ -0,0 +1,69 @@
+import pytest
+
+from src.constants.training_pipeline import SCHEMA_FILE_PATH
+from src.utils import read_yaml_file
+from src.validation.request import RequestValidator
+
+VALID_RECORD = {
+    "Transaction ID": 1,
+    "Customer ID": 1418,
+    "Transaction Amount": 484.83,
+    "Transaction Date": "2024-02-16 05:56:50",
+    "Payment Method": "credit card",
+    "Product Category": "toys",
+    "Quantity": 5,
+    "Customer Age": 49,
+    "Customer Location": "City31",
+    "Device Used": "tablet",
+    "IP Address": "112.192.23.9",
+    "Shipping Address": "addr 3089",
+    "Billing Address": "addr 3089",
+    "Account Age Days": 122,
+    "Transaction Hour": 2,
+}
+
+BAD_FIELDS = [
+    {"Quantity": "3"},
+    {"Quantity": True},
+    {"Quantity": 2.5},
+    {"Quantity": 0},
+    {"Quantity": None},
+    {"Transaction Amount": "12.5"},
+    {"Customer Age": False},
+    {"Customer Age": 101},
+    {"Device Used": 5},
+    {"Payment Method": ["card"]},
+    {"Transaction Date": "yesterday"},
+    {"Transaction Date": 1700000000},
+]
+
+
+@pytest.fixture(scope="module")
+def validator():
+    return RequestValidator(read_yaml_file(SCHEMA_FILE_PATH), required_fields=list(VALID_RECORD))
+
+
+def error_kinds(errors):
+    return sorted((e["field"], e["error"]) for e in errors)
+
+
+def test_valid_record_passes_both_paths(validator):
+    assert validator.validate(VALID_RECORD) == []
+    assert validator.validate_batch([VALID_RECORD, dict(VALID_RECORD)]) == [[], []]
+
+
+@pytest.mark.parametrize("bad", BAD_FIELDS, ids=repr)
+def test_batch_matches_single_record(validator, bad):
+    record = {**VALID_RECORD, **bad}
+    single = error_kinds(validator.validate(record))
+    assert single, f"{bad} should be rejected"
+
+    # Alone, and mixed with valid records (typed vs object columns)
+    assert error_kinds(validator.validate_batch([record])[0]) == single
+    batch = validator.validate_batch([VALID_RECORD, record, VALID_RECORD])
+    assert [error_kinds(errors) for errors in batch] == [[], single, []]
+
+
+def test_missing_field_matches(validator):
+    record = {k: v for k, v in VALID_RECORD.items() if k != "Quantity"}
+    assert error_kinds(validator.validate_batch([record])[0]) == error_kinds(validator.validate(record))
@@ -0,0 +1,134 @@
+import dataclasses
+import os
+import shutil
+
+import pytest
+
+import src.pipeline.training_pipeline as training_pipeline
+from src.constants import model_trainer as model_trainer_constants
+from src.constants.training_pipeline import SCHEMA_FILE_PATH
+from src.entity.artifact_entity import (
+    DataIngestionArtifact,
+    DataTransformationArtifact,
+    DataValidationArtifact,
+    ModelEvaluationArtifact,
+    ModelTrainerArtifact,
+)
+from src.pipeline.training_pipeline import (
+    STAGE_DEPENDENCIES,
+    STAGE_UNKEYED_CONSTANTS,
+    TrainingPipeline,
+)
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+STAGES = {
+    "data_ingestion": ("DataIngestion", "initiate_data_ingestion", DataIngestionArtifact),
+    "data_validation": ("DataValidation", "initiate_data_validation", DataValidationArtifact),
+    "data_transformation": (
+        "DataTransformation", "initiate_data_transformation", DataTransformationArtifact
+    ),
+    "model_trainer": ("ModelTrainer", "initiate_model_training", ModelTrainerArtifact),
+    "model_evaluation": ("ModelEvaluation", "initiate_model_evaluation", ModelEvaluationArtifact),
+}
+
+
+def upper_case_names(module):
+    return {name for name in vars(module) if name.isupper()}
+
+
+@pytest.mark.parametrize("stage", list(STAGE_DEPENDENCIES))
+def test_every_stage_constant_is_keyed_or_excluded(stage):
+    constants, keyed, _ = STAGE_DEPENDENCIES[stage]
+    unkeyed = STAGE_UNKEYED_CONSTANTS[stage]
+
+    assert not set(keyed) & unkeyed
+    assert upper_case_names(constants) == set(keyed) | unkeyed
+
+
+def fake_stage(stage, method, artifact_cls, ran):
+    # Writes one file into its stage dir and returns an artifact
+    # pointing into it, standing in for the real component
+    class Stage:
+        def __init__(self, *args, **kwargs):
+            self.config = next(
+                value for value in (*args, *kwargs.values())
+                if type(value).__name__.endswith("Config")
+            )
+
+        def run(self):
+            ran.append(stage)
+            stage_dir = getattr(self.config, f"{stage}_dir")
+            os.makedirs(stage_dir, exist_ok=True)
+            with open(os.path.join(stage_dir, "output.txt"), "w") as f:
+                f.write(stage)
+
+            fields = {}
+            for field in dataclasses.fields(artifact_cls):
+                if field.type is bool:
+                    fields[field.name] = True
+                elif field.type is float:
+                    fields[field.name] = 0.5
+                else:
+                    fields[field.name] = os.path.join(stage_dir, field.name)
+            return artifact_cls(**fields)
+
+    setattr(Stage, method, Stage.run)
+    return Stage
+
+
+@pytest.fixture
+def ran(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    shutil.copytree(
+        os.path.join(REPO_ROOT, os.path.dirname(SCHEMA_FILE_PATH)),
+        os.path.dirname(SCHEMA_FILE_PATH),
+    )
+    with open("raw.csv", "w") as f:
+        f.write("Transaction ID,Is Fraudulent\n1,0\n")
+
+    ran = []
+    for stage, (class_name, method, artifact_cls) in STAGES.items():
+        monkeypatch.setattr(
+            training_pipeline, class_name, fake_stage(stage, method, artifact_cls, ran)
+        )
+    monkeypatch.setattr(TrainingPipeline, "save_profile", lambda self: {})
+    return ran
+
+
+def run(ran, timestamp):
+    del ran[:]
+    TrainingPipeline(
+        raw_data_path="raw.csv", timestamp=timestamp, promote=False, use_cache=True
+    ).run_pipeline()
+    return list(ran)
+
+
+def test_unchanged_inputs_hit_every_stage(ran):
+    assert run(ran, "run_1") == list(STAGES)
+    assert run(ran, "run_2") == []
+    assert os.path.islink(os.path.join("artifacts", "run_2", "model_trainer"))
+
+
+def test_trainer_constant_only_reruns_training_and_evaluation(ran, monkeypatch):
+    run(ran, "run_1")
+
+    monkeypatch.setattr(
+        model_trainer_constants,
+        "SEARCH_N_CANDIDATES",
+        model_trainer_constants.SEARCH_N_CANDIDATES + 1,
+    )
+
+    assert run(ran, "run_2") == ["model_trainer", "model_evaluation"]
+
+
+def test_unkeyed_constant_keeps_every_stage(ran, monkeypatch):
+    run(ran, "run_1")
+
+    monkeypatch.setattr(
+        model_trainer_constants,
+        "MODEL_TRAINER_N_JOBS",
+        model_trainer_constants.MODEL_TRAINER_N_JOBS + 1,
+    )
+
+    assert run(ran, "run_2") == []
@@ -0,0 +1,32 @@
+import numpy as np
+
+from sklearn.metrics import fbeta_score, precision_recall_curve
+
+from src.components.model_evaluation import threshold_curve
+
+
+def test_curve_matches_sklearn_with_tied_probabilities():
+    rng = np.random.default_rng(0)
+    y_true = rng.integers(0, 2, size=500)
+    # Two decimals: many thresholds are shared by several rows
+    probs = np.round(rng.random(500) * 0.6 + y_true * 0.3, 2)
+
+    curve = threshold_curve(y_true, probs, beta=2)
+    precision, recall, thresholds = precision_recall_curve(y_true, probs)
+
+    # sklearn: ascending thresholds, with a final (precision 1, recall 0) point
+    order = np.argsort(curve["threshold"])
+    np.testing.assert_allclose(curve["threshold"][order], thresholds)
+    np.testing.assert_allclose(curve["precision"][order], precision[:-1])
+    np.testing.assert_allclose(curve["recall"][order], recall[:-1])
+
+    for i in rng.choice(len(thresholds), size=10, replace=False):
+        expected = fbeta_score(y_true, probs >= curve["threshold"][i], beta=2)
+        assert np.isclose(curve["f_beta"][i], expected)
+
+
+def test_curve_of_empty_input_is_empty():
+    curve = threshold_curve(np.array([], dtype=int), np.array([], dtype=float))
+
+    assert set(curve) == {"threshold", "precision", "recall", "f_beta"}
+    assert all(values.size == 0 for values in curve.values())
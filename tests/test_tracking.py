@@ -0,0 +1,142 @@
+import os
+from types import SimpleNamespace
+
+import pytest
+
+import src.utils.tracking as tracking
+from src.utils.tracking import BufferedTracker
+
+
+class FakeClient:
+    """MlflowClient stand-in; methods in `failing` raise as if the store were down."""
+
+    def __init__(self):
+        self.failing = set()
+        self.runs = {}
+
+    def _call(self, method):
+        if method in self.failing or "*" in self.failing:
+            raise ConnectionError("tracking store unavailable")
+
+    def create_run(self, experiment_id, start_time=None, run_name=None):
+        self._call("create_run")
+        run_id = f"run-{len(self.runs)}"
+        self.runs[run_id] = {
+            "name": run_name, "params": {}, "metrics": {}, "tags": {},
+            "artifacts": {}, "status": None,
+        }
+        return SimpleNamespace(info=SimpleNamespace(run_id=run_id))
+
+    def log_batch(self, run_id, metrics=(), params=(), tags=()):
+        self._call("log_batch")
+        run = self.runs[run_id]
+        run["params"].update((p.key, p.value) for p in params)
+        run["tags"].update((t.key, t.value) for t in tags)
+        run["metrics"].update((m.key, m.value) for m in metrics)
+
+    def log_artifact(self, run_id, local_path):
+        self._call("log_artifact")
+        with open(local_path) as f:
+            self.runs[run_id]["artifacts"][os.path.basename(local_path)] = f.read()
+
+    def set_terminated(self, run_id, status=None, end_time=None):
+        self._call("set_terminated")
+        self.runs[run_id]["status"] = status
+
+
+@pytest.fixture
+def client(monkeypatch):
+    client = FakeClient()
+    monkeypatch.setattr(tracking, "MlflowClient", lambda tracking_uri=None: client)
+    return client
+
+
+@pytest.fixture
+def make_tracker(tmp_path):
+    trackers = []
+
+    def make():
+        tracker = BufferedTracker(
+            spool_dir=str(tmp_path / "spool"), flush_seconds=0.0, max_retries=2, retry_backoff=0.0
+        )
+        trackers.append(tracker)
+        return tracker
+
+    yield make
+    for tracker in trackers:
+        tracker.close()
+
+
+def log_training_run(tracker, tmp_path):
+    report = tmp_path / "metrics.yaml"
+    report.write_text("f2: 0.8\n")
+    with tracker.start_run("model_trainer") as run:
+        run.log_params({"n_estimators": 100})
+        run.log_metrics({"f2": 0.8, "recall": 0.9})
+        run.log_artifact(str(report))
+    tracker.flush()
+    # Gone before the replay: the spool keeps its own copy
+    report.unlink()
+
+
+def test_logged_run_reaches_the_store(client, make_tracker, tmp_path):
+    tracker = make_tracker()
+    log_training_run(tracker, tmp_path)
+
+    [run] = client.runs.values()
+    assert run["params"] == {"n_estimators": "100"}
+    assert run["metrics"] == {"f2": 0.8, "recall": 0.9}
+    assert run["status"] == "FINISHED"
+    assert not os.path.exists(tracker.spool_path)
+
+
+def test_run_is_spooled_while_the_store_is_down_and_replayed(client, make_tracker, tmp_path):
+    client.failing.add("*")
+    tracker = make_tracker()
+    log_training_run(tracker, tmp_path)
+
+    assert client.runs == {}
+    assert os.path.exists(tracker.spool_path)
+
+    client.failing.clear()
+    assert tracker.replay_spool() > 0
+
+    [run] = client.runs.values()
+    assert run["name"] == "model_trainer"
+    assert run["metrics"] == {"f2": 0.8, "recall": 0.9}
+    assert run["artifacts"] == {"metrics.yaml": "f2: 0.8\n"}
+    assert run["status"] == "FINISHED"
+    assert not os.path.exists(tracker.spool_path)
+    assert not os.listdir(os.path.join(tracker.spool_dir, tracking.SPOOL_ARTIFACT_DIR_NAME))
+
+
+def test_partly_written_run_is_completed_not_duplicated(client, make_tracker, tmp_path):
+    # The run is created, then the store goes away mid-run
+    client.failing.add("log_batch")
+    log_training_run(make_tracker(), tmp_path)
+    assert [run["status"] for run in client.runs.values()] == [None]
+
+    client.failing.clear()
+    # A later process replays the spool when its worker starts
+    tracker = make_tracker()
+    with tracker.start_run("pipeline_profile"):
+        pass
+    tracker.flush()
+
+    runs = {run["name"]: run for run in client.runs.values()}
+    assert len(client.runs) == 2
+    assert runs["model_trainer"]["params"] == {"n_estimators": "100"}
+    assert runs["model_trainer"]["status"] == "FINISHED"
+    assert runs["pipeline_profile"]["status"] == "FINISHED"
+
+
+def test_failed_replay_keeps_the_spool(client, make_tracker, tmp_path):
+    client.failing.add("*")
+    tracker = make_tracker()
+    log_training_run(tracker, tmp_path)
+    with open(tracker.spool_path) as f:
+        spooled = f.read()
+
+    assert tracker.replay_spool() == 0
+    with open(tracker.spool_path) as f:
+        assert f.read() == spooled
@@ -0,0 +1,136 @@
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.features.velocity import VelocityEngine, VelocityStore
+
+
+def record(timestamp, customer=1, ip="10.0.0.1", amount=10.0, device="mobile", txn_id=None):
+    return {
+        "Transaction ID": txn_id,
+        "Customer ID": customer,
+        "IP Address": ip,
+        "Transaction Date": timestamp,
+        "Transaction Amount": amount,
+        "Device Used": device,
+    }
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = VelocityStore(str(tmp_path / "velocity.sqlite"))
+    yield store
+    store.close()
+
+
+def score(engine, records):
+    # As serving does: features, then recorded once the block succeeds
+    with engine.recording(records) as features:
+        return features
+
+
+def counts(features, window):
+    return [row[f"Customer_Txn_Count_{window}"] for row in features]
+
+
+def test_out_of_order_requests_only_count_earlier_events(store):
+    engine = VelocityEngine(store=store)
+    features = [
+        score(engine, [record(timestamp)])[0]
+        for timestamp in ["2024-02-16 12:00:00", "2024-02-16 10:00:00", "2024-02-16 12:30:00"]
+    ]
+
+    # 10:00 does not see 12:00; 12:30 sees 12:00 in 1h and both in 24h
+    assert counts(features, "1h") == [0, 0, 1]
+    assert counts(features, "24h") == [0, 0, 2]
+    assert features[2]["Customer_Amount_Sum_24h"] == pytest.approx(20.0)
+
+
+def test_late_request_does_not_expire_later_events(store):
+    engine = VelocityEngine(store=store)
+    score(engine, [record("2024-02-16 12:00:00")])
+    # A day-old request must not drop the 12:00 event from the stored state
+    score(engine, [record("2024-02-15 08:00:00")])
+
+    features = VelocityEngine(store=store).lookup([record("2024-02-16 12:10:00")])
+    assert counts(features, "1h") == [1]
+
+
+def test_serving_matches_backfill_including_same_second_events(store):
+    records = [
+        record("2024-02-16 11:30:00", amount=3.0, device="desktop"),
+        record("2024-02-16 12:00:00", amount=5.0, device="mobile"),
+        record("2024-02-16 12:00:00", amount=7.0, device="tablet"),
+        record("2024-02-16 12:20:00", amount=1.0, device="mobile"),
+    ]
+
+    backfill = VelocityEngine()
+    expected = backfill.backfill(pd.DataFrame(records))
+
+    served = score(VelocityEngine(store=store), records)
+    actual = [[row[name] for name in backfill.feature_names] for row in served]
+
+    np.testing.assert_allclose(actual, expected)
+    # Same-second transactions do not count each other
+    assert counts(served, "1h") == [0, 1, 1, 3]
+
+
+def test_lookup_alone_does_not_record(store):
+    engine = VelocityEngine(store=store)
+    engine.lookup([record("2024-02-16 12:00:00")])
+
+    assert len(store) == 0
+    assert counts(engine.lookup([record("2024-02-16 12:10:00")]), "1h") == [0]
+
+
+def test_retried_transaction_is_recorded_once(store):
+    engine = VelocityEngine(store=store)
+    first = score(engine, [record("2024-02-16 12:00:00", txn_id=7)])
+    retry = score(engine, [record("2024-02-16 12:00:00", txn_id=7.0)])
+
+    assert retry == first
+    assert counts(engine.lookup([record("2024-02-16 12:10:00")]), "1h") == [1]
+
+
+def test_failed_scoring_records_nothing(store):
+    engine = VelocityEngine(store=store)
+    with pytest.raises(RuntimeError):
+        with engine.recording([record("2024-02-16 12:00:00")]):
+            raise RuntimeError("model failed")
+
+    assert len(store) == 0
+
+
+def test_concurrent_workers_see_each_others_events(tmp_path):
+    # Two serving workers: separate connections to the same store file
+    path = str(tmp_path / "velocity.sqlite")
+    stores = [VelocityStore(path), VelocityStore(path)]
+    first_inside = threading.Event()
+    results = {}
+
+    def first():
+        with VelocityEngine(store=stores[0]).recording([record("2024-02-16 12:00:00")]) as features:
+            first_inside.set()
+            # Still scoring while the second request arrives
+            time.sleep(0.3)
+            results["first"] = features
+
+    def second():
+        first_inside.wait()
+        results["second"] = score(VelocityEngine(store=stores[1]), [record("2024-02-16 12:00:30")])
+
+    threads = [threading.Thread(target=first), threading.Thread(target=second)]
+    try:
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        for s in stores:
+            s.close()
+
+    assert counts(results["first"], "1h") == [0]
+    assert counts(results["second"], "1h") == [1]